@@ -109,21 +109,105 @@ d = { 'settings': { 'branch': 'master',
                                                                                                                  'geowrangler/distance_zonal_stats.py'),
                                                   'geowrangler.distance_zonal_stats.create_distance_zonal_stats': ( 'distance_zonal_stats.html#create_distance_zonal_stats',
                                                                                                                     'geowrangler/distance_zonal_stats.py')},
-            'geowrangler.gridding_utils.polygon_fill': { 'geowrangler.gridding_utils.polygon_fill.fast_polygon_fill': ( 'polygon_fill.html#fast_polygon_fill',
+            'geowrangler.gridding_utils.polygon_fill': { 'geowrangler.gridding_utils.polygon_fill._centroid_scanline_spans': ( 'polygon_fill.html#_centroid_scanline_spans',
+                                                                                                                               'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._count_crossings': ( 'polygon_fill.html#_count_crossings',
+                                                                                                                       'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._expand_span_arrays': ( 'polygon_fill.html#_expand_span_arrays',
+                                                                                                                          'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._explode_geometries': ( 'polygon_fill.html#_explode_geometries',
+                                                                                                                          'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._group_vertices': ( 'polygon_fill.html#_group_vertices',
+                                                                                                                      'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._numpy_polygon_fill': ( 'polygon_fill.html#_numpy_polygon_fill',
+                                                                                                                          'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._pair_intersections': ( 'polygon_fill.html#_pair_intersections',
+                                                                                                                          'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._partition_vertices': ( 'polygon_fill.html#_partition_vertices',
+                                                                                                                          'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._pixels_df': ( 'polygon_fill.html#_pixels_df',
+                                                                                                                 'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._polygon_edges': ( 'polygon_fill.html#_polygon_edges',
+                                                                                                                     'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._python_polygon_fill': ( 'polygon_fill.html#_python_polygon_fill',
+                                                                                                                           'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._ragged_arange': ( 'polygon_fill.html#_ragged_arange',
+                                                                                                                     'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._row_major_keys': ( 'polygon_fill.html#_row_major_keys',
+                                                                                                                      'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._scanline_spans': ( 'polygon_fill.html#_scanline_spans',
+                                                                                                                      'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._segment_pixels': ( 'polygon_fill.html#_segment_pixels',
+                                                                                                                      'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._spans_df': ( 'polygon_fill.html#_spans_df',
+                                                                                                                'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._unpack_pixels_df': ( 'polygon_fill.html#_unpack_pixels_df',
+                                                                                                                        'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill._vertex_ring_ids': ( 'polygon_fill.html#_vertex_ring_ids',
+                                                                                                                       'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.boundary_pixels': ( 'polygon_fill.html#boundary_pixels',
+                                                                                                                      'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.centroid_polygon_fill': ( 'polygon_fill.html#centroid_polygon_fill',
+                                                                                                                            'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.expand_spans': ( 'polygon_fill.html#expand_spans',
+                                                                                                                   'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.explode_polygons': ( 'polygon_fill.html#explode_polygons',
+                                                                                                                       'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.fast_polygon_fill': ( 'polygon_fill.html#fast_polygon_fill',
                                                                                                                         'geowrangler/gridding_utils/polygon_fill.py'),
                                                          'geowrangler.gridding_utils.polygon_fill.interpolate_x': ( 'polygon_fill.html#interpolate_x',
                                                                                                                     'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.iter_expand_spans': ( 'polygon_fill.html#iter_expand_spans',
+                                                                                                                        'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.join_spans': ( 'polygon_fill.html#join_spans',
+                                                                                                                 'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.line_pixels': ( 'polygon_fill.html#line_pixels',
+                                                                                                                  'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.lines_to_vertices': ( 'polygon_fill.html#lines_to_vertices',
+                                                                                                                        'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.merge_spans': ( 'polygon_fill.html#merge_spans',
+                                                                                                                  'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.offset_ring_vertices': ( 'polygon_fill.html#offset_ring_vertices',
+                                                                                                                           'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.pack_pixel_keys': ( 'polygon_fill.html#pack_pixel_keys',
+                                                                                                                      'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.pixels_to_spans': ( 'polygon_fill.html#pixels_to_spans',
+                                                                                                                      'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.point_pixels': ( 'polygon_fill.html#point_pixels',
+                                                                                                                   'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.points_to_vertices': ( 'polygon_fill.html#points_to_vertices',
+                                                                                                                         'geowrangler/gridding_utils/polygon_fill.py'),
                                                          'geowrangler.gridding_utils.polygon_fill.polygons_to_vertices': ( 'polygon_fill.html#polygons_to_vertices',
                                                                                                                            'geowrangler/gridding_utils/polygon_fill.py'),
                                                          'geowrangler.gridding_utils.polygon_fill.scanline_fill': ( 'polygon_fill.html#scanline_fill',
                                                                                                                     'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.unpack_pixel_keys': ( 'polygon_fill.html#unpack_pixel_keys',
+                                                                                                                        'geowrangler/gridding_utils/polygon_fill.py'),
                                                          'geowrangler.gridding_utils.polygon_fill.voxel_traversal_2d': ( 'polygon_fill.html#voxel_traversal_2d',
                                                                                                                          'geowrangler/gridding_utils/polygon_fill.py'),
+                                                         'geowrangler.gridding_utils.polygon_fill.voxel_traversal_2d_vectorized': ( 'polygon_fill.html#voxel_traversal_2d_vectorized',
+                                                                                                                                    'geowrangler/gridding_utils/polygon_fill.py'),
                                                          'geowrangler.gridding_utils.polygon_fill.voxel_traversal_scanline_fill': ( 'polygon_fill.html#voxel_traversal_scanline_fill',
                                                                                                                                     'geowrangler/gridding_utils/polygon_fill.py')},
-            'geowrangler.grids': { 'geowrangler.grids.BingTileGridGenerator': ('grids.html#bingtilegridgenerator', 'geowrangler/grids.py'),
+            'geowrangler.grids': { 'geowrangler.grids.AdaptiveBingTileGridGenerator': ( 'grids.html#adaptivebingtilegridgenerator',
+                                                                                        'geowrangler/grids.py'),
+                                   'geowrangler.grids.AdaptiveBingTileGridGenerator.__init__': ( 'grids.html#adaptivebingtilegridgenerator.__init__',
+                                                                                                 'geowrangler/grids.py'),
+                                   'geowrangler.grids.AdaptiveBingTileGridGenerator._get_data_quadkey_ints': ( 'grids.html#adaptivebingtilegridgenerator._get_data_quadkey_ints',
+                                                                                                               'geowrangler/grids.py'),
+                                   'geowrangler.grids.AdaptiveBingTileGridGenerator.generate_grid': ( 'grids.html#adaptivebingtilegridgenerator.generate_grid',
+                                                                                                      'geowrangler/grids.py'),
+                                   'geowrangler.grids.BingTileGridGenerator': ('grids.html#bingtilegridgenerator', 'geowrangler/grids.py'),
                                    'geowrangler.grids.BingTileGridGenerator.__init__': ( 'grids.html#bingtilegridgenerator.__init__',
                                                                                          'geowrangler/grids.py'),
+                                   'geowrangler.grids.BingTileGridGenerator._get_tile_lattice': ( 'grids.html#bingtilegridgenerator._get_tile_lattice',
+                                                                                                  'geowrangler/grids.py'),
+                                   'geowrangler.grids.BingTileGridGenerator._get_tiles_numpy': ( 'grids.html#bingtilegridgenerator._get_tiles_numpy',
+                                                                                                 'geowrangler/grids.py'),
+                                   'geowrangler.grids.BingTileGridGenerator._get_tiles_python': ( 'grids.html#bingtilegridgenerator._get_tiles_python',
+                                                                                                  'geowrangler/grids.py'),
+                                   'geowrangler.grids.BingTileGridGenerator._tiles_to_polygons': ( 'grids.html#bingtilegridgenerator._tiles_to_polygons',
+                                                                                                   'geowrangler/grids.py'),
                                    'geowrangler.grids.BingTileGridGenerator.generate_grid': ( 'grids.html#bingtilegridgenerator.generate_grid',
                                                                                               'geowrangler/grids.py'),
                                    'geowrangler.grids.BingTileGridGenerator.generate_grid_join': ( 'grids.html#bingtilegridgenerator.generate_grid_join',
@@ -138,47 +222,93 @@ d = { 'settings': { 'branch': 'master',
                                                                                     'geowrangler/grids.py'),
                                    'geowrangler.grids.FastBingTileGridGenerator.__init__': ( 'grids.html#fastbingtilegridgenerator.__init__',
                                                                                              'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastBingTileGridGenerator._at_zoom_level': ( 'grids.html#fastbingtilegridgenerator._at_zoom_level',
+                                                                                                   'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastBingTileGridGenerator._filter_off_boundary_tiles': ( 'grids.html#fastbingtilegridgenerator._filter_off_boundary_tiles',
+                                                                                                               'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastBingTileGridGenerator._generate_polygon_tiles': ( 'grids.html#fastbingtilegridgenerator._generate_polygon_tiles',
+                                                                                                            'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastBingTileGridGenerator._generate_tiles': ( 'grids.html#fastbingtilegridgenerator._generate_tiles',
+                                                                                                    'geowrangler/grids.py'),
                                    'geowrangler.grids.FastBingTileGridGenerator._lat_to_ytile': ( 'grids.html#fastbingtilegridgenerator._lat_to_ytile',
                                                                                                   'geowrangler/grids.py'),
                                    'geowrangler.grids.FastBingTileGridGenerator._latlng_to_xy': ( 'grids.html#fastbingtilegridgenerator._latlng_to_xy',
                                                                                                   'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastBingTileGridGenerator._line_and_point_tiles': ( 'grids.html#fastbingtilegridgenerator._line_and_point_tiles',
+                                                                                                          'geowrangler/grids.py'),
                                    'geowrangler.grids.FastBingTileGridGenerator._lng_to_xtile': ( 'grids.html#fastbingtilegridgenerator._lng_to_xtile',
                                                                                                   'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastBingTileGridGenerator._tiles_to_output': ( 'grids.html#fastbingtilegridgenerator._tiles_to_output',
+                                                                                                     'geowrangler/grids.py'),
                                    'geowrangler.grids.FastBingTileGridGenerator._xtile_to_lng': ( 'grids.html#fastbingtilegridgenerator._xtile_to_lng',
                                                                                                   'geowrangler/grids.py'),
                                    'geowrangler.grids.FastBingTileGridGenerator._xy_to_bbox': ( 'grids.html#fastbingtilegridgenerator._xy_to_bbox',
                                                                                                 'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastBingTileGridGenerator._xy_to_bounds': ( 'grids.html#fastbingtilegridgenerator._xy_to_bounds',
+                                                                                                  'geowrangler/grids.py'),
                                    'geowrangler.grids.FastBingTileGridGenerator._xyz_to_quadkey': ( 'grids.html#fastbingtilegridgenerator._xyz_to_quadkey',
                                                                                                     'geowrangler/grids.py'),
                                    'geowrangler.grids.FastBingTileGridGenerator._ytile_to_lat': ( 'grids.html#fastbingtilegridgenerator._ytile_to_lat',
                                                                                                   'geowrangler/grids.py'),
                                    'geowrangler.grids.FastBingTileGridGenerator.generate_grid': ( 'grids.html#fastbingtilegridgenerator.generate_grid',
                                                                                                   'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastBingTileGridGenerator.generate_grid_iter': ( 'grids.html#fastbingtilegridgenerator.generate_grid_iter',
+                                                                                                       'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastBingTileGridGenerator.generate_grid_pyramid': ( 'grids.html#fastbingtilegridgenerator.generate_grid_pyramid',
+                                                                                                          'geowrangler/grids.py'),
                                    'geowrangler.grids.FastSquareGridGenerator': ( 'grids.html#fastsquaregridgenerator',
                                                                                   'geowrangler/grids.py'),
                                    'geowrangler.grids.FastSquareGridGenerator.__init__': ( 'grids.html#fastsquaregridgenerator.__init__',
                                                                                            'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastSquareGridGenerator._coverage_fraction': ( 'grids.html#fastsquaregridgenerator._coverage_fraction',
+                                                                                                     'geowrangler/grids.py'),
                                    'geowrangler.grids.FastSquareGridGenerator._easting_to_xtile': ( 'grids.html#fastsquaregridgenerator._easting_to_xtile',
                                                                                                     'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastSquareGridGenerator._filter_off_boundary_tiles': ( 'grids.html#fastsquaregridgenerator._filter_off_boundary_tiles',
+                                                                                                             'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastSquareGridGenerator._generate_polygon_tiles': ( 'grids.html#fastsquaregridgenerator._generate_polygon_tiles',
+                                                                                                          'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastSquareGridGenerator._generate_tiles': ( 'grids.html#fastsquaregridgenerator._generate_tiles',
+                                                                                                  'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastSquareGridGenerator._get_coverage_inputs': ( 'grids.html#fastsquaregridgenerator._get_coverage_inputs',
+                                                                                                       'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastSquareGridGenerator._line_and_point_tiles': ( 'grids.html#fastsquaregridgenerator._line_and_point_tiles',
+                                                                                                        'geowrangler/grids.py'),
                                    'geowrangler.grids.FastSquareGridGenerator._northing_to_ytile': ( 'grids.html#fastsquaregridgenerator._northing_to_ytile',
                                                                                                      'geowrangler/grids.py'),
                                    'geowrangler.grids.FastSquareGridGenerator._northingeasting_to_xy': ( 'grids.html#fastsquaregridgenerator._northingeasting_to_xy',
                                                                                                          'geowrangler/grids.py'),
                                    'geowrangler.grids.FastSquareGridGenerator._remove_out_of_bounds_polygons': ( 'grids.html#fastsquaregridgenerator._remove_out_of_bounds_polygons',
                                                                                                                  'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastSquareGridGenerator._tiles_to_output': ( 'grids.html#fastsquaregridgenerator._tiles_to_output',
+                                                                                                   'geowrangler/grids.py'),
                                    'geowrangler.grids.FastSquareGridGenerator._xtile_to_easting': ( 'grids.html#fastsquaregridgenerator._xtile_to_easting',
                                                                                                     'geowrangler/grids.py'),
                                    'geowrangler.grids.FastSquareGridGenerator._xy_to_bbox': ( 'grids.html#fastsquaregridgenerator._xy_to_bbox',
                                                                                               'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastSquareGridGenerator._xy_to_bounds': ( 'grids.html#fastsquaregridgenerator._xy_to_bounds',
+                                                                                                'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastSquareGridGenerator._xy_to_reprojected_bbox': ( 'grids.html#fastsquaregridgenerator._xy_to_reprojected_bbox',
+                                                                                                          'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastSquareGridGenerator._xy_to_reprojected_corners': ( 'grids.html#fastsquaregridgenerator._xy_to_reprojected_corners',
+                                                                                                             'geowrangler/grids.py'),
                                    'geowrangler.grids.FastSquareGridGenerator._ytile_to_northing': ( 'grids.html#fastsquaregridgenerator._ytile_to_northing',
                                                                                                      'geowrangler/grids.py'),
                                    'geowrangler.grids.FastSquareGridGenerator.generate_grid': ( 'grids.html#fastsquaregridgenerator.generate_grid',
                                                                                                 'geowrangler/grids.py'),
+                                   'geowrangler.grids.FastSquareGridGenerator.generate_grid_iter': ( 'grids.html#fastsquaregridgenerator.generate_grid_iter',
+                                                                                                     'geowrangler/grids.py'),
                                    'geowrangler.grids.H3GridGenerator': ('grids.html#h3gridgenerator', 'geowrangler/grids.py'),
                                    'geowrangler.grids.H3GridGenerator.__init__': ( 'grids.html#h3gridgenerator.__init__',
                                                                                    'geowrangler/grids.py'),
+                                   'geowrangler.grids.H3GridGenerator._get_hex_ids': ( 'grids.html#h3gridgenerator._get_hex_ids',
+                                                                                       'geowrangler/grids.py'),
+                                   'geowrangler.grids.H3GridGenerator._hex_ids_to_output': ( 'grids.html#h3gridgenerator._hex_ids_to_output',
+                                                                                             'geowrangler/grids.py'),
                                    'geowrangler.grids.H3GridGenerator.generate_grid': ( 'grids.html#h3gridgenerator.generate_grid',
                                                                                         'geowrangler/grids.py'),
+                                   'geowrangler.grids.H3GridGenerator.generate_grid_iter': ( 'grids.html#h3gridgenerator.generate_grid_iter',
+                                                                                             'geowrangler/grids.py'),
                                    'geowrangler.grids.H3GridGenerator.get_hexes_for_polygon': ( 'grids.html#h3gridgenerator.get_hexes_for_polygon',
                                                                                                 'geowrangler/grids.py'),
                                    'geowrangler.grids.SquareGridBoundary': ('grids.html#squaregridboundary', 'geowrangler/grids.py'),
@@ -189,19 +319,71 @@ d = { 'settings': { 'branch': 'master',
                                    'geowrangler.grids.SquareGridGenerator': ('grids.html#squaregridgenerator', 'geowrangler/grids.py'),
                                    'geowrangler.grids.SquareGridGenerator.__init__': ( 'grids.html#squaregridgenerator.__init__',
                                                                                        'geowrangler/grids.py'),
+                                   'geowrangler.grids.SquareGridGenerator._polygon_cells': ( 'grids.html#squaregridgenerator._polygon_cells',
+                                                                                             'geowrangler/grids.py'),
                                    'geowrangler.grids.SquareGridGenerator.create_cell': ( 'grids.html#squaregridgenerator.create_cell',
                                                                                           'geowrangler/grids.py'),
                                    'geowrangler.grids.SquareGridGenerator.create_grid_for_polygon': ( 'grids.html#squaregridgenerator.create_grid_for_polygon',
                                                                                                       'geowrangler/grids.py'),
                                    'geowrangler.grids.SquareGridGenerator.generate_grid': ( 'grids.html#squaregridgenerator.generate_grid',
                                                                                             'geowrangler/grids.py'),
+                                   'geowrangler.grids.SquareGridGenerator.generate_grid_iter': ( 'grids.html#squaregridgenerator.generate_grid_iter',
+                                                                                                 'geowrangler/grids.py'),
+                                   'geowrangler.grids._bounds_to_corners': ('grids.html#_bounds_to_corners', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._cells_to_gdf': ('grids.html#_cells_to_gdf', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._coarsen_spans': ('grids.html#_coarsen_spans', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._compact_bits': ('grids.html#_compact_bits', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._concat_tiles': ('grids.html#_concat_tiles', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._corners_to_wkb': ('grids.html#_corners_to_wkb', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._count_quadkey_descendants': ( 'grids.html#_count_quadkey_descendants',
+                                                                                     'geowrangler/grids.py'),
+                                   'geowrangler.grids._fill_polygons': ('grids.html#_fill_polygons', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._geoarrow_wkb_field': ('grids.html#_geoarrow_wkb_field', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._geoms_to_shared_memory': ( 'grids.html#_geoms_to_shared_memory',
+                                                                                  'geowrangler/grids.py'),
+                                   'geowrangler.grids._get_global_boundary': ('grids.html#_get_global_boundary', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._get_intersect_pairs': ('grids.html#_get_intersect_pairs', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._get_transformer': ('grids.html#_get_transformer', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._h3_cells_to_polygons': ('grids.html#_h3_cells_to_polygons', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._h3_polygons_to_cells': ('grids.html#_h3_polygons_to_cells', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._init_intersects_worker': ( 'grids.html#_init_intersects_worker',
+                                                                                  'geowrangler/grids.py'),
+                                   'geowrangler.grids._intersects_polygon_boundary': ( 'grids.html#_intersects_polygon_boundary',
+                                                                                       'geowrangler/grids.py'),
+                                   'geowrangler.grids._line_and_point_pixels': ( 'grids.html#_line_and_point_pixels',
+                                                                                 'geowrangler/grids.py'),
+                                   'geowrangler.grids._map_bounded': ('grids.html#_map_bounded', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._pairs_to_sjoin': ('grids.html#_pairs_to_sjoin', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._parallel_fill_polygons': ( 'grids.html#_parallel_fill_polygons',
+                                                                                  'geowrangler/grids.py'),
+                                   'geowrangler.grids._process_intersect_pairs': ( 'grids.html#_process_intersect_pairs',
+                                                                                   'geowrangler/grids.py'),
+                                   'geowrangler.grids._range_subset': ('grids.html#_range_subset', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._resolve_boundary_correction': ( 'grids.html#_resolve_boundary_correction',
+                                                                                       'geowrangler/grids.py'),
+                                   'geowrangler.grids._shard_polygons': ('grids.html#_shard_polygons', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._split_geometry_types': ('grids.html#_split_geometry_types', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._spread_bits': ('grids.html#_spread_bits', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._subdivide_polygons': ('grids.html#_subdivide_polygons', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._tiles_to_table': ('grids.html#_tiles_to_table', 'geowrangler/grids.py'),
+                                   'geowrangler.grids._unique_tiles': ('grids.html#_unique_tiles', 'geowrangler/grids.py'),
                                    'geowrangler.grids.get_intersect_partition': ( 'grids.html#get_intersect_partition',
                                                                                   'geowrangler/grids.py'),
                                    'geowrangler.grids.get_parallel_intersects': ( 'grids.html#get_parallel_intersects',
                                                                                   'geowrangler/grids.py'),
+                                   'geowrangler.grids.h3_ints_to_strs': ('grids.html#h3_ints_to_strs', 'geowrangler/grids.py'),
+                                   'geowrangler.grids.h3_strs_to_ints': ('grids.html#h3_strs_to_ints', 'geowrangler/grids.py'),
+                                   'geowrangler.grids.ints_to_quadkeys': ('grids.html#ints_to_quadkeys', 'geowrangler/grids.py'),
                                    'geowrangler.grids.is_aoi_within_boundary': ( 'grids.html#is_aoi_within_boundary',
                                                                                  'geowrangler/grids.py'),
-                                   'geowrangler.grids.setup_boundary': ('grids.html#setup_boundary', 'geowrangler/grids.py')},
+                                   'geowrangler.grids.quadkey_int_to_parent': ('grids.html#quadkey_int_to_parent', 'geowrangler/grids.py'),
+                                   'geowrangler.grids.quadkey_int_to_xyz': ('grids.html#quadkey_int_to_xyz', 'geowrangler/grids.py'),
+                                   'geowrangler.grids.quadkey_int_zoom_level': ( 'grids.html#quadkey_int_zoom_level',
+                                                                                 'geowrangler/grids.py'),
+                                   'geowrangler.grids.quadkeys_to_ints': ('grids.html#quadkeys_to_ints', 'geowrangler/grids.py'),
+                                   'geowrangler.grids.setup_boundary': ('grids.html#setup_boundary', 'geowrangler/grids.py'),
+                                   'geowrangler.grids.write_grid_parquet': ('grids.html#write_grid_parquet', 'geowrangler/grids.py'),
+                                   'geowrangler.grids.xyz_to_quadkey_int': ('grids.html#xyz_to_quadkey_int', 'geowrangler/grids.py')},
             'geowrangler.raster_process': { 'geowrangler.raster_process.query_window_by_gdf': ( 'raster_process.html#query_window_by_gdf',
                                                                                                 'geowrangler/raster_process.py'),
                                             'geowrangler.raster_process.query_window_by_polygon': ( 'raster_process.html#query_window_by_polygon',
@@ -298,24 +480,72 @@ d = { 'settings': { 'branch': 'master',
                                                                                                    'geowrangler/vector_to_raster_mask.py'),
                                                    'geowrangler.vector_to_raster_mask.generate_mask': ( 'vector_to_raster_mask.html#generate_mask',
                                                                                                         'geowrangler/vector_to_raster_mask.py')},
-            'geowrangler.vector_zonal_stats': { 'geowrangler.vector_zonal_stats._aggregate_stats': ( 'vector_zonal_stats.html#_aggregate_stats',
+            'geowrangler.vector_zonal_stats': { 'geowrangler.vector_zonal_stats.ZonalJoinPlan': ( 'vector_zonal_stats.html#zonaljoinplan',
+                                                                                                  'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats.ZonalJoinPlan.__init__': ( 'vector_zonal_stats.html#zonaljoinplan.__init__',
+                                                                                                           'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats.ZonalJoinPlan.aggregate': ( 'vector_zonal_stats.html#zonaljoinplan.aggregate',
+                                                                                                            'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats.ZonalJoinPlan.save': ( 'vector_zonal_stats.html#zonaljoinplan.save',
+                                                                                                       'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._aggregate_stats': ( 'vector_zonal_stats.html#_aggregate_stats',
                                                                                                      'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._batched_index_pair_aggregates': ( 'vector_zonal_stats.html#_batched_index_pair_aggregates',
+                                                                                                                   'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._block_zonal_stats': ( 'vector_zonal_stats.html#_block_zonal_stats',
+                                                                                                       'geowrangler/vector_zonal_stats.py'),
                                                 'geowrangler.vector_zonal_stats._build_agg_args': ( 'vector_zonal_stats.html#_build_agg_args',
                                                                                                     'geowrangler/vector_zonal_stats.py'),
                                                 'geowrangler.vector_zonal_stats._check_agg': ( 'vector_zonal_stats.html#_check_agg',
                                                                                                'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._column_funcs': ( 'vector_zonal_stats.html#_column_funcs',
+                                                                                                  'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._empty_aggregates': ( 'vector_zonal_stats.html#_empty_aggregates',
+                                                                                                      'geowrangler/vector_zonal_stats.py'),
                                                 'geowrangler.vector_zonal_stats._expand_aggs': ( 'vector_zonal_stats.html#_expand_aggs',
                                                                                                  'geowrangler/vector_zonal_stats.py'),
                                                 'geowrangler.vector_zonal_stats._fillnas': ( 'vector_zonal_stats.html#_fillnas',
                                                                                              'geowrangler/vector_zonal_stats.py'),
                                                 'geowrangler.vector_zonal_stats._fix_agg': ( 'vector_zonal_stats.html#_fix_agg',
                                                                                              'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._group_pairs': ( 'vector_zonal_stats.html#_group_pairs',
+                                                                                                 'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._groupby_agg': ( 'vector_zonal_stats.html#_groupby_agg',
+                                                                                                 'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._index_pair_aggregates': ( 'vector_zonal_stats.html#_index_pair_aggregates',
+                                                                                                           'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._iter_data_batches': ( 'vector_zonal_stats.html#_iter_data_batches',
+                                                                                                       'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._merge_aggregates': ( 'vector_zonal_stats.html#_merge_aggregates',
+                                                                                                      'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._merge_moments': ( 'vector_zonal_stats.html#_merge_moments',
+                                                                                                   'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._moments_to_agg': ( 'vector_zonal_stats.html#_moments_to_agg',
+                                                                                                    'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._pair_aggregates': ( 'vector_zonal_stats.html#_pair_aggregates',
+                                                                                                     'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._pair_values': ( 'vector_zonal_stats.html#_pair_values',
+                                                                                                 'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._parallel_zonal_stats': ( 'vector_zonal_stats.html#_parallel_zonal_stats',
+                                                                                                          'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._plan_fingerprint': ( 'vector_zonal_stats.html#_plan_fingerprint',
+                                                                                                      'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._polars_groupby_agg': ( 'vector_zonal_stats.html#_polars_groupby_agg',
+                                                                                                        'geowrangler/vector_zonal_stats.py'),
                                                 'geowrangler.vector_zonal_stats._prep_aoi': ( 'vector_zonal_stats.html#_prep_aoi',
                                                                                               'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._segment_moments': ( 'vector_zonal_stats.html#_segment_moments',
+                                                                                                     'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._spatial_blocks': ( 'vector_zonal_stats.html#_spatial_blocks',
+                                                                                                    'geowrangler/vector_zonal_stats.py'),
                                                 'geowrangler.vector_zonal_stats._validate_aggs': ( 'vector_zonal_stats.html#_validate_aggs',
                                                                                                    'geowrangler/vector_zonal_stats.py'),
                                                 'geowrangler.vector_zonal_stats._validate_aoi': ( 'vector_zonal_stats.html#_validate_aoi',
                                                                                                   'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._validate_batched_data': ( 'vector_zonal_stats.html#_validate_batched_data',
+                                                                                                           'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats._validate_engine': ( 'vector_zonal_stats.html#_validate_engine',
+                                                                                                     'geowrangler/vector_zonal_stats.py'),
                                                 'geowrangler.vector_zonal_stats.compute_quadkey': ( 'vector_zonal_stats.html#compute_quadkey',
                                                                                                     'geowrangler/vector_zonal_stats.py'),
                                                 'geowrangler.vector_zonal_stats.create_bingtile_zonal_stats': ( 'vector_zonal_stats.html#create_bingtile_zonal_stats',
@@ -324,7 +554,11 @@ d = { 'settings': { 'branch': 'master',
                                                                                                        'geowrangler/vector_zonal_stats.py'),
                                                 'geowrangler.vector_zonal_stats.get_quadkey': ( 'vector_zonal_stats.html#get_quadkey',
                                                                                                 'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats.load_zonal_join_plan': ( 'vector_zonal_stats.html#load_zonal_join_plan',
+                                                                                                         'geowrangler/vector_zonal_stats.py'),
                                                 'geowrangler.vector_zonal_stats.validate_aoi_quadkey': ( 'vector_zonal_stats.html#validate_aoi_quadkey',
                                                                                                          'geowrangler/vector_zonal_stats.py'),
                                                 'geowrangler.vector_zonal_stats.validate_data_quadkey': ( 'vector_zonal_stats.html#validate_data_quadkey',
-                                                                                                          'geowrangler/vector_zonal_stats.py')}}}
+                                                                                                          'geowrangler/vector_zonal_stats.py'),
+                                                'geowrangler.vector_zonal_stats.validate_nested_aoi_quadkey': ( 'vector_zonal_stats.html#validate_nested_aoi_quadkey',
+                                                                                                                'geowrangler/vector_zonal_stats.py')}}}
@@ -156,6 +156,7 @@ def create_area_zonal_stats(
     ] = [],
     include_intersect=True,  # Add column 'intersect_area_sum' w/ch computes total area of data areas intersecting aoi
     fix_min=True,  # Set min to zero if there are areas in aoi w/ch do not containing any intersecting area from the data.
+    engine: str = "pandas",  # "pandas" aggregates the intersections with a groupby, "polars" with a multi-threaded polars group by
 ):
 
     validate_area_aoi(aoi)
@@ -165,6 +166,7 @@ def create_area_zonal_stats(
 
     # validate_area_aggs(fixed_aggs,data)
     vzs._validate_aggs(fixed_aggs, data)
+    vzs._validate_engine(engine, fixed_aggs, vzs.GROUPBY_ENGINES)
 
     # reindex aoi
     aoi_index_name = aoi.index.name
@@ -192,11 +194,9 @@ def create_area_zonal_stats(
     expanded_aggs = expand_area_aggs(fixed_aggs)
     intersect = compute_intersect_stats(intersect, expanded_aggs)
 
-    groups = intersect.groupby(GEO_INDEX_NAME)
-
     agg_area_dicts = build_agg_area_dicts(expanded_aggs)
 
-    aggregates = groups.agg(**agg_area_dicts)
+    aggregates = vzs._groupby_agg(intersect, agg_area_dicts, engine)
     results = aoi.merge(
         aggregates, how="left", on=GEO_INDEX_NAME, suffixes=(None, "_y")
     )
@@ -29,6 +29,7 @@ def create_distance_zonal_stats(
     max_distance: float,  # max distance to compute distance for (the larger the slower the join), set to None for no limit
     aggregations: List[Dict[str, Any]] = [],  # aggregations
     distance_col: str = "nearest",  # column name of the distance column, set to None if not wanted in results
+    engine: str = "pandas",  # "pandas" aggregates the nearest matches with a groupby, "polars" with a multi-threaded polars group by
 ):
     """Computes zonal stats based on nearest matching data geometry within `max_distance`.
     Note that setting a too high max_distance (or None) will incur a performance cost.
@@ -40,6 +41,7 @@ def create_distance_zonal_stats(
     fixed_aggs = [vzs._fix_agg(agg) for agg in aggregations]
 
     vzs._validate_aggs(fixed_aggs, data)
+    vzs._validate_engine(engine, fixed_aggs, vzs.GROUPBY_ENGINES)
 
     # reindex aoi
     aoi_index_name = aoi.index.name
@@ -62,12 +64,10 @@ def create_distance_zonal_stats(
         distance_col=INTERNAL_DISTANCE_COL,
     )
 
-    groups = nearest.groupby(GEO_INDEX_NAME)
-
     expanded_aggs = vzs._expand_aggs(fixed_aggs)
     agg_distance_dicts = build_agg_distance_dicts(expanded_aggs, distance_col)
 
-    aggregates = groups.agg(**agg_distance_dicts)
+    aggregates = vzs._groupby_agg(nearest, agg_distance_dicts, engine)
 
     results = aoi.merge(
         aggregates, how="left", on=GEO_INDEX_NAME, suffixes=(None, "_y")
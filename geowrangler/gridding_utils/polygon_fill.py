@@ -1,14 +1,18 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../notebooks/15_polygon_fill.ipynb.
 
 # %% auto 0
-__all__ = ['voxel_traversal_2d', 'scanline_fill', 'voxel_traversal_scanline_fill', 'polygons_to_vertices', 'fast_polygon_fill']
+__all__ = ['voxel_traversal_2d', 'scanline_fill', 'voxel_traversal_scanline_fill', 'explode_polygons', 'polygons_to_vertices',
+           'pack_pixel_keys', 'unpack_pixel_keys', 'voxel_traversal_2d_vectorized', 'merge_spans', 'pixels_to_spans',
+           'expand_spans', 'iter_expand_spans', 'join_spans', 'fast_polygon_fill', 'centroid_polygon_fill',
+           'boundary_pixels', 'lines_to_vertices', 'points_to_vertices', 'line_pixels', 'point_pixels']
 
 # %% ../../notebooks/15_polygon_fill.ipynb 5
-from typing import List, Tuple, Set, Optional, Dict, Union
+from typing import List, Tuple, Set, Optional, Dict, Union, Iterator
 
 import numpy as np
 import pandas as pd
 import geopandas as gpd
+import shapely
 import polars as pl
 
 # %% ../../notebooks/15_polygon_fill.ipynb 12
@@ -138,16 +142,40 @@ def interpolate_x(
     interpolated_x = x1 + (y - y1) * inverse_slope
     return interpolated_x
 
+
+def offset_ring_vertices(
+    vertices: List[Tuple[int, int]],  # list of polygon vertices in order
+    ring_ids: Optional[
+        List[int]
+    ] = None,  # ring id of each vertex. If not given, all the vertices are treated as a single ring
+) -> List[Tuple[int, int]]:
+    """Returns the end vertex of the edge starting at each vertex. The last vertex of a ring connects back to the first vertex of that ring."""
+    if ring_ids is None:
+        return vertices[1:] + vertices[:1]
+
+    offset_vertices = []
+    ring_start = 0
+    for i in range(len(vertices)):
+        if i + 1 == len(vertices) or ring_ids[i + 1] != ring_ids[i]:
+            offset_vertices.append(vertices[ring_start])
+            ring_start = i + 1
+        else:
+            offset_vertices.append(vertices[i + 1])
+    return offset_vertices
+
 # %% ../../notebooks/15_polygon_fill.ipynb 17
 def scanline_fill(
     vertices: List[
         Tuple[int, int]
     ],  # list of polygon vertices in order (either clockwise or counterclockwise)
     debug: bool = False,  # if true, prints diagnostic info for the algorithm
+    ring_ids: Optional[
+        List[int]
+    ] = None,  # ring id of each vertex, for polygons with holes. If given, every ring is closed separately
 ) -> Set[Tuple[int, int]]:
     """Returns all pixels within the interior of a polygon defined by vertices"""
 
-    offset_vertices = vertices[1:] + vertices[:1]
+    offset_vertices = offset_ring_vertices(vertices, ring_ids)
 
     if not vertices:
         return set()
@@ -203,6 +231,9 @@ def voxel_traversal_scanline_fill(
     x_col: str = "x",
     y_col: str = "y",
     debug: bool = False,  # if true, prints diagnostic info for both voxel traversal and scanline fill algorithms
+    ring_col: Optional[
+        str
+    ] = None,  # column with the ring id of each vertex, for polygons with holes. If given, every ring is closed separately
 ) -> Dict[str, Set[Tuple[int, int]]]:
     """
     Returns pixels that intersect a polygon.
@@ -213,7 +244,8 @@ def voxel_traversal_scanline_fill(
     """
 
     vertices = list(zip(vertices_df[x_col].to_list(), vertices_df[y_col].to_list()))
-    offset_vertices = vertices[1:] + vertices[:1]
+    ring_ids = None if ring_col is None else vertices_df[ring_col].to_list()
+    offset_vertices = offset_ring_vertices(vertices, ring_ids)
 
     polygon_pixels = set()
     off_boundary_pixels = set()
@@ -223,7 +255,7 @@ def voxel_traversal_scanline_fill(
         polygon_pixels.update(voxel_traversal_results["line_pixels"])
         off_boundary_pixels.update(voxel_traversal_results["off_diagonal_pixels"])
 
-    polygon_pixels.update(scanline_fill(vertices, debug))
+    polygon_pixels.update(scanline_fill(vertices, debug, ring_ids))
 
     # removing off boundary tiles that are actually in the interior
     off_boundary_pixels = off_boundary_pixels - polygon_pixels
@@ -236,82 +268,668 @@ def voxel_traversal_scanline_fill(
 
 # %% ../../notebooks/15_polygon_fill.ipynb 28
 SUBPOLYGON_ID_COL = "__subpolygon_id__"
+RING_ID_COL = "__ring_id__"
 PIXEL_DTYPE = pl.Int32
 
 # %% ../../notebooks/15_polygon_fill.ipynb 29
-def polygons_to_vertices(
-    polys_gdf: gpd.GeoDataFrame,
+def _explode_geometries(
+    gdf: gpd.GeoDataFrame,
     unique_id_col: Optional[
         str
-    ] = None,  # the ids under this column will be preserved in the output tiles
-) -> pl.DataFrame:
+    ],  # the ids under this column will be preserved in the output tiles
+    geom_type: str,  # type of every geometry after exploding
+    geom_description: str,  # allowed geometry types for the error message
+) -> gpd.GeoDataFrame:
+    """Explodes all geometries into single part geometries indexed by `unique_id_col` and a subpolygon id"""
 
     if unique_id_col is not None:
-        duplicates_bool = polys_gdf[unique_id_col].duplicated()
+        duplicates_bool = gdf[unique_id_col].duplicated()
         if duplicates_bool.any():
             raise ValueError(
                 f"""{unique_id_col} is not unique!
                 Found {duplicates_bool.sum():,} duplicates"""
             )
-        polys_gdf = polys_gdf.set_index(unique_id_col)
+        gdf = gdf.set_index(unique_id_col)
     else:
         # reset index if it is not unique
-        if polys_gdf.index.nunique() != len(polys_gdf.index):
-            polys_gdf = polys_gdf.reset_index(drop=True)
-        unique_id_col = polys_gdf.index.name
+        if gdf.index.nunique() != len(gdf.index):
+            gdf = gdf.reset_index(drop=True)
+        unique_id_col = gdf.index.name
 
-    polys_gdf = polys_gdf.explode(index_parts=True)
+    gdf = gdf.explode(index_parts=True)
 
-    is_poly_bool = polys_gdf.type == "Polygon"
-    if not is_poly_bool.all():
+    is_geom_type_bool = gdf.type == geom_type
+    if not is_geom_type_bool.all():
         raise ValueError(
             f"""
-        All geometries should be polygons or multipolygons but found
-        {is_poly_bool.sum():,} after exploding the GeoDataFrame"""
+        All geometries should be {geom_description} but found
+        {is_geom_type_bool.sum():,} after exploding the GeoDataFrame"""
         )
 
-    polys_gdf.index.names = [unique_id_col, SUBPOLYGON_ID_COL]
+    gdf.index.names = [unique_id_col, SUBPOLYGON_ID_COL]
+    return gdf
+
+
+def explode_polygons(
+    polys_gdf: gpd.GeoDataFrame,
+    unique_id_col: Optional[
+        str
+    ] = None,  # the ids under this column will be preserved in the output tiles
+) -> gpd.GeoDataFrame:
+    """Explodes all polygons and multipolygons into single polygons indexed by `unique_id_col` and a subpolygon id"""
+    return _explode_geometries(
+        polys_gdf, unique_id_col, "Polygon", "polygons or multipolygons"
+    )
+
+
+def polygons_to_vertices(
+    polys_gdf: gpd.GeoDataFrame,
+    unique_id_col: Optional[
+        str
+    ] = None,  # the ids under this column will be preserved in the output tiles
+) -> pl.DataFrame:
+
+    polys_gdf = explode_polygons(polys_gdf, unique_id_col)
     vertices_df = polys_gdf.get_coordinates().reset_index()
+
+    # the coordinates of each polygon are listed ring by ring, starting with the exterior ring
+    rings, ring_polygon = shapely.get_rings(
+        polys_gdf.geometry.values, return_index=True
+    )
+    ring_ids = np.arange(len(rings)) - np.searchsorted(ring_polygon, ring_polygon)
+    vertices_df[RING_ID_COL] = np.repeat(ring_ids, shapely.get_num_coordinates(rings))
     vertices_df = pl.from_pandas(vertices_df)
 
     return vertices_df
 
 # %% ../../notebooks/15_polygon_fill.ipynb 33
-def fast_polygon_fill(
-    vertices_df: pl.DataFrame,  # integer vertices of all polygons in the AOI
+POLYGON_IDX_COL = "__polygon_idx__"
+PIXEL_KEY_COL = "__pixel_key__"
+PIXEL_KEY_BITS = 32
+PIXEL_KEY_MASK = (1 << PIXEL_KEY_BITS) - 1
+FILL_ENGINES = ["numpy", "python"]
+
+# %% ../../notebooks/15_polygon_fill.ipynb 34
+def pack_pixel_keys(
+    x: np.ndarray,  # x pixel coordinates
+    y: np.ndarray,  # y pixel coordinates
+) -> np.ndarray:
+    """Packs pixel coordinates into a single int64 key per pixel"""
+    x = np.asarray(x, dtype=np.int64)
+    y = np.asarray(y, dtype=np.int64)
+    return (x << PIXEL_KEY_BITS) | (y & PIXEL_KEY_MASK)
+
+
+def unpack_pixel_keys(
+    keys: np.ndarray,  # int64 keys from `pack_pixel_keys`
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Unpacks int64 pixel keys back to x and y pixel coordinates"""
+    keys = np.asarray(keys, dtype=np.int64)
+    x = (keys >> PIXEL_KEY_BITS).astype(np.int32)
+    # casting to int32 keeps the lower 32 bits as a signed integer
+    y = keys.astype(np.int32)
+    return x, y
+
+# %% ../../notebooks/15_polygon_fill.ipynb 35
+def _ragged_arange(counts: np.ndarray) -> np.ndarray:
+    """Concatenation of np.arange(count) for every count"""
+    counts = np.asarray(counts, dtype=np.int64)
+    offsets = np.cumsum(counts) - counts
+    return np.arange(counts.sum(), dtype=np.int64) - np.repeat(offsets, counts)
+
+
+def _group_vertices(
+    vertices_df: pl.DataFrame,
+    id_cols: List[str],
+) -> Tuple[pl.DataFrame, np.ndarray, np.ndarray]:
+    """Returns the polygon ids, and the polygon index and row of each vertex grouped by polygon"""
+    groups = (
+        vertices_df.select(id_cols)
+        .with_row_index(POLYGON_IDX_COL)
+        .group_by(id_cols, maintain_order=True)
+        .agg(pl.col(POLYGON_IDX_COL))
+    )
+    polygon_ids = groups.select(id_cols)
+    row_idx = groups[POLYGON_IDX_COL].explode().to_numpy()
+    n_vertices = groups[POLYGON_IDX_COL].list.len().to_numpy()
+
+    polygon_idx = np.repeat(np.arange(len(groups), dtype=np.int64), n_vertices)
+    return polygon_ids, polygon_idx, row_idx
+
+
+def _partition_vertices(
+    vertices_df: pl.DataFrame,
+    id_cols: List[str],
+) -> Tuple[pl.DataFrame, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Groups the vertices by polygon once, returning the polygon ids and the polygon index, ring id, x and y of each vertex"""
+
+    polygon_ids, polygon_idx, row_idx = _group_vertices(vertices_df, id_cols)
+    x = vertices_df["x"].to_numpy()[row_idx].astype(np.int64)
+    y = vertices_df["y"].to_numpy()[row_idx].astype(np.int64)
+    ring_ids = _vertex_ring_ids(vertices_df, row_idx)
+    if ring_ids is None:
+        ring_ids = np.zeros(len(row_idx), dtype=np.int64)
+
+    # remove repeated vertices within a ring, keeping the first occurrence
+    is_first = (
+        pl.DataFrame(
+            {
+                POLYGON_IDX_COL: polygon_idx,
+                RING_ID_COL: ring_ids,
+                PIXEL_KEY_COL: pack_pixel_keys(x, y),
+            }
+        )
+        .select(
+            pl.struct(POLYGON_IDX_COL, RING_ID_COL, PIXEL_KEY_COL).is_first_distinct()
+        )
+        .to_series()
+        .to_numpy()
+    )
+
+    return (
+        polygon_ids,
+        polygon_idx[is_first],
+        ring_ids[is_first],
+        x[is_first],
+        y[is_first],
+    )
+
+
+def _vertex_ring_ids(
+    vertices_df: pl.DataFrame,
+    row_idx: np.ndarray,  # row of each vertex grouped by polygon, from `_group_vertices`
+) -> Optional[np.ndarray]:
+    """Returns the ring id of each vertex grouped by polygon, or None if the vertices have no ring ids"""
+    if RING_ID_COL not in vertices_df.columns:
+        return None
+    return vertices_df[RING_ID_COL].to_numpy()[row_idx]
+
+
+def _polygon_edges(
+    polygon_idx: np.ndarray,  # polygon index of each vertex, grouped by polygon
+    x: np.ndarray,
+    y: np.ndarray,
+    ring_ids: Optional[
+        np.ndarray
+    ] = None,  # ring id of each vertex. If not given, all the vertices of a polygon are treated as a single ring
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the end vertices for the edges starting at each vertex. The last vertex of a ring connects back to the first vertex of that ring."""
+    is_first_vertex = np.ones(len(polygon_idx), dtype=bool)
+    is_first_vertex[1:] = polygon_idx[1:] != polygon_idx[:-1]
+    if ring_ids is not None:
+        is_first_vertex[1:] |= ring_ids[1:] != ring_ids[:-1]
+    is_last_vertex = np.roll(is_first_vertex, -1)
+
+    next_idx = np.arange(1, len(polygon_idx) + 1)
+    next_idx[is_last_vertex] = np.flatnonzero(is_first_vertex)
+    return x[next_idx], y[next_idx]
+
+# %% ../../notebooks/15_polygon_fill.ipynb 36
+def _count_crossings(
+    key: np.ndarray,
+    step: np.ndarray,
+    n_crossings: np.ndarray,
+) -> np.ndarray:
+    """Counts the crossings at (2j + 1) * step, j in [0, n_crossings), that are at or before key"""
+    step = np.maximum(step, 1)
+    count = (key - step) // (2 * step) + 1
+    return np.clip(count, 0, n_crossings)
+
+
+def voxel_traversal_2d_vectorized(
+    x1: np.ndarray,  # x of the start vertex of each edge
+    y1: np.ndarray,  # y of the start vertex of each edge
+    x2: np.ndarray,  # x of the end vertex of each edge
+    y2: np.ndarray,  # y of the end vertex of each edge
+) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Vectorized version of `voxel_traversal_2d` over many edges.
+
+    Returns the edge index, x and y for all the line pixels and off-diagonal pixels.
+    """
+    x1, y1, x2, y2 = [np.asarray(a, dtype=np.int64) for a in (x1, y1, x2, y2)]
+    nx = np.abs(x2 - x1)
+    ny = np.abs(y2 - y1)
+    direction_x = np.where(x2 > x1, 1, -1)
+    direction_y = np.where(y2 > y1, 1, -1)
+
+    # every edge covers nx + 1 columns
+    col_edge = np.repeat(np.arange(len(x1), dtype=np.int64), nx + 1)
+    ix = _ragged_arange(nx + 1)
+    col_nx = nx[col_edge]
+    col_ny = ny[col_edge]
+
+    # a column is entered after the x crossing at (2ix - 1) * ny and exited at the x crossing at (2ix + 1) * ny.
+    # ties between x and y crossings are diagonal steps, so these are already in the next row when entering
+    iy_start = np.where(
+        ix == 0, 0, _count_crossings((2 * ix - 1) * col_ny, col_nx, col_ny)
+    )
+    iy_end = np.where(
+        ix == col_nx,
+        col_ny,
+        _count_crossings((2 * ix + 1) * col_ny - 1, col_nx, col_ny),
+    )
+
+    n_rows = iy_end - iy_start + 1
+    line_edge = np.repeat(col_edge, n_rows)
+    line_ix = np.repeat(ix, n_rows)
+    line_iy = np.repeat(iy_start, n_rows) + _ragged_arange(n_rows)
+    line_x = x1[line_edge] + direction_x[line_edge] * line_ix
+    line_y = y1[line_edge] + direction_y[line_edge] * line_iy
+
+    # (2i + 1) * ny == (2j + 1) * nx only when both nx / gcd and ny / gcd are odd,
+    # in which case there are gcd diagonal steps at 2i + 1 = (nx / gcd) * m and 2j + 1 = (ny / gcd) * m, for odd m
+    gcd = np.gcd(nx, ny)
+    safe_gcd = np.maximum(gcd, 1)
+    p = nx // safe_gcd
+    q = ny // safe_gcd
+    has_diagonal = (gcd > 0) & (p % 2 == 1) & (q % 2 == 1)
+    n_diagonal = np.where(has_diagonal, gcd, 0)
+    diagonal_edge = np.repeat(np.arange(len(x1), dtype=np.int64), n_diagonal)
+    m = 2 * _ragged_arange(n_diagonal) + 1
+    diagonal_ix = (p[diagonal_edge] * m - 1) // 2
+    diagonal_iy = (q[diagonal_edge] * m - 1) // 2
+
+    # both pixels adjacent to the diagonal step are off-diagonal pixels
+    off_diagonal_edge = np.concatenate([diagonal_edge, diagonal_edge])
+    off_diagonal_ix = np.concatenate([diagonal_ix + 1, diagonal_ix])
+    off_diagonal_iy = np.concatenate([diagonal_iy, diagonal_iy + 1])
+    off_diagonal_x = (
+        x1[off_diagonal_edge] + direction_x[off_diagonal_edge] * off_diagonal_ix
+    )
+    off_diagonal_y = (
+        y1[off_diagonal_edge] + direction_y[off_diagonal_edge] * off_diagonal_iy
+    )
+
+    result = {
+        "line_pixels": (line_edge, line_x, line_y),
+        "off_diagonal_pixels": (off_diagonal_edge, off_diagonal_x, off_diagonal_y),
+    }
+    return result
+
+# %% ../../notebooks/15_polygon_fill.ipynb 37
+def _scanline_spans(
+    polygon_idx: np.ndarray,  # polygon index of each edge
+    x1: np.ndarray,
+    y1: np.ndarray,
+    x2: np.ndarray,
+    y2: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized version of `scanline_fill` over the edges of many polygons.
+
+    Returns the polygon index, y, starting x and ending x (inclusive) of the filled horizontal spans.
+    """
+    is_sloped = y1 != y2
+    polygon_idx, x1, y1, x2, y2 = [a[is_sloped] for a in (polygon_idx, x1, y1, x2, y2)]
+
+    # an edge intersects the scanlines in (min(y1, y2), max(y1, y2)]
+    n_scanlines = np.abs(y2 - y1)
+    edge = np.repeat(np.arange(len(x1), dtype=np.int64), n_scanlines)
+    scanline_y = np.repeat(np.minimum(y1, y2) + 1, n_scanlines) + _ragged_arange(
+        n_scanlines
+    )
+
+    # same order of operations as interpolate_x to get identical floats
+    inverse_slope = (x2 - x1) / (y2 - y1)
+    intersection_x = x1[edge] + (scanline_y - y1[edge]) * inverse_slope[edge]
+    intersection_polygon = polygon_idx[edge]
+
+    span_polygon, span_y, span_x_start, span_x_end = _pair_intersections(
+        intersection_polygon, scanline_y, intersection_x
+    )
+
+    # np.rint rounds half to even, same as python's round
+    x_start = np.rint(span_x_start).astype(np.int64)
+    x_end = np.rint(span_x_end).astype(np.int64)
+
+    return span_polygon, span_y, x_start, x_end
+
+
+def _pair_intersections(
+    intersection_polygon: np.ndarray,
+    scanline_y: np.ndarray,
+    intersection_x: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Sorts the scanline intersections and pairs them up within the same polygon and scanline (even-odd rule).
+    Returns the polygon index, y, and the starting and ending x intersections of every pair.
+    """
+    order = np.lexsort((intersection_x, scanline_y, intersection_polygon))
+    intersection_x = intersection_x[order]
+    scanline_y = scanline_y[order]
+    intersection_polygon = intersection_polygon[order]
+
+    is_new_row = np.ones(len(order), dtype=bool)
+    is_new_row[1:] = (scanline_y[1:] != scanline_y[:-1]) | (
+        intersection_polygon[1:] != intersection_polygon[:-1]
+    )
+    row_start = np.flatnonzero(is_new_row)
+    position = np.arange(len(order)) - np.repeat(
+        row_start, np.diff(np.r_[row_start, len(order)])
+    )
+    is_span_start = position % 2 == 0
+    is_span_start[-1:] = False
+    is_span_start[:-1] &= ~is_new_row[1:]
+    span_start = np.flatnonzero(is_span_start)
+
+    return (
+        intersection_polygon[span_start],
+        scanline_y[span_start],
+        intersection_x[span_start],
+        intersection_x[span_start + 1],
+    )
+
+
+def _expand_span_arrays(
+    span_idx: np.ndarray,
+    y: np.ndarray,
+    x_start: np.ndarray,
+    x_end: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Expands horizontal spans into pixels"""
+    n_pixels = np.maximum(x_end - x_start + 1, 0)
+    x = np.repeat(x_start, n_pixels) + _ragged_arange(n_pixels)
+    return np.repeat(span_idx, n_pixels), x, np.repeat(y, n_pixels)
+
+# %% ../../notebooks/15_polygon_fill.ipynb 38
+def _pixels_df(
+    polygon_ids: pl.DataFrame,
+    polygon_idx: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    unique_id_col: Optional[str],
+) -> pl.DataFrame:
+    """Deduplicated packed pixel keys, tagged with unique_id_col if given"""
+    pixels = pl.DataFrame({PIXEL_KEY_COL: pack_pixel_keys(x, y)})
+    if unique_id_col is None:
+        return pixels.unique(maintain_order=True)
+    pixels = pixels.with_columns(polygon_ids[unique_id_col].gather(polygon_idx))
+    return pixels.unique(maintain_order=True)
+
+
+def _unpack_pixels_df(
+    pixels: pl.DataFrame,
+    unique_id_col: Optional[str],
+) -> pl.DataFrame:
+    x, y = unpack_pixel_keys(pixels[PIXEL_KEY_COL].to_numpy())
+    columns = [
+        pl.Series("x", x, dtype=PIXEL_DTYPE),
+        pl.Series("y", y, dtype=PIXEL_DTYPE),
+    ]
+    if unique_id_col is not None:
+        columns.append(pixels[unique_id_col])
+    return pl.DataFrame(columns)
+
+
+def _spans_df(
+    polygon_ids: pl.DataFrame,
+    polygon_idx: np.ndarray,
+    y: np.ndarray,
+    x_start: np.ndarray,
+    x_end: np.ndarray,
+    unique_id_col: Optional[str],
+) -> pl.DataFrame:
+    """Merged spans, tagged with unique_id_col if given"""
+    spans = pl.DataFrame(
+        [
+            pl.Series("y", y, dtype=PIXEL_DTYPE),
+            pl.Series("x_start", x_start, dtype=PIXEL_DTYPE),
+            pl.Series("x_end", x_end, dtype=PIXEL_DTYPE),
+        ]
+    )
+    if unique_id_col is not None:
+        spans = spans.with_columns(polygon_ids[unique_id_col].gather(polygon_idx))
+    return merge_spans(spans)
+
+
+def _numpy_polygon_fill(
+    vertices_df: pl.DataFrame,
+    id_cols: List[str],
     unique_id_col: Optional[
         str
-    ] = None,  # the ids under this column will be preserved in the output tiles
-) -> Dict[str, pl.DataFrame]:
+    ],  # only given if the ids should be preserved in the output tiles
+    return_spans: bool = False,  # if true, returns the tiles in the geometry as spans instead of individual tiles
+) -> Tuple[pl.DataFrame, pl.DataFrame]:
+    polygon_ids, polygon_idx, ring_ids, x1, y1 = _partition_vertices(
+        vertices_df, id_cols
+    )
+    x2, y2 = _polygon_edges(polygon_idx, x1, y1, ring_ids)
 
-    if unique_id_col is not None:
-        id_cols = [SUBPOLYGON_ID_COL, unique_id_col]
-        has_unique_id_col = True
-    else:
-        complement_cols = ["x", "y", SUBPOLYGON_ID_COL]
-        unique_id_col = list(set(vertices_df.columns) - set(complement_cols))
-        assert len(unique_id_col) == 1
-        unique_id_col = unique_id_col[0]
-        id_cols = [SUBPOLYGON_ID_COL, unique_id_col]
-        has_unique_id_col = False
+    voxel_traversal_results = voxel_traversal_2d_vectorized(x1, y1, x2, y2)
+    line_edge, line_x, line_y = voxel_traversal_results["line_pixels"]
+    off_edge, off_x, off_y = voxel_traversal_results["off_diagonal_pixels"]
 
-    for col in id_cols:
-        assert col in vertices_df, f"{col} should be column in vertices_df"
+    span_polygon, span_y, span_x_start, span_x_end = _scanline_spans(
+        polygon_idx, x1, y1, x2, y2
+    )
+    tiles_off_boundary = _pixels_df(
+        polygon_ids, polygon_idx[off_edge], off_x, off_y, unique_id_col
+    )
+
+    if return_spans:
+        # boundary pixels are added as spans of a single pixel
+        spans_in_geom = _spans_df(
+            polygon_ids,
+            np.concatenate([polygon_idx[line_edge], span_polygon]),
+            np.concatenate([line_y, span_y]),
+            np.concatenate([line_x, span_x_start]),
+            np.concatenate([line_x, span_x_end]),
+            unique_id_col,
+        )
+
+        # removing off boundary tiles that are actually in the interior
+        tiles_off_boundary = _unpack_pixels_df(tiles_off_boundary, unique_id_col)
+        on = [] if unique_id_col is None else [unique_id_col]
+        tiles_in_spans = join_spans(tiles_off_boundary, spans_in_geom, on=on)
+        tiles_off_boundary = tiles_off_boundary.join(
+            tiles_in_spans.select(tiles_off_boundary.columns),
+            on=tiles_off_boundary.columns,
+            how="anti",
+        )
+        return spans_in_geom, tiles_off_boundary
+
+    fill_polygon, fill_x, fill_y = _expand_span_arrays(
+        span_polygon, span_y, span_x_start, span_x_end
+    )
+    tiles_in_geom = _pixels_df(
+        polygon_ids,
+        np.concatenate([polygon_idx[line_edge], fill_polygon]),
+        np.concatenate([line_x, fill_x]),
+        np.concatenate([line_y, fill_y]),
+        unique_id_col,
+    )
+
+    # removing off boundary tiles that are actually in the interior
+    key_cols = (
+        [PIXEL_KEY_COL] if unique_id_col is None else [PIXEL_KEY_COL, unique_id_col]
+    )
+    tiles_off_boundary = tiles_off_boundary.join(tiles_in_geom, on=key_cols, how="anti")
+
+    return _unpack_pixels_df(tiles_in_geom, unique_id_col), _unpack_pixels_df(
+        tiles_off_boundary, unique_id_col
+    )
+
+# %% ../../notebooks/15_polygon_fill.ipynb 40
+SPAN_COLS = ["y", "x_start", "x_end"]
+SPAN_IDX_COL = "__span_idx__"
+SEGMENT_IDX_COL = "__segment_idx__"
+
+# %% ../../notebooks/15_polygon_fill.ipynb 41
+def merge_spans(
+    spans_df: pl.DataFrame,  # dataframe with y, x_start and x_end columns. All other columns are treated as ids.
+) -> pl.DataFrame:
+    """Merges overlapping and adjacent spans that have the same y and ids"""
+    id_cols = [col for col in spans_df.columns if col not in SPAN_COLS]
+    group_cols = id_cols + ["y"]
+
+    spans_df = spans_df.sort(group_cols + ["x_start"])
+    covered_x_end = pl.col("x_end").cum_max().shift(1).over(group_cols)
+    is_new_span = covered_x_end.is_null() | (pl.col("x_start") > covered_x_end + 1)
+
+    merged_spans = (
+        spans_df.with_columns(is_new_span.cum_sum().alias(SPAN_IDX_COL))
+        .group_by(SPAN_IDX_COL, maintain_order=True)
+        .agg(
+            pl.col(group_cols).first(),
+            pl.col("x_start").min(),
+            pl.col("x_end").max(),
+        )
+        .select(SPAN_COLS + id_cols)
+    )
+    return merged_spans
 
+
+def pixels_to_spans(
+    pixels_df: pl.DataFrame,  # dataframe with x and y columns. All other columns are treated as ids.
+    x_col: str = "x",
+    y_col: str = "y",
+) -> pl.DataFrame:
+    """Converts pixels to merged spans"""
+    id_cols = [col for col in pixels_df.columns if col not in [x_col, y_col]]
+    spans_df = pixels_df.select(
+        pl.col(y_col).alias("y"),
+        pl.col(x_col).alias("x_start"),
+        pl.col(x_col).alias("x_end"),
+        *id_cols,
+    )
+    return merge_spans(spans_df)
+
+# %% ../../notebooks/15_polygon_fill.ipynb 42
+def expand_spans(
+    spans_df: pl.DataFrame,  # dataframe with y, x_start and x_end columns. All other columns are treated as ids.
+) -> pl.DataFrame:
+    """Expands spans into a dataframe with a row per pixel"""
+    id_cols = [col for col in spans_df.columns if col not in SPAN_COLS]
+    span_idx, x, y = _expand_span_arrays(
+        np.arange(len(spans_df)),
+        spans_df["y"].to_numpy(),
+        spans_df["x_start"].to_numpy(),
+        spans_df["x_end"].to_numpy(),
+    )
+    pixels_df = pl.DataFrame(
+        [pl.Series("x", x, dtype=PIXEL_DTYPE), pl.Series("y", y, dtype=PIXEL_DTYPE)]
+    )
+    if id_cols:
+        pixels_df = pixels_df.with_columns(
+            spans_df.select(pl.col(id_cols).gather(span_idx))
+        )
+    return pixels_df
+
+
+def iter_expand_spans(
+    spans_df: pl.DataFrame,  # dataframe with y, x_start and x_end columns. All other columns are treated as ids.
+    chunk_size: int = 1_000_000,  # maximum number of pixels per chunk
+) -> Iterator[pl.DataFrame]:
+    """Lazily expands spans into dataframes with a row per pixel, at most chunk_size rows at a time"""
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size should be positive but instead is {chunk_size}")
+
+    n_pixels = np.maximum((spans_df["x_end"] - spans_df["x_start"] + 1).to_numpy(), 0)
+    pixel_end = np.cumsum(n_pixels)
+    pixel_start = pixel_end - n_pixels
+    total_pixels = int(pixel_end[-1]) if len(pixel_end) else 0
+
+    for chunk_start in range(0, total_pixels, chunk_size):
+        chunk_end = min(chunk_start + chunk_size, total_pixels)
+        # spans that overlap the chunk are trimmed to the chunk
+        first_span = np.searchsorted(pixel_end, chunk_start, side="right")
+        last_span = np.searchsorted(pixel_end, chunk_end - 1, side="right")
+        chunk = spans_df.slice(first_span, last_span - first_span + 1)
+
+        x_start = chunk["x_start"].to_numpy().copy()
+        x_end = chunk["x_end"].to_numpy().copy()
+        x_start[0] += chunk_start - pixel_start[first_span]
+        x_end[-1] = chunk["x_start"][-1] + (chunk_end - 1 - pixel_start[last_span])
+        chunk = chunk.with_columns(
+            pl.Series("x_start", x_start, dtype=chunk["x_start"].dtype),
+            pl.Series("x_end", x_end, dtype=chunk["x_end"].dtype),
+        )
+        yield expand_spans(chunk)
+
+# %% ../../notebooks/15_polygon_fill.ipynb 43
+def _row_major_keys(
+    y: np.ndarray,  # y pixel coordinates
+    x: np.ndarray,  # x pixel coordinates, from -2**31 up to 2**31
+) -> np.ndarray:
+    """Returns int64 keys that sort in the same order as (y, x). Unlike `pack_pixel_keys`, this holds for negative x"""
+    y = np.asarray(y, dtype=np.int64)
+    x = np.asarray(x, dtype=np.int64)
+    # x is shifted to be non-negative, so it never borrows from the bits of y
+    return (y << PIXEL_KEY_BITS) + (x + (1 << (PIXEL_KEY_BITS - 1)))
+
+
+def join_spans(
+    df: pl.DataFrame,  # dataframe with pixel coordinates
+    spans_df: pl.DataFrame,  # dataframe with y, x_start and x_end columns. All other columns are treated as ids.
+    x_col: str = "x",
+    y_col: str = "y",
+    on: Optional[
+        List[str]
+    ] = None,  # id columns in both dataframes that should also match
+) -> pl.DataFrame:
+    """Inner join of the rows of df to the spans that contain their pixel coordinates, without expanding the spans"""
+    on = [] if on is None else list(on)
+    id_cols = [col for col in spans_df.columns if col not in SPAN_COLS]
+
+    # the spans are split at every span endpoint. Each segment between consecutive endpoints is then
+    # either fully inside or fully outside a span, so a pixel only needs a binary search to find its segment
+    span_start = _row_major_keys(
+        spans_df["y"].to_numpy(), spans_df["x_start"].to_numpy()
+    )
+    span_end = _row_major_keys(
+        spans_df["y"].to_numpy(), spans_df["x_end"].to_numpy().astype(np.int64) + 1
+    )
+    endpoints = np.unique(np.concatenate([span_start, span_end]))
+    first_segment = np.searchsorted(endpoints, span_start)
+    n_segments = np.searchsorted(endpoints, span_end) - first_segment
+    segment_spans = pl.DataFrame(
+        {
+            SEGMENT_IDX_COL: np.repeat(first_segment, n_segments)
+            + _ragged_arange(n_segments),
+            SPAN_IDX_COL: np.repeat(
+                np.arange(len(spans_df), dtype=np.int64), n_segments
+            ),
+        }
+    )
+
+    pixel_keys = _row_major_keys(df[y_col].to_numpy(), df[x_col].to_numpy())
+    pixel_segment = np.searchsorted(endpoints, pixel_keys, side="right") - 1
+
+    span_ids = spans_df.select(
+        pl.int_range(pl.len(), dtype=pl.Int64).alias(SPAN_IDX_COL), *id_cols
+    )
+    joined = (
+        df.with_columns(pl.Series(SEGMENT_IDX_COL, pixel_segment))
+        .join(segment_spans, on=SEGMENT_IDX_COL, how="inner")
+        .join(span_ids, on=[SPAN_IDX_COL] + on, how="inner")
+        .drop([SEGMENT_IDX_COL, SPAN_IDX_COL])
+    )
+    return joined
+
+# %% ../../notebooks/15_polygon_fill.ipynb 45
+def _python_polygon_fill(
+    vertices_df: pl.DataFrame,
+    id_cols: List[str],
+    unique_id_col: Optional[
+        str
+    ],  # only given if the ids should be preserved in the output tiles
+) -> Tuple[pl.DataFrame, pl.DataFrame]:
+    has_unique_id_col = unique_id_col is not None
     polygon_ids = vertices_df.select(id_cols).unique(maintain_order=True).rows()
+    ring_col = RING_ID_COL if RING_ID_COL in vertices_df.columns else None
 
     tiles_in_geom = set()
     tiles_off_boundary = set()
     for polygon_id in polygon_ids:
         subpolygon_id, unique_id = polygon_id
-        filter_expr = (pl.col(SUBPOLYGON_ID_COL) == subpolygon_id) & (
-            pl.col(unique_id_col) == unique_id
+        filter_expr = (pl.col(id_cols[0]) == subpolygon_id) & (
+            pl.col(id_cols[1]) == unique_id
         )
         poly_vertices = vertices_df.filter(filter_expr)
 
         poly_vertices = poly_vertices.unique(maintain_order=True)
         voxel_traversal_results = voxel_traversal_scanline_fill(
-            poly_vertices, x_col="x", y_col="y"
+            poly_vertices, x_col="x", y_col="y", ring_col=ring_col
         )
         _tiles_in_geom = voxel_traversal_results["polygon_pixels"]
         _tiles_off_boundary = voxel_traversal_results["off_boundary_pixels"]
@@ -342,6 +960,261 @@ def fast_polygon_fill(
         schema=schema,
     )
 
-    result = {"tiles_in_geom": tiles_in_geom, "tiles_off_boundary": tiles_off_boundary}
+    return tiles_in_geom, tiles_off_boundary
+
+# %% ../../notebooks/15_polygon_fill.ipynb 46
+def fast_polygon_fill(
+    vertices_df: pl.DataFrame,  # integer vertices of all polygons in the AOI
+    unique_id_col: Optional[
+        str
+    ] = None,  # the ids under this column will be preserved in the output tiles
+    engine: str = "numpy",  # "numpy" fills all polygons at once with vectorized array operations, "python" fills one polygon at a time
+    return_spans: bool = False,  # if true, returns `spans_in_geom` (see `merge_spans`) instead of `tiles_in_geom`
+) -> Dict[str, pl.DataFrame]:
+
+    if engine not in FILL_ENGINES:
+        raise ValueError(
+            f"{engine} engine is not supported. Please select from these options {FILL_ENGINES}"
+        )
+
+    if unique_id_col is not None:
+        id_cols = [SUBPOLYGON_ID_COL, unique_id_col]
+        has_unique_id_col = True
+    else:
+        complement_cols = ["x", "y", SUBPOLYGON_ID_COL, RING_ID_COL]
+        unique_id_col = list(set(vertices_df.columns) - set(complement_cols))
+        assert len(unique_id_col) == 1
+        unique_id_col = unique_id_col[0]
+        id_cols = [SUBPOLYGON_ID_COL, unique_id_col]
+        has_unique_id_col = False
+
+    for col in id_cols:
+        assert col in vertices_df, f"{col} should be column in vertices_df"
+
+    output_id_col = unique_id_col if has_unique_id_col else None
+    if engine == "numpy":
+        tiles_in_geom, tiles_off_boundary = _numpy_polygon_fill(
+            vertices_df, id_cols, output_id_col, return_spans
+        )
+    else:
+        tiles_in_geom, tiles_off_boundary = _python_polygon_fill(
+            vertices_df, id_cols, output_id_col
+        )
+        if return_spans:
+            tiles_in_geom = pixels_to_spans(tiles_in_geom)
+
+    if return_spans:
+        result = {
+            "spans_in_geom": tiles_in_geom,
+            "tiles_off_boundary": tiles_off_boundary,
+        }
+    else:
+        result = {
+            "tiles_in_geom": tiles_in_geom,
+            "tiles_off_boundary": tiles_off_boundary,
+        }
 
     return result
+
+# %% ../../notebooks/15_polygon_fill.ipynb 63
+def _centroid_scanline_spans(
+    polygon_idx: np.ndarray,  # polygon index of each edge
+    x1: np.ndarray,
+    y1: np.ndarray,
+    x2: np.ndarray,
+    y2: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the polygon index, y, starting x and ending x (inclusive) of the spans of pixels whose centres are inside the polygons"""
+    # scanline j samples the pixel centres at j + 0.5. An edge crosses the scanlines in [min(y1, y2), max(y1, y2))
+    # so that a vertex shared by two edges is only counted once.
+    first_scanline = np.ceil(np.minimum(y1, y2) - 0.5).astype(np.int64)
+    end_scanline = np.ceil(np.maximum(y1, y2) - 0.5).astype(np.int64)
+    n_scanlines = np.maximum(end_scanline - first_scanline, 0)
+
+    edge = np.repeat(np.arange(len(x1), dtype=np.int64), n_scanlines)
+    scanline_y = np.repeat(first_scanline, n_scanlines) + _ragged_arange(n_scanlines)
+    scanline_centre = scanline_y + 0.5
+    inverse_slope = (x2[edge] - x1[edge]) / (y2[edge] - y1[edge])
+    intersection_x = x1[edge] + (scanline_centre - y1[edge]) * inverse_slope
+
+    span_polygon, span_y, span_x_start, span_x_end = _pair_intersections(
+        polygon_idx[edge], scanline_y, intersection_x
+    )
+
+    # pixels whose centres are in [x_start, x_end)
+    x_start = np.ceil(span_x_start - 0.5).astype(np.int64)
+    x_end = np.ceil(span_x_end - 0.5).astype(np.int64) - 1
+    is_nonempty = x_start <= x_end
+    return (
+        span_polygon[is_nonempty],
+        span_y[is_nonempty],
+        x_start[is_nonempty],
+        x_end[is_nonempty],
+    )
+
+# %% ../../notebooks/15_polygon_fill.ipynb 64
+def centroid_polygon_fill(
+    vertices_df: pl.DataFrame,  # vertices of all polygons in the AOI, in continuous pixel coordinates
+    unique_id_col: Optional[
+        str
+    ] = None,  # the ids under this column will be preserved in the output tiles
+    return_spans: bool = False,  # if true, returns the pixels as spans instead of individual pixels
+) -> pl.DataFrame:
+    """Fills the pixels whose centres are inside the polygons"""
+    if unique_id_col is not None:
+        id_cols = [SUBPOLYGON_ID_COL, unique_id_col]
+    else:
+        id_cols = [
+            col for col in vertices_df.columns if col not in ["x", "y", RING_ID_COL]
+        ]
+
+    for col in id_cols:
+        assert col in vertices_df, f"{col} should be column in vertices_df"
+
+    # every ring is closed separately, so that no edges are drawn between the rings of a polygon
+    polygon_ids, polygon_idx, row_idx = _group_vertices(vertices_df, id_cols)
+    x1 = vertices_df["x"].to_numpy()[row_idx].astype(np.float64)
+    y1 = vertices_df["y"].to_numpy()[row_idx].astype(np.float64)
+    x2, y2 = _polygon_edges(polygon_idx, x1, y1, _vertex_ring_ids(vertices_df, row_idx))
+
+    span_polygon, span_y, span_x_start, span_x_end = _centroid_scanline_spans(
+        polygon_idx, x1, y1, x2, y2
+    )
+    spans_in_geom = _spans_df(
+        polygon_ids, span_polygon, span_y, span_x_start, span_x_end, unique_id_col
+    )
+
+    if return_spans:
+        return spans_in_geom
+    return expand_spans(spans_in_geom)
+
+# %% ../../notebooks/15_polygon_fill.ipynb 68
+def _segment_pixels(
+    x1: np.ndarray,  # x of the start of each segment, in continuous pixel coordinates
+    y1: np.ndarray,  # y of the start of each segment, in continuous pixel coordinates
+    x2: np.ndarray,  # x of the end of each segment, in continuous pixel coordinates
+    y2: np.ndarray,  # y of the end of each segment, in continuous pixel coordinates
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the segment index, x and y of every pixel that each segment passes through"""
+    # split each segment at the pixel columns it passes through
+    first_col = np.floor(np.minimum(x1, x2)).astype(np.int64)
+    n_cols = np.floor(np.maximum(x1, x2)).astype(np.int64) - first_col + 1
+    segment = np.repeat(np.arange(len(x1), dtype=np.int64), n_cols)
+    col = np.repeat(first_col, n_cols) + _ragged_arange(n_cols)
+
+    x1, y1, x2, y2 = x1[segment], y1[segment], x2[segment], y2[segment]
+    piece_x_start = np.maximum(col, np.minimum(x1, x2))
+    piece_x_end = np.minimum(col + 1, np.maximum(x1, x2))
+    is_vertical = x1 == x2
+    slope = np.divide(y2 - y1, x2 - x1, out=np.zeros_like(x1), where=~is_vertical)
+    piece_y_start = np.where(is_vertical, y1, y1 + (piece_x_start - x1) * slope)
+    piece_y_end = np.where(is_vertical, y2, y1 + (piece_x_end - x1) * slope)
+
+    # each piece of the segment covers the rows between its end points
+    first_row = np.floor(np.minimum(piece_y_start, piece_y_end)).astype(np.int64)
+    n_rows = (
+        np.floor(np.maximum(piece_y_start, piece_y_end)).astype(np.int64)
+        - first_row
+        + 1
+    )
+    pixel_x = np.repeat(col, n_rows)
+    pixel_y = np.repeat(first_row, n_rows) + _ragged_arange(n_rows)
+    return np.repeat(segment, n_rows), pixel_x, pixel_y
+
+
+def boundary_pixels(
+    vertices_df: pl.DataFrame,  # vertices of all polygons in the AOI, in continuous pixel coordinates
+    unique_id_col: Optional[
+        str
+    ] = None,  # the ids under this column will be preserved in the output pixels
+) -> pl.DataFrame:
+    """Returns the pixels that the polygon edges pass through"""
+    if unique_id_col is not None:
+        id_cols = [SUBPOLYGON_ID_COL, unique_id_col]
+    else:
+        id_cols = [
+            col for col in vertices_df.columns if col not in ["x", "y", RING_ID_COL]
+        ]
+
+    polygon_ids, polygon_idx, row_idx = _group_vertices(vertices_df, id_cols)
+    x1 = vertices_df["x"].to_numpy()[row_idx].astype(np.float64)
+    y1 = vertices_df["y"].to_numpy()[row_idx].astype(np.float64)
+    x2, y2 = _polygon_edges(polygon_idx, x1, y1, _vertex_ring_ids(vertices_df, row_idx))
+
+    edge, pixel_x, pixel_y = _segment_pixels(x1, y1, x2, y2)
+    pixels = _pixels_df(polygon_ids, polygon_idx[edge], pixel_x, pixel_y, unique_id_col)
+    return _unpack_pixels_df(pixels, unique_id_col)
+
+# %% ../../notebooks/15_polygon_fill.ipynb 71
+def lines_to_vertices(
+    lines_gdf: gpd.GeoDataFrame,
+    unique_id_col: Optional[
+        str
+    ] = None,  # the ids under this column will be preserved in the output tiles
+) -> pl.DataFrame:
+    """Returns the vertices of all linestrings and multilinestrings, in the same format as `polygons_to_vertices`"""
+    lines_gdf = _explode_geometries(
+        lines_gdf, unique_id_col, "LineString", "linestrings or multilinestrings"
+    )
+    vertices_df = lines_gdf.get_coordinates().reset_index()
+    return pl.from_pandas(vertices_df)
+
+
+def points_to_vertices(
+    points_gdf: gpd.GeoDataFrame,
+    unique_id_col: Optional[
+        str
+    ] = None,  # the ids under this column will be preserved in the output tiles
+) -> pl.DataFrame:
+    """Returns the coordinates of all points and multipoints, in the same format as `polygons_to_vertices`"""
+    points_gdf = _explode_geometries(
+        points_gdf, unique_id_col, "Point", "points or multipoints"
+    )
+    vertices_df = points_gdf.get_coordinates().reset_index()
+    return pl.from_pandas(vertices_df)
+
+
+def line_pixels(
+    vertices_df: pl.DataFrame,  # vertices of all lines from `lines_to_vertices`, in continuous pixel coordinates
+    unique_id_col: Optional[
+        str
+    ] = None,  # the ids under this column will be preserved in the output pixels
+) -> pl.DataFrame:
+    """Returns the pixels that the lines pass through"""
+    if unique_id_col is not None:
+        id_cols = [SUBPOLYGON_ID_COL, unique_id_col]
+    else:
+        id_cols = [col for col in vertices_df.columns if col not in ["x", "y"]]
+
+    line_ids, line_idx, row_idx = _group_vertices(vertices_df, id_cols)
+    x = vertices_df["x"].to_numpy()[row_idx].astype(np.float64)
+    y = vertices_df["y"].to_numpy()[row_idx].astype(np.float64)
+
+    # unlike polygon edges, the last vertex of a line doesn't connect back to its first vertex
+    is_segment_start = np.zeros(len(line_idx), dtype=bool)
+    is_segment_start[:-1] = line_idx[:-1] == line_idx[1:]
+    segment_start = np.flatnonzero(is_segment_start)
+
+    segment, pixel_x, pixel_y = _segment_pixels(
+        x[segment_start], y[segment_start], x[segment_start + 1], y[segment_start + 1]
+    )
+    pixels = _pixels_df(
+        line_ids, line_idx[segment_start][segment], pixel_x, pixel_y, unique_id_col
+    )
+    return _unpack_pixels_df(pixels, unique_id_col)
+
+
+def point_pixels(
+    vertices_df: pl.DataFrame,  # coordinates of all points from `points_to_vertices`, in continuous pixel coordinates
+    unique_id_col: Optional[
+        str
+    ] = None,  # the ids under this column will be preserved in the output pixels
+) -> pl.DataFrame:
+    """Returns the pixels that contain the points"""
+    pixel_x = np.floor(vertices_df["x"].to_numpy()).astype(np.int64)
+    pixel_y = np.floor(vertices_df["y"].to_numpy()).astype(np.int64)
+    point_idx = np.arange(len(vertices_df), dtype=np.int64)
+
+    # every row is a point, so the rows are their own ids
+    pixels = _pixels_df(vertices_df, point_idx, pixel_x, pixel_y, unique_id_col)
+    return _unpack_pixels_df(pixels, unique_id_col)
@@ -1,26 +1,53 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../notebooks/00_grids.ipynb.
 
 # %% auto 0
-__all__ = ['SquareGridGenerator', 'FastSquareGridGenerator', 'H3GridGenerator', 'BingTileGridGenerator',
-           'FastBingTileGridGenerator']
+__all__ = ['SquareGridGenerator', 'FastSquareGridGenerator', 'H3GridGenerator', 'h3_ints_to_strs', 'h3_strs_to_ints',
+           'BingTileGridGenerator', 'FastBingTileGridGenerator', 'xyz_to_quadkey_int', 'quadkey_int_to_xyz',
+           'quadkey_int_zoom_level', 'quadkey_int_to_parent', 'quadkeys_to_ints', 'ints_to_quadkeys',
+           'AdaptiveBingTileGridGenerator', 'write_grid_parquet']
 
 # %% ../notebooks/00_grids.ipynb 5
+import json
 import logging
-from functools import reduce
-from typing import List, Tuple, Union, Optional, Iterable
+import os
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Executor, wait
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from functools import lru_cache, reduce
+from itertools import chain
+from typing import Any, Callable, Dict, List, Tuple, Union, Optional, Iterable, Iterator
 
 import h3
 import morecantile
 import numpy as np
 import pandas as pd
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 import warnings
+from h3.api import numpy_int as h3_int
 from fastcore.all import defaults, parallel
+from fastcore.parallel import ProcessPoolExecutor, progress_bar
 from fastcore.basics import patch
 from geopandas import GeoDataFrame, GeoSeries
 from pandas import DataFrame
-from pyproj import Transformer
-from shapely import box
+from pyproj import CRS, Transformer
+from shapely import (
+    STRtree,
+    area,
+    bounds,
+    box,
+    from_wkb,
+    get_coordinates,
+    get_num_coordinates,
+    get_parts,
+    intersection,
+    intersects,
+    linearrings,
+    polygons,
+    prepare,
+    to_wkb,
+)
 from shapely.geometry import Polygon, shape
 from shapely.prepared import prep
 
@@ -29,10 +56,31 @@ from geowrangler.gridding_utils import polygon_fill
 logger = logging.getLogger(__name__)
 
 # %% ../notebooks/00_grids.ipynb 7
+def _range_subset(
+    start: float,
+    stop: float,
+    lower: float,
+    upper: float,
+    step: float,
+) -> Tuple[Optional[int], np.ndarray]:
+    """Returns the index of the first value and the values of `np.arange(start, stop, step)` that are within lower and upper,
+    without allocating the full range"""
+    n = max(int(np.ceil((stop - start) / step)), 0)
+    # np.arange fills the values as start + i * delta
+    delta = (start + step) - start
+    first = min(max(int(np.floor((lower - start) / delta)) - 1, 0), n)
+    last = min(max(int(np.ceil((upper - start) / delta)) + 2, 0), n)
+    idx = np.arange(first, last)
+    values = start + idx * delta
+    mask = (values >= lower) & (values <= upper)
+    idx_offset = None if not mask.any() else idx[mask][0]
+    return idx_offset, values[mask]
+
+
 class SquareGridBoundary:
     """Reusing Boundary. x_min, y_min, x_max, and y_max are in the the target crs"""
 
-    BOUNDARY_TYPES = ["aoi_boundary", "custom_boundary"]
+    BOUNDARY_TYPES = ["aoi_boundary", "custom_boundary", "global_boundary"]
 
     def __init__(
         self,
@@ -57,21 +105,19 @@ class SquareGridBoundary:
         self, x_min: float, y_min: float, x_max: float, y_max: float, cell_size: float
     ) -> Tuple[float, List[float], float, List[float]]:
         """Returns a subset of grids from the orginal boundary based on the boundary and a grid size"""
-        xrange = np.arange(self.x_min, self.x_max, cell_size)
-        yrange = np.arange(self.y_min, self.y_max, cell_size)
         # Add cell_size buffer to catch cases where the bounds of the polygon are slightly outside
         # the bounds. This might happen to do floating point after reprojection/unary_union
-        x_mask = (xrange >= (x_min - cell_size)) & (xrange <= (x_max + cell_size))
-        y_mask = (yrange >= (y_min - cell_size)) & (yrange <= (y_max + cell_size))
-        x_idx = np.flatnonzero(x_mask)
-        x_idx_offset = None if len(x_idx) == 0 else x_idx[0]
-        y_idx = np.flatnonzero(y_mask)
-        y_idx_offset = None if len(y_idx) == 0 else y_idx[0]
+        x_idx_offset, xrange = _range_subset(
+            self.x_min, self.x_max, x_min - cell_size, x_max + cell_size, cell_size
+        )
+        y_idx_offset, yrange = _range_subset(
+            self.y_min, self.y_max, y_min - cell_size, y_max + cell_size, cell_size
+        )
         return (
             x_idx_offset,
-            xrange[x_mask],
+            xrange,
             y_idx_offset,
-            yrange[y_mask],
+            yrange,
         )
 
 # %% ../notebooks/00_grids.ipynb 8
@@ -81,8 +127,8 @@ class SquareGridGenerator:
         cell_size: float,  # height and width of a square cell in meters
         grid_projection: str = "EPSG:3857",  # projection of grid output
         boundary: Union[
-            SquareGridBoundary, List[float], Tuple[float]
-        ] = None,  # original boundary
+            SquareGridBoundary, List[float], Tuple[float], str
+        ] = None,  # original boundary. "global" snaps the cells to multiples of cell_size over the area of use of grid_projection, so the x, y indices of a cell are the same for any AOI
     ):
         self.cell_size = cell_size
         self.grid_projection = grid_projection
@@ -107,39 +153,83 @@ def create_cell(
 
 # %% ../notebooks/00_grids.ipynb 10
 @patch
-def create_grid_for_polygon(self: SquareGridGenerator, boundary, geometry):
+def _polygon_cells(
+    self: SquareGridGenerator, boundary, geometry
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the x and y indices and the cells that intersect the geometry, ordered by x and y"""
     x_idx_offset, xrange, y_idx_offset, yrange = boundary.get_range_subset(
         *geometry.bounds, cell_size=self.cell_size
     )
-    cells = {}
-    prepared_geometry = prep(geometry)
-    for x_idx, x in enumerate(xrange):
-        for y_idx, y in enumerate(yrange):
-            x_col = x_idx + x_idx_offset
-            y_col = y_idx + y_idx_offset
-            cell = self.create_cell(x, y)
-            if prepared_geometry.intersects(cell):
-                cells.update(
-                    {(x_col, y_col): {"x": x_col, "y": y_col, "geometry": cell}}
-                )
-    return cells
+    if len(xrange) == 0 or len(yrange) == 0:
+        return (
+            np.array([], dtype=np.int64),
+            np.array([], dtype=np.int64),
+            np.array([], dtype=object),
+        )
+
+    x_idx, y_idx = np.meshgrid(
+        np.arange(len(xrange)), np.arange(len(yrange)), indexing="ij"
+    )
+    x_idx, y_idx = x_idx.ravel(), y_idx.ravel()
+    x, y = xrange[x_idx], yrange[y_idx]
+    # same vertices as create_cell
+    coords = np.stack(
+        [
+            np.stack([x, y], axis=-1),
+            np.stack([x + self.cell_size, y], axis=-1),
+            np.stack([x + self.cell_size, y + self.cell_size], axis=-1),
+            np.stack([x, y + self.cell_size], axis=-1),
+        ],
+        axis=1,
+    )
+    cells = polygons(coords)
+
+    intersects_idx = np.sort(STRtree(cells).query(geometry, predicate="intersects"))
+    return (
+        x_idx[intersects_idx] + x_idx_offset,
+        y_idx[intersects_idx] + y_idx_offset,
+        cells[intersects_idx],
+    )
+
+
+@patch
+def create_grid_for_polygon(self: SquareGridGenerator, boundary, geometry):
+    """Returns the cells that intersect the geometry, keyed by their x and y indices"""
+    x_cols, y_cols, cells = self._polygon_cells(boundary, geometry)
+    return {
+        (x_col, y_col): {"x": x_col, "y": y_col, "geometry": cell}
+        for x_col, y_col, cell in zip(x_cols.tolist(), y_cols.tolist(), cells)
+    }
+
+
+def _cells_to_gdf(
+    x: np.ndarray,
+    y: np.ndarray,
+    cells: np.ndarray,
+    crs: str,
+) -> GeoDataFrame:
+    """Returns the cells as a GeoDataFrame with their x and y indices"""
+    return GeoDataFrame(
+        {"x": x, "y": y, "geometry": cells}, geometry="geometry", crs=crs
+    )
 
 # %% ../notebooks/00_grids.ipynb 11
 @patch
 def generate_grid(self: SquareGridGenerator, aoi_gdf: GeoDataFrame) -> GeoDataFrame:
     reprojected_gdf = aoi_gdf.to_crs(self.grid_projection)
-    boundary = setup_boundary(self.boundary, aoi_gdf, reprojected_gdf)
+    boundary = setup_boundary(self.boundary, aoi_gdf, reprojected_gdf, self.cell_size)
 
-    polygons = {}
     unary_union = reprojected_gdf.union_all(method="unary")
-    if isinstance(unary_union, Polygon):
-        polygons.update(self.create_grid_for_polygon(boundary, unary_union))
-    else:
-        for geom in unary_union.geoms:
-            polygons.update(self.create_grid_for_polygon(boundary, geom))
-    if polygons:
-        dest = GeoDataFrame(
-            list(polygons.values()), geometry="geometry", crs=self.grid_projection
+    geoms = [unary_union] if isinstance(unary_union, Polygon) else unary_union.geoms
+    polygon_cells = [self._polygon_cells(boundary, geom) for geom in geoms]
+    polygon_cells = [(x, y, cells) for x, y, cells in polygon_cells if len(cells) > 0]
+    if polygon_cells:
+        x, y, cells = (np.concatenate(arrays) for arrays in zip(*polygon_cells))
+        # a cell can intersect more than one polygon of the unary union
+        _, first_idx = np.unique(polygon_fill.pack_pixel_keys(x, y), return_index=True)
+        first_idx = np.sort(first_idx)
+        dest = _cells_to_gdf(
+            x[first_idx], y[first_idx], cells[first_idx], self.grid_projection
         )
         dest = dest.to_crs(aoi_gdf.crs)
         return dest
@@ -149,22 +239,145 @@ def generate_grid(self: SquareGridGenerator, aoi_gdf: GeoDataFrame) -> GeoDataFr
         )
 
 # %% ../notebooks/00_grids.ipynb 12
+@patch
+def generate_grid_iter(
+    self: SquareGridGenerator,
+    aoi_gdf: GeoDataFrame,
+    chunk_size: int = 100_000,  # maximum number of cells per chunk
+) -> Iterator[GeoDataFrame]:
+    """Generates the grid as GeoDataFrames of at most chunk_size cells.
+    Only the cells of one polygon and the x, y indices of the polygons that share cells with later polygons are kept in memory.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size should be positive but instead is {chunk_size}")
+
+    reprojected_gdf = aoi_gdf.to_crs(self.grid_projection)
+    boundary = setup_boundary(self.boundary, aoi_gdf, reprojected_gdf, self.cell_size)
+
+    geoms = get_parts(reprojected_gdf.union_all(method="unary"))
+
+    # a cell can intersect more than one polygon of the unary union, but only
+    # polygons whose bounds are less than a cell apart can share cells
+    part_bounds = bounds(geoms) + np.array([-1, -1, 1, 1]) * self.cell_size
+    part_boxes = box(*part_bounds.T)
+    geom_idx, other_idx = STRtree(part_boxes).query(part_boxes, predicate="intersects")
+    is_earlier = other_idx < geom_idx
+    geom_idx, other_idx = geom_idx[is_earlier], other_idx[is_earlier]
+    order = np.argsort(geom_idx, kind="stable")
+    geom_idx, other_idx = geom_idx[order], other_idx[order]
+    earlier_parts = np.split(
+        other_idx, np.searchsorted(geom_idx, np.arange(1, len(geoms)))
+    )
+    # the keys of a polygon are dropped after the last polygon that can share its cells
+    last_sharing_part = np.full(len(geoms), -1)
+    np.maximum.at(last_sharing_part, other_idx, geom_idx)
+
+    part_keys = {}
+    pending_x, pending_y, pending_cells = [], [], []
+    n_pending = 0
+    for part_idx, geom in enumerate(geoms):
+        x, y, cells = self._polygon_cells(boundary, geom)
+        keys = polygon_fill.pack_pixel_keys(x, y)
+        is_new = np.ones(len(keys), dtype=bool)
+        for other in earlier_parts[part_idx]:
+            is_new &= ~np.isin(keys, part_keys[other])
+            if last_sharing_part[other] == part_idx:
+                del part_keys[other]
+        if last_sharing_part[part_idx] > part_idx:
+            part_keys[part_idx] = keys
+
+        pending_x.append(x[is_new])
+        pending_y.append(y[is_new])
+        pending_cells.append(cells[is_new])
+        n_pending += is_new.sum()
+        while n_pending >= chunk_size:
+            x, y, cells = (
+                np.concatenate(arrays)
+                for arrays in (pending_x, pending_y, pending_cells)
+            )
+            chunk = _cells_to_gdf(
+                x[:chunk_size], y[:chunk_size], cells[:chunk_size], self.grid_projection
+            )
+            yield chunk.to_crs(aoi_gdf.crs)
+            pending_x, pending_y, pending_cells = (
+                [x[chunk_size:]],
+                [y[chunk_size:]],
+                [cells[chunk_size:]],
+            )
+            n_pending -= chunk_size
+    if n_pending > 0:
+        x, y, cells = (
+            np.concatenate(arrays) for arrays in (pending_x, pending_y, pending_cells)
+        )
+        yield _cells_to_gdf(x, y, cells, self.grid_projection).to_crs(aoi_gdf.crs)
+
+# %% ../notebooks/00_grids.ipynb 13
+@lru_cache(maxsize=None)
+def _get_transformer(crs_from: CRS, crs_to: CRS) -> Transformer:
+    """Returns a cached transformer between two CRS, with x, y (easting, northing or lng, lat) axis order"""
+    return Transformer.from_crs(crs_from, crs_to, always_xy=True)
+
+
+GLOBAL_BOUNDARY = "global"
+
+
+def _get_global_boundary(
+    grid_projection: str,
+    cell_size: float,
+) -> SquareGridBoundary:
+    """Returns the area of use of grid_projection snapped outwards to multiples of cell_size.
+    The cell indices only depend on grid_projection and cell_size, so they are the same for any AOI.
+    """
+    grid_crs = CRS.from_user_input(grid_projection)
+    if grid_crs.area_of_use is None:
+        raise ValueError(
+            f"{grid_projection} has no area of use, so it has no global boundary. Please use a custom boundary instead"
+        )
+
+    transformer = _get_transformer(CRS.from_epsg(4326), grid_crs)
+    x_min, y_min, x_max, y_max = transformer.transform_bounds(
+        *grid_crs.area_of_use.bounds
+    )
+    x_min, y_min = (
+        np.floor(x_min / cell_size) * cell_size,
+        np.floor(y_min / cell_size) * cell_size,
+    )
+    x_max, y_max = (
+        np.ceil(x_max / cell_size) * cell_size,
+        np.ceil(y_max / cell_size) * cell_size,
+    )
+
+    max_cells = np.iinfo(np.int32).max
+    if max(x_max - x_min, y_max - y_min) / cell_size > max_cells:
+        raise ValueError(
+            f"The global boundary of {grid_projection} has more than {max_cells:,} cells along an axis. Please use a larger cell_size or a custom boundary"
+        )
+    return SquareGridBoundary(
+        x_min, y_min, x_max, y_max, boundary_type="global_boundary"
+    )
+
+
 def setup_boundary(
-    boundary: Optional[Union[SquareGridGenerator, Iterable[float]]],
+    boundary: Optional[Union[SquareGridGenerator, Iterable[float], str]],
     aoi_gdf: GeoDataFrame,
     reprojected_gdf: GeoDataFrame,
+    cell_size: Optional[float] = None,  # only needed for the global boundary
 ) -> SquareGridBoundary:
 
-    if boundary is None:
+    if isinstance(boundary, str):
+        if boundary != GLOBAL_BOUNDARY:
+            raise ValueError(
+                f'{boundary} boundary is not supported. Please use "{GLOBAL_BOUNDARY}", a SquareGridBoundary or the bounds of the boundary'
+            )
+        boundary = _get_global_boundary(reprojected_gdf.crs, cell_size)
+    elif boundary is None:
         boundary = SquareGridBoundary(
             *reprojected_gdf.total_bounds, boundary_type="aoi_boundary"
         )
     elif isinstance(boundary, SquareGridBoundary):
         boundary = boundary
     else:
-        transformer = Transformer.from_crs(
-            aoi_gdf.crs, reprojected_gdf.crs, always_xy=True
-        )
+        transformer = _get_transformer(aoi_gdf.crs, reprojected_gdf.crs)
         x_min, y_min = transformer.transform(boundary[0], boundary[1])
         x_max, y_max = transformer.transform(boundary[2], boundary[3])
         boundary = SquareGridBoundary(
@@ -191,85 +404,577 @@ def is_aoi_within_boundary(
     is_within_bounds = is_x_within_bounds & is_y_within_bounds
     return is_within_bounds
 
-# %% ../notebooks/00_grids.ipynb 14
+# %% ../notebooks/00_grids.ipynb 15
 class FastSquareGridGenerator:
     PIXEL_DTYPE = polygon_fill.PIXEL_DTYPE
     SUBPOLYGON_ID_COL = polygon_fill.SUBPOLYGON_ID_COL
+    OUTPUT_TYPES = ["pandas", "spans", "polars", "arrow"]
+    PREDICATES = ["intersects", "centroid"]
+    BOUNDARY_CORRECTION_TYPES = ["union", "strtree"]
 
     def __init__(
         self,
         cell_size: float,  # height and width of a square cell in meters
         grid_projection: str = "EPSG:3857",  # planar projection of grid
         boundary: Union[
-            SquareGridBoundary, Iterable[float]
-        ] = None,  # original boundary
+            SquareGridBoundary, Iterable[float], str
+        ] = None,  # original boundary. "global" snaps the cells to multiples of cell_size over the area of use of grid_projection, so the x, y indices of a cell are the same for any AOI
+        reproject_output: bool = True,  # if False, the cells are returned in grid_projection instead of the crs of the AOI
+        boundary_correction: Optional[
+            str
+        ] = None,  # "union" checks the off boundary cells against the union of all polygon boundaries, "strtree" checks each cell only against the boundaries of the polygons with its id. Defaults to "strtree" if unique_id_col is given, otherwise "union".
     ):
         self.cell_size = cell_size
         self.grid_projection = grid_projection
         self.boundary = boundary
+        self.reproject_output = reproject_output
+        self.boundary_correction = boundary_correction
 
         if self.cell_size <= 0:
             raise ValueError(f"cell_size should be positive but instead is {cell_size}")
+        if (
+            self.boundary_correction is not None
+            and self.boundary_correction not in self.BOUNDARY_CORRECTION_TYPES
+        ):
+            raise ValueError(
+                f"{self.boundary_correction} boundary_correction is not supported. Please select from these options {self.BOUNDARY_CORRECTION_TYPES}"
+            )
 
-# %% ../notebooks/00_grids.ipynb 15
+# %% ../notebooks/00_grids.ipynb 16
 @patch
 def generate_grid(
     self: FastSquareGridGenerator,
-    aoi_gdf: GeoDataFrame,
+    aoi_gdf: GeoDataFrame,  # polygons, lines or points. Lines are gridded by the cells they pass through and points by the cell that contains them.
     unique_id_col: Optional[
         str
     ] = None,  # the ids under this column will be preserved in the output tiles
-) -> Union[GeoDataFrame, pd.DataFrame]:
+    output: str = "pandas",  # "pandas" returns a GeoDataFrame of cells. "polars" and "arrow" return a polars DataFrame or pyarrow Table with the cells as a GeoArrow WKB geometry column, without creating shapely geometries. "spans" returns a polars DataFrame of horizontal runs of cells with y, x_start and x_end columns (see `polygon_fill.merge_spans`)
+    n_workers: int = 1,  # number of processes used to fill the AOI polygons. If more than 1, the polygons are split into shards with similar vertex counts.
+    predicate: str = "intersects",  # "intersects" returns every cell that touches the AOI. "centroid" only returns the cells whose centre is inside the AOI, which skips the boundary error correction.
+    coverage_fraction: bool = False,  # if True, adds a coverage_fraction column with the share of each cell's area inside the AOI (or inside the polygons with the same id if unique_id_col is given)
+) -> Union[GeoDataFrame, pd.DataFrame, pl.DataFrame, pa.Table]:
+
+    if output not in self.OUTPUT_TYPES:
+        raise ValueError(
+            f"{output} output is not supported. Please select from these options {self.OUTPUT_TYPES}"
+        )
+    if predicate not in self.PREDICATES:
+        raise ValueError(
+            f"{predicate} predicate is not supported. Please select from these options {self.PREDICATES}"
+        )
+
+    return_spans = output == "spans"
+    if return_spans and coverage_fraction:
+        raise ValueError(f"coverage_fraction is not supported for {output} output")
+
+    tiles_in_geom, boundary = self._generate_tiles(
+        aoi_gdf, unique_id_col, return_spans, n_workers, predicate
+    )
+    if return_spans:
+        return tiles_in_geom
+
+    cell_coverage = None
+    if coverage_fraction:
+        coverage_inputs = self._get_coverage_inputs(aoi_gdf, boundary, unique_id_col)
+        cell_coverage = self._coverage_fraction(
+            tiles_in_geom, boundary, unique_id_col, coverage_inputs
+        )
+
+    return self._tiles_to_output(
+        tiles_in_geom, boundary, unique_id_col, aoi_gdf.crs, cell_coverage, output
+    )
+
+# %% ../notebooks/00_grids.ipynb 17
+@patch
+def generate_grid_iter(
+    self: FastSquareGridGenerator,
+    aoi_gdf: GeoDataFrame,  # polygons, lines or points. Lines are gridded by the cells they pass through and points by the cell that contains them.
+    unique_id_col: Optional[
+        str
+    ] = None,  # the ids under this column will be preserved in the output tiles
+    chunk_size: int = 100_000,  # maximum number of cells per chunk
+    n_workers: int = 1,  # number of processes used to fill the AOI polygons
+    predicate: str = "intersects",  # "intersects" returns every cell that touches the AOI. "centroid" only returns the cells whose centre is inside the AOI, which skips the boundary error correction.
+    coverage_fraction: bool = False,  # if True, adds a coverage_fraction column with the share of each cell's area inside the AOI (or inside the polygons with the same id if unique_id_col is given)
+    output: str = "pandas",  # "pandas" yields GeoDataFrames. "polars" and "arrow" yield polars DataFrames or pyarrow Tables with a GeoArrow WKB geometry column.
+) -> Iterator[Union[GeoDataFrame, pl.DataFrame, pa.Table]]:
+    """Generates the grid as GeoDataFrames of at most chunk_size cells, ordered by id, y and x.
+    Only the spans of the grid are kept in memory, so the full grid is never materialized.
+    """
+    if output not in ITER_OUTPUT_TYPES:
+        raise ValueError(
+            f"{output} output is not supported. Please select from these options {ITER_OUTPUT_TYPES}"
+        )
+    if predicate not in self.PREDICATES:
+        raise ValueError(
+            f"{predicate} predicate is not supported. Please select from these options {self.PREDICATES}"
+        )
+    spans_in_geom, boundary = self._generate_tiles(
+        aoi_gdf, unique_id_col, True, n_workers, predicate
+    )
+    if coverage_fraction:
+        coverage_inputs = self._get_coverage_inputs(aoi_gdf, boundary, unique_id_col)
+
+    for tiles_in_geom in polygon_fill.iter_expand_spans(spans_in_geom, chunk_size):
+        cell_coverage = None
+        if coverage_fraction:
+            cell_coverage = self._coverage_fraction(
+                tiles_in_geom, boundary, unique_id_col, coverage_inputs
+            )
+        yield self._tiles_to_output(
+            tiles_in_geom, boundary, unique_id_col, aoi_gdf.crs, cell_coverage, output
+        )
 
+# %% ../notebooks/00_grids.ipynb 18
+@patch
+def _generate_tiles(
+    self: FastSquareGridGenerator,
+    aoi_gdf: GeoDataFrame,
+    unique_id_col: Optional[str],
+    return_spans: bool,
+    n_workers: int,
+    predicate: str = "intersects",
+) -> Tuple[pl.DataFrame, SquareGridBoundary]:
+    """Returns the tiles (or spans of tiles) in the AOI and the boundary used to compute them"""
     reprojected_gdf = aoi_gdf.to_crs(self.grid_projection)
-    boundary = setup_boundary(self.boundary, aoi_gdf, reprojected_gdf)
+    boundary = setup_boundary(self.boundary, aoi_gdf, reprojected_gdf, self.cell_size)
 
-    vertices = polygon_fill.polygons_to_vertices(reprojected_gdf, unique_id_col)
+    polygons_gdf, lines_gdf, points_gdf = _split_geometry_types(reprojected_gdf)
+    tiles = []
+    if not polygons_gdf.empty or (lines_gdf.empty and points_gdf.empty):
+        tiles.append(
+            self._generate_polygon_tiles(
+                polygons_gdf,
+                boundary,
+                unique_id_col,
+                return_spans,
+                n_workers,
+                predicate,
+            )
+        )
+    if not (lines_gdf.empty and points_gdf.empty):
+        tiles.append(
+            self._line_and_point_tiles(
+                lines_gdf, points_gdf, boundary, unique_id_col, return_spans
+            )
+        )
+    return _concat_tiles(tiles, return_spans), boundary
+
+
+@patch
+def _generate_polygon_tiles(
+    self: FastSquareGridGenerator,
+    polygons_gdf: GeoDataFrame,  # polygons in grid_projection
+    boundary: SquareGridBoundary,
+    unique_id_col: Optional[str],
+    return_spans: bool,
+    n_workers: int,
+    predicate: str = "intersects",
+) -> pl.DataFrame:
+    vertices = polygon_fill.polygons_to_vertices(polygons_gdf, unique_id_col)
     if boundary.boundary_type != "aoi_boundary":
         vertices = self._remove_out_of_bounds_polygons(vertices, boundary)
+    if predicate == "centroid":
+        # the cell centres are evaluated directly, so there are no boundary cells to correct
+        vertices = self._northingeasting_to_xy(
+            vertices, boundary, northing_col="y", easting_col="x", floor=False
+        )
+        return polygon_fill.centroid_polygon_fill(
+            vertices, unique_id_col, return_spans=return_spans
+        )
+
     vertices = self._northingeasting_to_xy(
         vertices, boundary, northing_col="y", easting_col="x"
     )
 
-    polygon_fill_result = polygon_fill.fast_polygon_fill(vertices, unique_id_col)
-    tiles_in_geom = polygon_fill_result["tiles_in_geom"]
-    bboxes = self._xy_to_bbox(tiles_in_geom, boundary, "x", "y")
+    polygons = polygon_fill.explode_polygons(polygons_gdf, unique_id_col).geometry
+    boundary_correction = _resolve_boundary_correction(
+        self.boundary_correction, unique_id_col
+    )
+    if n_workers > 1:
+        tiles_in_geom = _parallel_fill_polygons(
+            vertices,
+            polygons,
+            self,
+            unique_id_col,
+            return_spans,
+            n_workers,
+            boundary=boundary,
+            boundary_correction=boundary_correction,
+        )
+    else:
+        tiles_in_geom = _fill_polygons(
+            (vertices, polygons),
+            self,
+            unique_id_col,
+            return_spans,
+            boundary=boundary,
+            boundary_correction=boundary_correction,
+        )
+    return tiles_in_geom
 
-    # this is error correction on the polygon boundary (not the square boundary)
-    tiles_off_boundary = polygon_fill_result["tiles_off_boundary"]
-    if not tiles_off_boundary.is_empty():
-        off_boundary_bboxes = self._xy_to_bbox(tiles_off_boundary, boundary, "x", "y")
-        all_polygon_boundary = reprojected_gdf.boundary.union_all(method="unary")
-        intersects_boundary_bool = off_boundary_bboxes.intersects(all_polygon_boundary)
 
-        addtl_tiles_in_geom = tiles_off_boundary.filter(
-            pl.Series(intersects_boundary_bool)
+@patch
+def _line_and_point_tiles(
+    self: FastSquareGridGenerator,
+    lines_gdf: GeoDataFrame,  # lines in grid_projection
+    points_gdf: GeoDataFrame,  # points in grid_projection
+    boundary: SquareGridBoundary,
+    unique_id_col: Optional[str],
+    return_spans: bool,
+) -> pl.DataFrame:
+    """Returns the cells (or spans of cells) that the lines pass through and that contain the points"""
+
+    def to_xy(vertices: pl.DataFrame) -> pl.DataFrame:
+        if boundary.boundary_type != "aoi_boundary":
+            vertices = self._remove_out_of_bounds_polygons(vertices, boundary)
+        return self._northingeasting_to_xy(
+            vertices, boundary, northing_col="y", easting_col="x", floor=False
         )
-        addtl_boundary_bboxes = off_boundary_bboxes[intersects_boundary_bool].copy()
 
-        tiles_in_geom = pl.concat([tiles_in_geom, addtl_tiles_in_geom])
-        bboxes = pd.concat([bboxes, addtl_boundary_bboxes], ignore_index=True)
+    line_vertices = to_xy(polygon_fill.lines_to_vertices(lines_gdf, unique_id_col))
+    point_vertices = to_xy(polygon_fill.points_to_vertices(points_gdf, unique_id_col))
+    return _line_and_point_pixels(
+        line_vertices, point_vertices, unique_id_col, return_spans
+    )
+
+
+@patch
+def _tiles_to_output(
+    self: FastSquareGridGenerator,
+    tiles_in_geom: pl.DataFrame,
+    boundary: SquareGridBoundary,
+    unique_id_col: Optional[str],
+    crs,  # crs of the output
+    coverage_fraction: Optional[
+        np.ndarray
+    ] = None,  # share of each cell's area inside the AOI, from `_coverage_fraction`
+    output: str = "pandas",
+) -> Union[GeoDataFrame, pl.DataFrame, pa.Table]:
+    is_reprojected = (
+        self.reproject_output and CRS.from_user_input(self.grid_projection) != crs
+    )
 
     column_order = ["x", "y"]
     if unique_id_col is not None:
         column_order += [unique_id_col]
     assert set(tiles_in_geom.columns) == set(column_order)
     tiles_in_geom = tiles_in_geom.select(column_order)
+    if coverage_fraction is not None:
+        tiles_in_geom = tiles_in_geom.with_columns(
+            pl.Series(COVERAGE_FRACTION_COL, coverage_fraction)
+        )
+
+    if output in TABLE_OUTPUT_TYPES:
+        if is_reprojected:
+            corners = self._xy_to_reprojected_corners(
+                tiles_in_geom, boundary, "x", "y", crs
+            )
+        else:
+            corners = _bounds_to_corners(
+                *self._xy_to_bounds(tiles_in_geom, boundary, "x", "y")
+            )
+            crs = self.grid_projection
+        return _tiles_to_table(tiles_in_geom, corners, crs, output)
 
+    if is_reprojected:
+        bboxes = self._xy_to_reprojected_bbox(tiles_in_geom, boundary, "x", "y", crs)
+    else:
+        bboxes = self._xy_to_bbox(tiles_in_geom, boundary, "x", "y")
     tiles_in_geom = GeoDataFrame(tiles_in_geom.to_pandas(), geometry=bboxes)
-    if tiles_in_geom.crs != aoi_gdf.crs:
-        tiles_in_geom = tiles_in_geom.to_crs(aoi_gdf.crs)
+    return tiles_in_geom
+
+# %% ../notebooks/00_grids.ipynb 19
+LINE_TYPES = ["LineString", "MultiLineString"]
+POINT_TYPES = ["Point", "MultiPoint"]
+
 
+def _split_geometry_types(
+    aoi_gdf: GeoDataFrame,
+) -> Tuple[GeoDataFrame, GeoDataFrame, GeoDataFrame]:
+    """Splits the AOI into polygons, lines and points. Any other geometry type is left with the polygons."""
+    is_line = aoi_gdf.geom_type.isin(LINE_TYPES)
+    is_point = aoi_gdf.geom_type.isin(POINT_TYPES)
+    return aoi_gdf[~is_line & ~is_point], aoi_gdf[is_line], aoi_gdf[is_point]
+
+
+def _line_and_point_pixels(
+    line_vertices: pl.DataFrame,  # from `polygon_fill.lines_to_vertices`, in continuous tile coordinates
+    point_vertices: pl.DataFrame,  # from `polygon_fill.points_to_vertices`, in continuous tile coordinates
+    unique_id_col: Optional[str],
+    return_spans: bool,
+) -> pl.DataFrame:
+    tiles = []
+    if not line_vertices.is_empty():
+        tiles.append(polygon_fill.line_pixels(line_vertices, unique_id_col))
+    if not point_vertices.is_empty():
+        tiles.append(polygon_fill.point_pixels(point_vertices, unique_id_col))
+    tiles_in_geom = pl.concat(tiles).unique(maintain_order=True)
+    if return_spans:
+        return polygon_fill.pixels_to_spans(tiles_in_geom)
     return tiles_in_geom
 
-# %% ../notebooks/00_grids.ipynb 16
+
+def _concat_tiles(
+    tiles: List[
+        pl.DataFrame
+    ],  # tiles (or spans of tiles) of the polygons, lines and points
+    return_spans: bool,
+) -> pl.DataFrame:
+    if len(tiles) == 1:
+        return tiles[0]
+    tiles_in_geom = pl.concat([tiles_df.select(tiles[0].columns) for tiles_df in tiles])
+    if return_spans:
+        return polygon_fill.merge_spans(tiles_in_geom)
+    return tiles_in_geom.unique(maintain_order=True)
+
+# %% ../notebooks/00_grids.ipynb 20
+TABLE_OUTPUT_TYPES = ["polars", "arrow"]
+ITER_OUTPUT_TYPES = ["pandas"] + TABLE_OUTPUT_TYPES
+GEOMETRY_COL = "geometry"
+# little endian WKB of a polygon with a single closed ring of 5 points
+WKB_POLYGON_DTYPE = np.dtype(
+    [
+        ("byte_order", "u1"),
+        ("geometry_type", "<u4"),
+        ("n_rings", "<u4"),
+        ("n_points", "<u4"),
+        ("coords", "<f8", (5, 2)),
+    ]
+)
+
+
+def _bounds_to_corners(
+    minx: np.ndarray,
+    miny: np.ndarray,
+    maxx: np.ndarray,
+    maxy: np.ndarray,
+) -> np.ndarray:
+    """Returns the corners of each box with shape (n, 4, 2), in the same order as shapely.box"""
+    return np.stack(
+        [
+            np.stack([maxx, miny], axis=-1),
+            np.stack([maxx, maxy], axis=-1),
+            np.stack([minx, maxy], axis=-1),
+            np.stack([minx, miny], axis=-1),
+        ],
+        axis=1,
+    )
+
+
+def _corners_to_wkb(
+    corners: np.ndarray,  # corners of each polygon with shape (n, 4, 2)
+) -> pa.Array:
+    """Writes the polygons as WKB directly into a single buffer, without creating shapely geometries"""
+    n_polygons = len(corners)
+    wkb = np.empty(n_polygons, dtype=WKB_POLYGON_DTYPE)
+    wkb["byte_order"] = 1
+    wkb["geometry_type"] = 3
+    wkb["n_rings"] = 1
+    wkb["n_points"] = 5
+    wkb["coords"][:, :4] = corners
+    wkb["coords"][:, 4] = corners[:, 0]
+
+    offsets = np.arange(n_polygons + 1, dtype=np.int64) * WKB_POLYGON_DTYPE.itemsize
+    return pa.Array.from_buffers(
+        pa.large_binary(), n_polygons, [None, pa.py_buffer(offsets), pa.py_buffer(wkb)]
+    )
+
+
+def _geoarrow_wkb_field(crs) -> pa.Field:
+    """Geometry field tagged as GeoArrow WKB, so readers like `GeoDataFrame.from_arrow` restore the geometries and crs"""
+    extension_metadata = {"crs": CRS.from_user_input(crs).to_json_dict()}
+    return pa.field(
+        GEOMETRY_COL,
+        pa.large_binary(),
+        metadata={
+            "ARROW:extension:name": "geoarrow.wkb",
+            "ARROW:extension:metadata": json.dumps(extension_metadata),
+        },
+    )
+
+
+def _tiles_to_table(
+    tiles_in_geom: pl.DataFrame,
+    corners: Optional[
+        np.ndarray
+    ],  # corners of each tile with shape (n, 4, 2). If None, no geometry column is added.
+    crs,  # crs of the corners
+    output: str,  # "polars" or "arrow"
+) -> Union[pl.DataFrame, pa.Table]:
+    table = tiles_in_geom.to_arrow()
+    if corners is not None:
+        table = table.append_column(_geoarrow_wkb_field(crs), _corners_to_wkb(corners))
+    if output == "polars":
+        return pl.from_arrow(table)
+    return table
+
+# %% ../notebooks/00_grids.ipynb 21
+COVERAGE_FRACTION_COL = "coverage_fraction"
+CELL_IDX_COL = "__cell_idx__"
+MAX_PIECE_VERTICES = 256
+MAX_SUBDIVISIONS = 32
+
+
+def _subdivide_polygons(
+    geoms: np.ndarray,
+    max_vertices: int = MAX_PIECE_VERTICES,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Splits the polygons in half along their longer side until each piece has at most max_vertices.
+    Returns the pieces and the index of the polygon each piece came from."""
+    pieces, piece_idx = [], []
+    to_split, to_split_idx = geoms, np.arange(len(geoms))
+    for _ in range(MAX_SUBDIVISIONS):
+        is_small = get_num_coordinates(to_split) <= max_vertices
+        pieces.append(to_split[is_small])
+        piece_idx.append(to_split_idx[is_small])
+        to_split, to_split_idx = to_split[~is_small], to_split_idx[~is_small]
+        if len(to_split) == 0:
+            break
+
+        minx, miny, maxx, maxy = bounds(to_split).T
+        is_wide = (maxx - minx) >= (maxy - miny)
+        midx, midy = (minx + maxx) / 2, (miny + maxy) / 2
+        first_half = box(
+            minx, miny, np.where(is_wide, midx, maxx), np.where(is_wide, maxy, midy)
+        )
+        second_half = box(
+            np.where(is_wide, midx, minx), np.where(is_wide, miny, midy), maxx, maxy
+        )
+        halves = intersection(
+            np.concatenate([to_split, to_split]),
+            np.concatenate([first_half, second_half]),
+        )
+        halves_idx = np.concatenate([to_split_idx, to_split_idx])
+
+        # the halves can have several parts, including lines where the polygon touches the split
+        parts, part_idx = get_parts(halves, return_index=True)
+        is_polygon = area(parts) > 0
+        to_split, to_split_idx = parts[is_polygon], halves_idx[part_idx[is_polygon]]
+
+    pieces.append(to_split)
+    piece_idx.append(to_split_idx)
+    return np.concatenate(pieces), np.concatenate(piece_idx)
+
+
+@patch
+def _get_coverage_inputs(
+    self: FastSquareGridGenerator,
+    aoi_gdf: GeoDataFrame,
+    boundary: SquareGridBoundary,
+    unique_id_col: Optional[str],
+) -> Tuple[pl.DataFrame, pl.DataFrame, np.ndarray, Optional[np.ndarray]]:
+    """Returns the cells crossed by the AOI edges, the spans of cells with their centre in the AOI,
+    and the AOI polygons split into small pieces (with their ids if unique_id_col is given)
+    """
+    reprojected_gdf = aoi_gdf.to_crs(self.grid_projection)
+    vertices = polygon_fill.polygons_to_vertices(reprojected_gdf, unique_id_col)
+    vertices = self._northingeasting_to_xy(
+        vertices, boundary, northing_col="y", easting_col="x", floor=False
+    )
+    edge_cells = polygon_fill.boundary_pixels(vertices, unique_id_col)
+    centroid_spans = polygon_fill.centroid_polygon_fill(
+        vertices, unique_id_col, return_spans=True
+    )
+
+    if unique_id_col is None:
+        # overlapping polygons should only be counted once
+        aoi_polygons = np.array([reprojected_gdf.union_all(method="unary")])
+        aoi_ids = None
+    else:
+        exploded_polygons = polygon_fill.explode_polygons(
+            reprojected_gdf, unique_id_col
+        ).geometry
+        aoi_polygons = np.asarray(exploded_polygons.values)
+        aoi_ids = exploded_polygons.index.get_level_values(unique_id_col).to_numpy()
+
+    pieces, piece_polygon_idx = _subdivide_polygons(aoi_polygons)
+    piece_ids = None if aoi_ids is None else aoi_ids[piece_polygon_idx]
+    return edge_cells, centroid_spans, pieces, piece_ids
+
+
+@patch
+def _coverage_fraction(
+    self: FastSquareGridGenerator,
+    tiles_in_geom: pl.DataFrame,
+    boundary: SquareGridBoundary,
+    unique_id_col: Optional[str],
+    coverage_inputs: Tuple[
+        pl.DataFrame, pl.DataFrame, np.ndarray, Optional[np.ndarray]
+    ],  # from `_get_coverage_inputs`
+) -> np.ndarray:
+    """Returns the share of each cell's area inside the AOI.
+    Cells that no AOI edge crosses are either fully inside or fully outside, so only the crossed cells are clipped.
+    """
+    edge_cells, centroid_spans, pieces, piece_ids = coverage_inputs
+    key_cols = ["x", "y"] if unique_id_col is None else ["x", "y", unique_id_col]
+    cells_df = tiles_in_geom.select(key_cols).with_row_index(CELL_IDX_COL)
+
+    coverage_fraction = np.zeros(len(tiles_in_geom))
+    on = [] if unique_id_col is None else [unique_id_col]
+    inside_cells = polygon_fill.join_spans(cells_df, centroid_spans, on=on)
+    coverage_fraction[inside_cells[CELL_IDX_COL].to_numpy()] = 1.0
+
+    partial_cells = cells_df.join(edge_cells, on=key_cols, how="inner")
+    if partial_cells.is_empty():
+        return coverage_fraction
+
+    cells = np.asarray(self._xy_to_bbox(partial_cells, boundary, "x", "y").values)
+    cell_idx, piece_idx = STRtree(pieces).query(cells, predicate="intersects")
+    if piece_ids is not None:
+        is_same_id = (
+            partial_cells[unique_id_col].to_numpy()[cell_idx] == piece_ids[piece_idx]
+        )
+        cell_idx, piece_idx = cell_idx[is_same_id], piece_idx[is_same_id]
+
+    covered_area = np.bincount(
+        cell_idx,
+        weights=area(intersection(cells[cell_idx], pieces[piece_idx])),
+        minlength=len(cells),
+    )
+    coverage_fraction[partial_cells[CELL_IDX_COL].to_numpy()] = np.minimum(
+        covered_area / area(cells), 1.0
+    )
+    return coverage_fraction
+
+# %% ../notebooks/00_grids.ipynb 22
+@patch
+def _filter_off_boundary_tiles(
+    self: FastSquareGridGenerator,
+    tiles_off_boundary: pl.DataFrame,
+    polygons: GeoSeries,  # exploded AOI polygons in the grid projection
+    boundary: SquareGridBoundary,
+    unique_id_col: Optional[str] = None,
+    boundary_correction: str = "union",
+) -> pl.DataFrame:
+    """Returns the off boundary tiles that intersect the polygon boundary"""
+    if tiles_off_boundary.is_empty():
+        return tiles_off_boundary
+
+    off_boundary_bboxes = self._xy_to_bbox(tiles_off_boundary, boundary, "x", "y")
+    intersects_boundary_bool = _intersects_polygon_boundary(
+        off_boundary_bboxes,
+        tiles_off_boundary,
+        polygons,
+        unique_id_col,
+        boundary_correction,
+    )
+
+    addtl_tiles_in_geom = tiles_off_boundary.filter(pl.Series(intersects_boundary_bool))
+    return addtl_tiles_in_geom
+
+
 @patch
 def _remove_out_of_bounds_polygons(
     self: FastSquareGridGenerator,
     vertices: pl.DataFrame,
     boundary: SquareGridBoundary,
 ) -> pl.DataFrame:
-    id_cols = [col for col in vertices.columns if col != "x" and col != "y"]
+    id_cols = [
+        col
+        for col in vertices.columns
+        if col not in ["x", "y", polygon_fill.RING_ID_COL]
+    ]
 
     x_out_of_bounds_expr = (pl.col("maxx") < pl.lit(boundary.x_min)) | (
         pl.lit(boundary.x_max) < pl.col("minx")
@@ -303,6 +1008,7 @@ def _northing_to_ytile(
     northing: pl.Expr,
     y_min: float,
     y_max: float,
+    floor: bool = True,  # if False, returns the continuous tile coordinate (e.g. 2.5 is the middle of tile 2) instead of the tile index
 ) -> pl.Expr:
 
     # clamping to bounds
@@ -313,8 +1019,10 @@ def _northing_to_ytile(
         .then(pl.lit(y_max))
         .otherwise(northing)
     )
-    ytile = ((northing - y_min) / self.cell_size).floor()
-    ytile = ytile.cast(self.PIXEL_DTYPE)
+    ytile = (northing - y_min) / self.cell_size
+    if not floor:
+        return ytile
+    ytile = ytile.floor().cast(self.PIXEL_DTYPE)
 
     return ytile
 
@@ -325,6 +1033,7 @@ def _easting_to_xtile(
     easting: pl.Expr,
     x_min: float,
     x_max: float,
+    floor: bool = True,  # if False, returns the continuous tile coordinate (e.g. 2.5 is the middle of tile 2) instead of the tile index
 ) -> pl.Expr:
 
     # clamping to bounds
@@ -336,8 +1045,10 @@ def _easting_to_xtile(
         .otherwise(easting)
     )
 
-    xtile = ((easting - x_min) / self.cell_size).floor()
-    xtile = xtile.cast(self.PIXEL_DTYPE)
+    xtile = (easting - x_min) / self.cell_size
+    if not floor:
+        return xtile
+    xtile = xtile.floor().cast(self.PIXEL_DTYPE)
 
     return xtile
 
@@ -349,6 +1060,7 @@ def _northingeasting_to_xy(
     boundary: SquareGridBoundary,
     northing_col: str,
     easting_col: str,
+    floor: bool = True,  # if False, returns the continuous tile coordinates (e.g. 2.5 is the middle of tile 2) instead of the tile indices
 ) -> pl.DataFrame:
 
     x_min = boundary.x_min
@@ -357,8 +1069,8 @@ def _northingeasting_to_xy(
     y_max = boundary.y_max
 
     xy_df = df.with_columns(
-        x=self._easting_to_xtile(pl.col(easting_col), x_min, x_max),
-        y=self._northing_to_ytile(pl.col(northing_col), y_min, y_max),
+        x=self._easting_to_xtile(pl.col(easting_col), x_min, x_max, floor=floor),
+        y=self._northing_to_ytile(pl.col(northing_col), y_min, y_max, floor=floor),
     )
 
     return xy_df
@@ -391,13 +1103,13 @@ def _ytile_to_northing(
 
 
 @patch
-def _xy_to_bbox(
+def _xy_to_bounds(
     self: FastSquareGridGenerator,
     df: pl.DataFrame,
     boundary: SquareGridBoundary,
     xtile_col: str,
     ytile_col: str,
-) -> GeoSeries:
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
 
     x_min = boundary.x_min
     y_min = boundary.y_min
@@ -414,88 +1126,459 @@ def _xy_to_bbox(
         maxy=upper_right_northing,
     )
 
-    # use vectorized version in shapely 2.0
-    bboxes = box(
-        bbox_df["minx"].to_list(),
-        bbox_df["miny"].to_list(),
-        bbox_df["maxx"].to_list(),
-        bbox_df["maxy"].to_list(),
+    return (
+        bbox_df["minx"].to_numpy(),
+        bbox_df["miny"].to_numpy(),
+        bbox_df["maxx"].to_numpy(),
+        bbox_df["maxy"].to_numpy(),
     )
+
+
+@patch
+def _xy_to_bbox(
+    self: FastSquareGridGenerator,
+    df: pl.DataFrame,
+    boundary: SquareGridBoundary,
+    xtile_col: str,
+    ytile_col: str,
+) -> GeoSeries:
+    # use vectorized version in shapely 2.0
+    bboxes = box(*self._xy_to_bounds(df, boundary, xtile_col, ytile_col))
     bboxes = GeoSeries(bboxes, crs=self.grid_projection)
 
     return bboxes
 
-# %% ../notebooks/00_grids.ipynb 18
-class H3GridGenerator:
-    def __init__(
-        self,
-        resolution: int,  # Resolution of hexagon. See: https://h3geo.org/docs/core-library/restable/ for more info
-        return_geometry: bool = True,  # If geometry should be returned. Setting this to false will only return hex_ids
-    ):
-        self.resolution = resolution
-        self.return_geometry = return_geometry
 
-# %% ../notebooks/00_grids.ipynb 19
 @patch
-def get_hexes_for_polygon(self: H3GridGenerator, poly: Polygon):
-    if h3.__version__[0] == "3":
-        return h3.polyfill(
-            poly.__geo_interface__,
-            self.resolution,
-            geo_json_conformant=True,
-        )
-    else:
-        return h3.polygon_to_cells(
-            h3.geo_to_h3shape(poly.__geo_interface__),
-            self.resolution,
-        )
+def _xy_to_reprojected_corners(
+    self: FastSquareGridGenerator,
+    df: pl.DataFrame,
+    boundary: SquareGridBoundary,
+    xtile_col: str,
+    ytile_col: str,
+    crs,  # crs of the output
+) -> np.ndarray:
+    """Returns the reprojected corners of each cell with shape (n, 4, 2). Each lattice node shared by neighbouring cells is only reprojected once."""
+    xtile = df[xtile_col].to_numpy().astype(np.int64)
+    ytile = df[ytile_col].to_numpy().astype(np.int64)
+
+    # corners in the same order as shapely.box
+    corner_xtile = np.stack([xtile + 1, xtile + 1, xtile, xtile], axis=1).ravel()
+    corner_ytile = np.stack([ytile, ytile + 1, ytile + 1, ytile], axis=1).ravel()
+    node_keys, corner_node_idx = np.unique(
+        polygon_fill.pack_pixel_keys(corner_xtile, corner_ytile), return_inverse=True
+    )
+    node_xtile, node_ytile = polygon_fill.unpack_pixel_keys(node_keys)
 
-# %% ../notebooks/00_grids.ipynb 20
-@patch
-def generate_grid(self: H3GridGenerator, aoi_gdf: GeoDataFrame) -> DataFrame:
-    reprojected_gdf = aoi_gdf.to_crs("epsg:4326")  # h3 hexes are in epsg:4326 CRS
-    hex_ids = set()
-    unary_union = reprojected_gdf.union_all(method="unary")
-    if isinstance(unary_union, Polygon):
-        hex_ids.update(self.get_hexes_for_polygon(unary_union))
-    else:
-        for geom in unary_union.geoms:
-            _hexes = self.get_hexes_for_polygon(geom)
-            hex_ids.update(_hexes)
-    df = DataFrame({"hex_id": list(hex_ids)})
-    if self.return_geometry is False:
-        return df
-    if h3.__version__[0] == "3":
-        hexes = df.hex_id.apply(
-            lambda id: Polygon(h3.h3_to_geo_boundary(id, geojson=True))
-        )
-    else:
-        hexes = df.hex_id.apply(lambda id: Polygon(h3.cell_to_boundary(id)))
-    h3_gdf = GeoDataFrame(
-        df,
-        geometry=hexes,
-        crs="epsg:4326",
+    transformer = _get_transformer(
+        CRS.from_user_input(self.grid_projection), CRS.from_user_input(crs)
+    )
+    node_x, node_y = transformer.transform(
+        (node_xtile * self.cell_size) + boundary.x_min,
+        (node_ytile * self.cell_size) + boundary.y_min,
     )
-    return h3_gdf.to_crs(aoi_gdf.crs)
 
-# %% ../notebooks/00_grids.ipynb 22
-class BingTileGridGenerator:
-    def __init__(
-        self,
-        zoom_level: int,  # Zoom level of tile. See: https://docs.microsoft.com/en-us/bingmaps/articles/bing-maps-tile-system for more info
-        return_geometry: bool = True,  # If geometry should be returned. Setting this to false will only return quadkeys
-        add_xyz_cols: bool = False,  # If quadkey should be converted to their xyz values.
-    ):
-        self.zoom_level = zoom_level
-        self.return_geometry = return_geometry
-        self.add_xyz_cols = add_xyz_cols
-        self.tms = morecantile.tms.get("WebMercatorQuad")
+    corner_node_idx = corner_node_idx.reshape(-1, 4)
+    corners = np.stack([node_x[corner_node_idx], node_y[corner_node_idx]], axis=-1)
+    return corners
 
-    def tile_to_polygon(self, tile: morecantile.Tile):
-        """Converts a tile to geometry"""
-        return shape(self.tms.feature(tile)["geometry"])
 
-    def get_tiles_for_polygon(
+@patch
+def _xy_to_reprojected_bbox(
+    self: FastSquareGridGenerator,
+    df: pl.DataFrame,
+    boundary: SquareGridBoundary,
+    xtile_col: str,
+    ytile_col: str,
+    crs,  # crs of the output
+) -> GeoSeries:
+    """Same as reprojecting the output of `_xy_to_bbox`, but each lattice node shared by neighbouring cells is only reprojected once"""
+    corners = self._xy_to_reprojected_corners(df, boundary, xtile_col, ytile_col, crs)
+    bboxes = GeoSeries(polygons(corners), crs=crs)
+
+    return bboxes
+
+# %% ../notebooks/00_grids.ipynb 23
+SHARD_COL = "__shard__"
+SHARD_ROW_COL = "__shard_row__"
+SHARDS_PER_WORKER = 4
+
+
+def _resolve_boundary_correction(
+    boundary_correction: Optional[str],
+    unique_id_col: Optional[str],
+) -> str:
+    if boundary_correction is not None:
+        return boundary_correction
+    return "union" if unique_id_col is None else "strtree"
+
+
+def _intersects_polygon_boundary(
+    bboxes: GeoSeries,  # bboxes of the off boundary tiles
+    tiles_off_boundary: pl.DataFrame,
+    polygons: GeoSeries,  # exploded polygons from `polygon_fill.explode_polygons`
+    unique_id_col: Optional[str],
+    boundary_correction: str,
+) -> np.ndarray:
+    """Returns whether each off boundary tile intersects the boundary of the polygons.
+    With "strtree", the tiles are queried against a tree of the polygon boundaries instead of their union,
+    and if unique_id_col is given, only the boundaries of the polygons with the same id count.
+    """
+    if boundary_correction == "union":
+        all_polygon_boundary = polygons.boundary.union_all(method="unary")
+        return np.asarray(bboxes.intersects(all_polygon_boundary))
+
+    polygon_boundaries = np.asarray(polygons.boundary.values)
+    tile_idx, polygon_idx = STRtree(polygon_boundaries).query(
+        np.asarray(bboxes.values), predicate="intersects"
+    )
+    if unique_id_col is not None:
+        tile_ids = tiles_off_boundary[unique_id_col].to_numpy()[tile_idx]
+        polygon_ids = polygons.index.get_level_values(unique_id_col).to_numpy()[
+            polygon_idx
+        ]
+        tile_idx = tile_idx[tile_ids == polygon_ids]
+
+    intersects_boundary = np.zeros(len(bboxes), dtype=bool)
+    intersects_boundary[tile_idx] = True
+    return intersects_boundary
+
+
+def _fill_polygons(
+    shard: Tuple[
+        pl.DataFrame, GeoSeries
+    ],  # integer vertices and exploded geometries of the polygons to fill
+    generator: Union["FastSquareGridGenerator", "FastBingTileGridGenerator"],
+    unique_id_col: Optional[str],
+    return_spans: bool,
+    **filter_kwargs,  # passed to the generator's `_filter_off_boundary_tiles`
+) -> pl.DataFrame:
+    """Fills the polygons, including the off boundary tiles that intersect the polygon boundary"""
+    vertices, polygons = shard
+    polygon_fill_result = polygon_fill.fast_polygon_fill(
+        vertices, unique_id_col, return_spans=return_spans
+    )
+
+    # this is error correction on the polygon boundary (not the square boundary)
+    tiles_off_boundary = polygon_fill_result["tiles_off_boundary"]
+    addtl_tiles_in_geom = generator._filter_off_boundary_tiles(
+        tiles_off_boundary, polygons, unique_id_col=unique_id_col, **filter_kwargs
+    )
+
+    if return_spans:
+        spans_in_geom = polygon_fill_result["spans_in_geom"]
+        if not addtl_tiles_in_geom.is_empty():
+            addtl_spans = polygon_fill.pixels_to_spans(addtl_tiles_in_geom)
+            spans_in_geom = polygon_fill.merge_spans(
+                pl.concat([spans_in_geom, addtl_spans])
+            )
+        return spans_in_geom
+
+    tiles_in_geom = polygon_fill_result["tiles_in_geom"]
+    if not addtl_tiles_in_geom.is_empty():
+        tiles_in_geom = pl.concat([tiles_in_geom, addtl_tiles_in_geom])
+    return tiles_in_geom
+
+
+def _shard_polygons(
+    polygons: GeoSeries,
+    n_shards: int,
+) -> np.ndarray:
+    """Assigns each polygon to a shard so that shards have similar vertex counts, starting with the largest polygons"""
+    n_vertices = get_num_coordinates(polygons.values)
+    shard_n_vertices = np.zeros(n_shards, dtype=np.int64)
+    shards = np.empty(len(polygons), dtype=np.int64)
+    for i in np.argsort(-n_vertices, kind="stable"):
+        shard = np.argmin(shard_n_vertices)
+        shards[i] = shard
+        shard_n_vertices[shard] += n_vertices[i]
+    return shards
+
+
+def _parallel_fill_polygons(
+    vertices: pl.DataFrame,  # integer vertices of all polygons in the AOI
+    polygons: GeoSeries,  # exploded polygons from `polygon_fill.explode_polygons`
+    generator: Union["FastSquareGridGenerator", "FastBingTileGridGenerator"],
+    unique_id_col: Optional[str],
+    return_spans: bool,
+    n_workers: int,
+    **filter_kwargs,  # passed to the generator's `_filter_off_boundary_tiles`
+) -> pl.DataFrame:
+    """Fills shards of polygons in a process pool. Each shard does its own boundary error correction."""
+    n_shards = min(len(polygons), n_workers * SHARDS_PER_WORKER)
+    if n_shards <= 1:
+        return _fill_polygons(
+            (vertices, polygons),
+            generator,
+            unique_id_col,
+            return_spans,
+            **filter_kwargs,
+        )
+
+    shards = _shard_polygons(polygons, n_shards)
+    # the polygon ids have the same column names as in the vertices since both come from the exploded index
+    polygon_shards = pl.from_pandas(
+        pd.DataFrame({SHARD_COL: shards}, index=polygons.index).reset_index()
+    )
+    id_cols = [col for col in polygon_shards.columns if col != SHARD_COL]
+    vertices = (
+        vertices.with_row_index(SHARD_ROW_COL)
+        .join(polygon_shards, on=id_cols, how="inner")
+        .sort(SHARD_ROW_COL)
+        .drop(SHARD_ROW_COL)
+    )
+
+    items = [
+        (
+            vertices.filter(pl.col(SHARD_COL) == shard).drop(SHARD_COL),
+            polygons[shards == shard],
+        )
+        for shard in range(n_shards)
+    ]
+    results = parallel(
+        _fill_polygons,
+        items,
+        generator=generator,
+        unique_id_col=unique_id_col,
+        return_spans=return_spans,
+        n_workers=n_workers,
+        method="spawn",
+        progress=False,
+        **filter_kwargs,
+    )
+
+    # tiles can be repeated across shards (e.g. subpolygons with the same id)
+    results = pl.concat(list(results))
+    if return_spans:
+        return polygon_fill.merge_spans(results)
+    return results.unique(maintain_order=True)
+
+# %% ../notebooks/00_grids.ipynb 25
+class H3GridGenerator:
+    HEX_ID_TYPES = ["str", "int"]
+
+    def __init__(
+        self,
+        resolution: int,  # Resolution of hexagon. See: https://h3geo.org/docs/core-library/restable/ for more info
+        return_geometry: bool = True,  # If geometry should be returned. Setting this to false will only return hex_ids
+        hex_id_type: str = "str",  # "str" returns hex_ids as strings. "int" returns hex_ids as int64 integers, which are much smaller and faster to join
+    ):
+        self.resolution = resolution
+        self.return_geometry = return_geometry
+        self.hex_id_type = hex_id_type
+
+        if self.hex_id_type not in self.HEX_ID_TYPES:
+            raise ValueError(
+                f"{self.hex_id_type} hex_id_type is not supported. Please select from these options {self.HEX_ID_TYPES}"
+            )
+
+# %% ../notebooks/00_grids.ipynb 26
+@patch
+def get_hexes_for_polygon(self: H3GridGenerator, poly: Polygon):
+    if h3.__version__[0] == "3":
+        return h3.polyfill(
+            poly.__geo_interface__,
+            self.resolution,
+            geo_json_conformant=True,
+        )
+    else:
+        return h3.polygon_to_cells(
+            h3.geo_to_h3shape(poly.__geo_interface__),
+            self.resolution,
+        )
+
+# %% ../notebooks/00_grids.ipynb 27
+@patch
+def generate_grid(
+    self: H3GridGenerator,
+    aoi_gdf: GeoDataFrame,
+    fill_mode: str = "union",  # "union" fills the pieces of the union of the AOI. "polygons" fills each AOI polygon without computing the union, which is faster for large AOIs with many polygons.
+    n_workers: int = 1,  # number of processes used to fill the polygons
+) -> DataFrame:
+    hex_ids = self._get_hex_ids(aoi_gdf, fill_mode, n_workers)
+    return self._hex_ids_to_output(hex_ids, aoi_gdf.crs)
+
+# %% ../notebooks/00_grids.ipynb 28
+@patch
+def generate_grid_iter(
+    self: H3GridGenerator,
+    aoi_gdf: GeoDataFrame,
+    chunk_size: int = 100_000,  # maximum number of hexes per chunk
+    fill_mode: str = "union",  # "union" fills the pieces of the union of the AOI. "polygons" fills each AOI polygon without computing the union.
+    n_workers: int = 1,  # number of processes used to fill the polygons
+) -> Iterator[DataFrame]:
+    """Generates the grid as dataframes of at most chunk_size hexes, ordered by hex_id.
+    Only the hex ids are kept in memory, the geometries are created a chunk at a time.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size should be positive but instead is {chunk_size}")
+
+    hex_ids = self._get_hex_ids(aoi_gdf, fill_mode, n_workers)
+    for chunk_start in range(0, len(hex_ids), chunk_size):
+        yield self._hex_ids_to_output(
+            hex_ids[chunk_start : chunk_start + chunk_size], aoi_gdf.crs
+        )
+
+# %% ../notebooks/00_grids.ipynb 29
+H3_FILL_MODES = ["union", "polygons"]
+
+
+def _h3_polygons_to_cells(
+    polygons: GeoSeries,  # polygons in EPSG:4326
+    resolution: int,
+) -> np.ndarray:
+    """Returns the unique integer H3 cells whose centers are in the polygons"""
+    cells = [np.array([], dtype=np.uint64)]
+    for polygon in polygons:
+        if h3.__version__[0] == "3":
+            cells.append(
+                h3_int.polyfill(
+                    polygon.__geo_interface__, resolution, geo_json_conformant=True
+                )
+            )
+        else:
+            cells.append(
+                h3_int.polygon_to_cells(
+                    h3.geo_to_h3shape(polygon.__geo_interface__), resolution
+                )
+            )
+    return np.unique(np.concatenate(cells).astype(np.uint64))
+
+
+def _h3_cells_to_polygons(
+    cells: np.ndarray,  # integer H3 cells
+) -> np.ndarray:
+    """Builds the polygons of the cells in bulk from a single array of boundary coordinates"""
+    if len(cells) == 0:
+        return np.array([], dtype=object)
+    if h3.__version__[0] == "3":
+        boundaries = [h3_int.h3_to_geo_boundary(cell, geo_json=True) for cell in cells]
+    else:
+        # cell_to_boundary returns lat, lng pairs
+        boundaries = [h3_int.cell_to_boundary(cell) for cell in cells]
+    n_vertices = np.fromiter(map(len, boundaries), dtype=np.int64, count=len(cells))
+    coords = np.array(list(chain.from_iterable(boundaries)), dtype=np.float64)
+    if h3.__version__[0] != "3":
+        coords = coords[:, ::-1]
+    rings = linearrings(coords, indices=np.repeat(np.arange(len(cells)), n_vertices))
+    return polygons(rings)
+
+
+@patch
+def _get_hex_ids(
+    self: H3GridGenerator,
+    aoi_gdf: GeoDataFrame,
+    fill_mode: str,
+    n_workers: int,
+) -> np.ndarray:
+    """Returns the sorted integer H3 cells in the AOI"""
+    if fill_mode not in H3_FILL_MODES:
+        raise ValueError(
+            f"{fill_mode} fill_mode is not supported. Please select from these options {H3_FILL_MODES}"
+        )
+
+    reprojected_gdf = aoi_gdf.to_crs("epsg:4326")  # h3 hexes are in epsg:4326 CRS
+    if fill_mode == "union":
+        polygons_4326 = GeoSeries([reprojected_gdf.union_all(method="unary")])
+    else:
+        polygons_4326 = reprojected_gdf.geometry
+    polygons_4326 = polygons_4326.explode(index_parts=False)
+    polygons_4326 = polygons_4326[polygons_4326.geom_type == "Polygon"].reset_index(
+        drop=True
+    )
+
+    if n_workers > 1 and len(polygons_4326) > 1:
+        n_shards = min(len(polygons_4326), n_workers * SHARDS_PER_WORKER)
+        shards = _shard_polygons(polygons_4326, n_shards)
+        items = [polygons_4326[shards == shard] for shard in range(n_shards)]
+        cells = parallel(
+            _h3_polygons_to_cells,
+            items,
+            resolution=self.resolution,
+            n_workers=n_workers,
+            method="spawn",
+            progress=False,
+        )
+        return np.unique(np.concatenate(list(cells)))
+    return _h3_polygons_to_cells(polygons_4326, self.resolution)
+
+
+@patch
+def _hex_ids_to_output(
+    self: H3GridGenerator,
+    hex_ids: np.ndarray,  # integer H3 cells
+    crs,
+) -> DataFrame:
+    if self.hex_id_type == "int":
+        df = DataFrame({"hex_id": hex_ids.astype(np.int64)})
+    else:
+        df = DataFrame({"hex_id": h3_ints_to_strs(hex_ids)})
+    if self.return_geometry is False:
+        return df
+    h3_gdf = GeoDataFrame(
+        df,
+        geometry=_h3_cells_to_polygons(hex_ids),
+        crs="epsg:4326",
+    )
+    return h3_gdf.to_crs(crs)
+
+# %% ../notebooks/00_grids.ipynb 30
+def h3_ints_to_strs(
+    hex_ids: np.ndarray,  # integer H3 indexes
+) -> np.ndarray:
+    """Converts integer H3 indexes to hex strings"""
+    hex_ids = np.asarray(hex_ids).astype(np.uint64)
+    # 16 hex digits, most significant first
+    nibbles = (hex_ids[:, None] >> (np.arange(15, -1, -1, dtype=np.uint64) * 4)) & 0xF
+    hex_chars = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)[nibbles]
+    hex_strs = np.ascontiguousarray(hex_chars).view("S16").ravel()
+    return np.char.lstrip(hex_strs.astype(str), "0")
+
+
+def h3_strs_to_ints(
+    hex_ids: Iterable[str],  # H3 indexes as hex strings
+) -> np.ndarray:
+    """Converts H3 hex strings to int64 H3 indexes"""
+    hex_ids = np.char.lower(np.asarray(hex_ids, dtype="S"))
+    if hex_ids.itemsize > 16:
+        raise ValueError("H3 hex strings should have at most 16 hex digits")
+    n_digits = np.char.str_len(hex_ids)
+    # the byte strings are padded with null bytes up to the longest hex string
+    hex_chars = hex_ids.view(np.uint8).reshape(len(hex_ids), hex_ids.itemsize)
+    hex_values = np.full(256, 16, dtype=np.uint64)
+    hex_values[np.frombuffer(b"0123456789abcdef", dtype=np.uint8)] = np.arange(
+        16, dtype=np.uint64
+    )
+
+    ints = np.zeros(len(hex_ids), dtype=np.uint64)
+    for digit_idx in range(hex_ids.itemsize):
+        in_hex_id = digit_idx < n_digits
+        digit = hex_values[hex_chars[:, digit_idx]]
+        if (digit[in_hex_id] > 15).any():
+            raise ValueError("H3 hex strings should only have hex digits")
+        ints = np.where(in_hex_id, (ints << 4) | digit, ints)
+    return ints.astype(np.int64)
+
+# %% ../notebooks/00_grids.ipynb 32
+class BingTileGridGenerator:
+    ENGINES = ["numpy", "python"]
+
+    def __init__(
+        self,
+        zoom_level: int,  # Zoom level of tile. See: https://docs.microsoft.com/en-us/bingmaps/articles/bing-maps-tile-system for more info
+        return_geometry: bool = True,  # If geometry should be returned. Setting this to false will only return quadkeys
+        add_xyz_cols: bool = False,  # If quadkey should be converted to their xyz values.
+    ):
+        self.zoom_level = zoom_level
+        self.return_geometry = return_geometry
+        self.add_xyz_cols = add_xyz_cols
+        self.tms = morecantile.tms.get("WebMercatorQuad")
+
+    def tile_to_polygon(self, tile: morecantile.Tile):
+        """Converts a tile to geometry"""
+        return shape(self.tms.feature(tile)["geometry"])
+
+    def get_tiles_for_polygon(
         self,
         polygon: Polygon,
         filter: bool = True,
@@ -515,7 +1598,7 @@ class BingTileGridGenerator:
             tiles = {qk: (geom, tile) for qk, geom, tile in tiles}
         return tiles
 
-# %% ../notebooks/00_grids.ipynb 23
+# %% ../notebooks/00_grids.ipynb 33
 @patch
 def get_all_tiles_for_polygon(self: BingTileGridGenerator, polygon: Polygon):
     """Get the interseting tiles with polygon for a zoom level. Polygon should be in EPSG:4326"""
@@ -526,27 +1609,168 @@ def get_all_tiles_for_polygon(self: BingTileGridGenerator, polygon: Polygon):
     )
     return tiles
 
-# %% ../notebooks/00_grids.ipynb 24
+# %% ../notebooks/00_grids.ipynb 34
+# same epsilon that morecantile uses to find the tiles of a bounding box
+LL_EPSILON = 1e-11
+
+
+@patch
+def _get_tile_lattice(
+    self: BingTileGridGenerator,
+    polygon: Polygon,  # polygon in EPSG:4326
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the x and y of the same tiles as `tms.tiles` over the polygon bounds, in the same order"""
+    west, south, east, north = polygon.bounds
+    bbox = self.tms.bbox
+    west, south = max(bbox.left, west), max(bbox.bottom, south)
+    east, north = min(bbox.right, east), min(bbox.top, north)
+
+    nw_tile = self.tms.tile(west + LL_EPSILON, north - LL_EPSILON, self.zoom_level)
+    se_tile = self.tms.tile(east - LL_EPSILON, south + LL_EPSILON, self.zoom_level)
+    xtiles = np.arange(min(nw_tile.x, se_tile.x), max(nw_tile.x, se_tile.x) + 1)
+    ytiles = np.arange(min(nw_tile.y, se_tile.y), max(nw_tile.y, se_tile.y) + 1)
+
+    # tms.tiles iterates over rows, then columns
+    y, x = np.meshgrid(ytiles, xtiles, indexing="ij")
+    return x.ravel(), y.ravel()
+
+
+@patch
+def _tiles_to_polygons(
+    self: BingTileGridGenerator,
+    x: np.ndarray,
+    y: np.ndarray,
+) -> np.ndarray:
+    """Returns the same geometries as `tile_to_polygon`, with the tile bounds computed once per column and row"""
+    if len(x) == 0:
+        return np.array([], dtype=object)
+
+    xtiles, xtile_idx = np.unique(x, return_inverse=True)
+    ytiles, ytile_idx = np.unique(y, return_inverse=True)
+    column_bounds = np.array(
+        [
+            self.tms.bounds(morecantile.Tile(int(xtile), int(y[0]), self.zoom_level))
+            for xtile in xtiles
+        ]
+    )
+    row_bounds = np.array(
+        [
+            self.tms.bounds(morecantile.Tile(int(x[0]), int(ytile), self.zoom_level))
+            for ytile in ytiles
+        ]
+    )
+    west, east = (
+        column_bounds[xtile_idx.ravel(), 0],
+        column_bounds[xtile_idx.ravel(), 2],
+    )
+    south, north = row_bounds[ytile_idx.ravel(), 1], row_bounds[ytile_idx.ravel(), 3]
+
+    # same vertex order as the tile geojson
+    coords = np.stack(
+        [
+            np.stack([west, south], axis=-1),
+            np.stack([west, north], axis=-1),
+            np.stack([east, north], axis=-1),
+            np.stack([east, south], axis=-1),
+        ],
+        axis=1,
+    )
+    return polygons(coords)
+
+
 @patch
-def generate_grid(self: BingTileGridGenerator, aoi_gdf: GeoDataFrame) -> DataFrame:
+def _get_tiles_numpy(
+    self: BingTileGridGenerator,
+    polygons_4326: Iterable[Polygon],
+    filter: bool,  # if true, only the tiles that intersect the polygons are kept
+    deduplicate: bool,  # if true, tiles shared by polygons are only kept once
+) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the quadkeys, geometries, x and y of the tiles of each polygon, computed with array operations"""
+    xs, ys, geoms = (
+        [np.array([], dtype=np.int64)],
+        [np.array([], dtype=np.int64)],
+        [np.array([], dtype=object)],
+    )
+    for polygon in polygons_4326:
+        x, y = self._get_tile_lattice(polygon)
+        tile_geoms = self._tiles_to_polygons(x, y)
+        if filter:
+            prepare(polygon)
+            intersects_polygon = intersects(polygon, tile_geoms)
+            x, y, tile_geoms = (
+                x[intersects_polygon],
+                y[intersects_polygon],
+                tile_geoms[intersects_polygon],
+            )
+        xs.append(x)
+        ys.append(y)
+        geoms.append(tile_geoms)
+    x, y, geoms = np.concatenate(xs), np.concatenate(ys), np.concatenate(geoms)
+
+    if deduplicate:
+        _, first_idx = np.unique(polygon_fill.pack_pixel_keys(x, y), return_index=True)
+        first_idx = np.sort(first_idx)
+        x, y, geoms = x[first_idx], y[first_idx], geoms[first_idx]
+
+    quadkeys = ints_to_quadkeys(xyz_to_quadkey_int(x, y, self.zoom_level)).tolist()
+    return quadkeys, geoms, x, y
+
+
+@patch
+def _get_tiles_python(
+    self: BingTileGridGenerator,
+    polygons_4326: Iterable[Polygon],
+    filter: bool,  # if true, only the tiles that intersect the polygons are kept
+    deduplicate: bool,  # if true, tiles shared by polygons are only kept once
+) -> Tuple[List[str], List[Polygon], List[int], List[int]]:
+    """Returns the quadkeys, geometries, x and y of the tiles of each polygon, computed one tile at a time"""
+    if deduplicate:
+        tiles = {}
+        for polygon in polygons_4326:
+            tiles.update(self.get_tiles_for_polygon(polygon, filter=filter))
+        tiles = [(qk, geom, tile) for qk, (geom, tile) in tiles.items()]
+    else:
+        tiles = []
+        for polygon in polygons_4326:
+            _tiles = self.get_all_tiles_for_polygon(polygon)
+            if filter:
+                _tiles = [
+                    (qk, geom, tile)
+                    for qk, geom, tile in _tiles
+                    if polygon.intersects(geom)
+                ]
+            tiles += _tiles
+
+    quadkeys = [qk for qk, _, _ in tiles]
+    geoms = [geom for _, geom, _ in tiles]
+    x = [tile.x for _, _, tile in tiles]
+    y = [tile.y for _, _, tile in tiles]
+    return quadkeys, geoms, x, y
+
+# %% ../notebooks/00_grids.ipynb 35
+@patch
+def generate_grid(
+    self: BingTileGridGenerator,
+    aoi_gdf: GeoDataFrame,
+    engine: str = "numpy",  # "numpy" computes the tiles of each polygon with array operations, "python" computes them one tile at a time
+) -> DataFrame:
+    if engine not in self.ENGINES:
+        raise ValueError(
+            f"{engine} engine is not supported. Please select from these options {self.ENGINES}"
+        )
+
     reprojected_gdf = aoi_gdf.to_crs("epsg:4326")  # quadkeys hexes are in epsg:4326 CRS
-    tiles = {}
     unary_union = reprojected_gdf.union_all(method="unary")
-    if isinstance(unary_union, Polygon):
-        tiles.update(self.get_tiles_for_polygon(unary_union))
-    else:
-        for geom in unary_union.geoms:
-            _tiles = self.get_tiles_for_polygon(geom)
-            tiles.update(_tiles)
-    quadkey, geom_tile = zip(*((k, v) for k, v in tiles.items()))
-    geom, tile = zip(*geom_tile)
+    geoms = [unary_union] if isinstance(unary_union, Polygon) else unary_union.geoms
+    get_tiles = self._get_tiles_numpy if engine == "numpy" else self._get_tiles_python
+    quadkey, geom, x, y = get_tiles(geoms, filter=True, deduplicate=True)
 
     result = {"quadkey": list(quadkey)}
 
     if self.add_xyz_cols:
-        result["x"] = [t.x for t in tile]
-        result["y"] = [t.y for t in tile]
-        result["z"] = [t.z for t in tile]
+        result["x"] = list(x)
+        result["y"] = list(y)
+        result["z"] = [self.zoom_level] * len(quadkey)
 
     if self.return_geometry:
         tiles_gdf = GeoDataFrame(
@@ -561,7 +1785,7 @@ def generate_grid(self: BingTileGridGenerator, aoi_gdf: GeoDataFrame) -> DataFra
 
     return tiles_gdf
 
-# %% ../notebooks/00_grids.ipynb 25
+# %% ../notebooks/00_grids.ipynb 36
 def get_intersect_partition(item):
     tiles_gdf, reprojected_gdf = item
     tiles_gdf.sindex
@@ -571,10 +1795,146 @@ def get_intersect_partition(item):
     )
     return intersect_tiles_gdf
 
-# %% ../notebooks/00_grids.ipynb 26
+# %% ../notebooks/00_grids.ipynb 37
+INTERSECTS_BACKENDS = ["thread", "process"]
+
+# the AOI tree of each worker in the process backend, built once by `_init_intersects_worker`
+_worker_aoi_tree = None
+
+
+def _geoms_to_shared_memory(geoms: np.ndarray) -> Tuple[SharedMemory, np.ndarray]:
+    """Writes the WKB of the geometries to a shared memory block. Returns the block and the WKB offsets."""
+    wkbs = to_wkb(geoms)
+    offsets = np.zeros(len(wkbs) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(wkb) for wkb in wkbs])
+    shm = SharedMemory(create=True, size=max(int(offsets[-1]), 1))
+    shm.buf[: offsets[-1]] = b"".join(wkbs)
+    return shm, offsets
+
+
+def _init_intersects_worker(shm_name: str, offsets: np.ndarray):
+    """Reads the AOI geometries from shared memory and builds the AOI tree once per worker"""
+    global _worker_aoi_tree
+    shm = SharedMemory(name=shm_name)
+    try:
+        wkbs = [
+            bytes(shm.buf[start:end]) for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+    finally:
+        shm.close()
+    _worker_aoi_tree = STRtree(from_wkb(wkbs))
+
+
+def _get_intersect_pairs(item: Tuple[int, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the (tile, AOI) index pairs that intersect for a chunk of tiles, given as its start and WKB"""
+    start, tile_wkbs = item
+    tile_idx, aoi_idx = _worker_aoi_tree.query(
+        from_wkb(tile_wkbs), predicate="intersects"
+    )
+    return tile_idx + start, aoi_idx
+
+
+def _map_bounded(
+    ex: Executor,
+    fn: Callable,
+    items: Iterable,
+    max_in_flight: int,  # maximum number of items submitted to the executor that have not finished yet
+) -> List[Any]:
+    """Same as `list(ex.map(fn, items))`, but the next item is only taken from items once fewer than max_in_flight are running"""
+    results = {}
+    in_flight = {}
+    for item_idx, item in enumerate(items):
+        if len(in_flight) >= max_in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[in_flight.pop(future)] = future.result()
+        in_flight[ex.submit(fn, item)] = item_idx
+    done, _ = wait(in_flight, return_when=ALL_COMPLETED)
+    for future in done:
+        results[in_flight.pop(future)] = future.result()
+    return [results[item_idx] for item_idx in range(len(results))]
+
+
+def _process_intersect_pairs(
+    tile_geoms: np.ndarray,
+    aoi_geoms: np.ndarray,
+    n_workers: int,
+    progress: bool,
+    chunk_size: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Streams chunks of tiles through a process pool. The AOI is shipped once through shared memory."""
+    shm, offsets = _geoms_to_shared_memory(aoi_geoms)
+    try:
+        items = (
+            (start, to_wkb(tile_geoms[start : start + chunk_size]))
+            for start in range(0, len(tile_geoms), chunk_size)
+        )
+        with ProcessPoolExecutor(
+            n_workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_intersects_worker,
+            initargs=(shm.name, offsets),
+        ) as ex:
+            if progress and progress_bar is not None:
+                items = progress_bar(
+                    items, total=int(np.ceil(len(tile_geoms) / chunk_size)), leave=False
+                )
+            # only a few chunks are serialized ahead of the workers, so memory does not grow with the number of tiles
+            pairs = _map_bounded(
+                ex, _get_intersect_pairs, items, max_in_flight=2 * n_workers
+            )
+    finally:
+        shm.close()
+        shm.unlink()
+
+    if not pairs:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    # chunks are collected in order, so the pairs are in the same order as a single query
+    tile_idx, aoi_idx = (np.concatenate(idx) for idx in zip(*pairs))
+    return tile_idx, aoi_idx
+
+
+def _pairs_to_sjoin(
+    tiles_gdf: GeoDataFrame,
+    reprojected_gdf: GeoDataFrame,
+    tile_idx: np.ndarray,
+    aoi_idx: np.ndarray,
+) -> GeoDataFrame:
+    """Builds the same output as an inner sjoin from the intersecting (tile, AOI) index pairs, in query order"""
+    intersect_tiles_gdf = tiles_gdf.iloc[tile_idx]
+    aoi_df = reprojected_gdf.drop(columns=reprojected_gdf.geometry.name).iloc[aoi_idx]
+    aoi_df.insert(0, "index_right", reprojected_gdf.index[aoi_idx])
+    aoi_df.index = intersect_tiles_gdf.index
+    return pd.concat([intersect_tiles_gdf, aoi_df], axis=1)
+
+# %% ../notebooks/00_grids.ipynb 38
 def get_parallel_intersects(
-    tiles_gdf, reprojected_gdf, n_workers=defaults.cpus, progress=True
+    tiles_gdf,
+    reprojected_gdf,
+    n_workers=defaults.cpus,
+    progress=True,
+    backend: str = "thread",  # "thread" runs sjoin on chunks in a thread pool, "process" streams chunks through a process pool that builds the AOI tree once per worker
+    chunk_size: int = 100_000,  # number of tiles per chunk for the process backend
 ):
+    if backend not in INTERSECTS_BACKENDS:
+        raise ValueError(
+            f"{backend} backend is not supported. Please select from these options {INTERSECTS_BACKENDS}"
+        )
+
+    if backend == "process":
+        tile_geoms = np.asarray(tiles_gdf.geometry.values)
+        aoi_geoms = np.asarray(reprojected_gdf.geometry.values)
+        if n_workers > 1 and len(tiles_gdf) > chunk_size:
+            tile_idx, aoi_idx = _process_intersect_pairs(
+                tile_geoms, aoi_geoms, n_workers, progress, chunk_size
+            )
+        else:
+            tile_idx, aoi_idx = STRtree(aoi_geoms).query(
+                tile_geoms, predicate="intersects"
+            )
+        results = _pairs_to_sjoin(tiles_gdf, reprojected_gdf, tile_idx, aoi_idx)
+        results = results.drop_duplicates(subset=["quadkey"])
+        return results
 
     # split tiles into n chunks (1 chunk per cpu)
     n_splits = int(np.ceil(len(tiles_gdf) / n_workers))
@@ -594,7 +1954,7 @@ def get_parallel_intersects(
     results = results.drop_duplicates(subset=["quadkey"])
     return results
 
-# %% ../notebooks/00_grids.ipynb 27
+# %% ../notebooks/00_grids.ipynb 39
 @patch
 def generate_grid_join(
     self: BingTileGridGenerator,
@@ -602,28 +1962,28 @@ def generate_grid_join(
     filter: bool = True,
     n_workers=defaults.cpus,
     progress=True,
+    engine: str = "numpy",  # "numpy" computes the tiles of each polygon with array operations, "python" computes them one tile at a time
+    backend: str = "thread",  # "thread" or "process" backend of `get_parallel_intersects`
 ) -> DataFrame:
+    if engine not in self.ENGINES:
+        raise ValueError(
+            f"{engine} engine is not supported. Please select from these options {self.ENGINES}"
+        )
+
     reprojected_gdf = aoi_gdf.to_crs("epsg:4326")[
         ["geometry"]
     ]  # quadkeys hexes are in epsg:4326 CRS
-    tiles = []
     unary_union = reprojected_gdf.union_all(method="unary")
-    if isinstance(unary_union, Polygon):
-        tiles += self.get_all_tiles_for_polygon(unary_union)
-    else:
-        for geom in unary_union.geoms:
-            tiles += self.get_all_tiles_for_polygon(
-                geom,
-            )
-
-    quadkey, geom, tile = zip(*tiles)
+    geoms = [unary_union] if isinstance(unary_union, Polygon) else unary_union.geoms
+    get_tiles = self._get_tiles_numpy if engine == "numpy" else self._get_tiles_python
+    quadkey, geom, x, y = get_tiles(geoms, filter=False, deduplicate=False)
 
     result = {"quadkey": list(quadkey)}
 
     if self.add_xyz_cols:
-        result["x"] = [t.x for t in tile]
-        result["y"] = [t.y for t in tile]
-        result["z"] = [t.z for t in tile]
+        result["x"] = list(x)
+        result["y"] = list(y)
+        result["z"] = [self.zoom_level] * len(quadkey)
 
     tiles_gdf = GeoDataFrame(
         result,
@@ -639,7 +1999,11 @@ def generate_grid_join(
         #     how='inner',
         #     predicate='intersects')
         intersect_tiles_gdf = get_parallel_intersects(
-            tiles_gdf, reprojected_gdf, n_workers=n_workers, progress=progress
+            tiles_gdf,
+            reprojected_gdf,
+            n_workers=n_workers,
+            progress=progress,
+            backend=backend,
         )
         keep_cols = list(tiles_gdf.columns.values)
         tiles_gdf = intersect_tiles_gdf[
@@ -653,79 +2017,350 @@ def generate_grid_join(
 
     return tiles_gdf.to_crs(aoi_gdf.crs)
 
-# %% ../notebooks/00_grids.ipynb 29
+# %% ../notebooks/00_grids.ipynb 41
 class FastBingTileGridGenerator:
     EPSILON = 1e-14
     PIXEL_DTYPE = polygon_fill.PIXEL_DTYPE
     SUBPOLYGON_ID_COL = polygon_fill.SUBPOLYGON_ID_COL
     MAX_ZOOM = 30
+    OUTPUT_TYPES = ["pandas", "spans", "polars", "arrow"]
+    PREDICATES = ["intersects", "centroid"]
+    QUADKEY_TYPES = ["str", "int"]
+    BOUNDARY_CORRECTION_TYPES = ["union", "strtree"]
 
     def __init__(
         self,
         zoom_level: int,  # Zoom level of tile. See: https://docs.microsoft.com/en-us/bingmaps/articles/bing-maps-tile-system for more info
         return_geometry: bool = True,  # If geometry should be returned. Setting this to false will only return quadkeys
         add_xyz_cols: bool = False,  # If xyz columns should be returned. Unlike BingTileGridGenerator, choosing to return xyz columns doesn't substantionally add compute time.
+        quadkey_type: str = "str",  # "str" returns quadkeys as strings. "int" returns quadkeys as uint64 integers (see `xyz_to_quadkey_int`), which are cheaper to store and join
+        boundary_correction: Optional[
+            str
+        ] = None,  # "union" checks the off boundary tiles against the union of all polygon boundaries, "strtree" checks each tile only against the boundaries of the polygons with its id. Defaults to "strtree" if unique_id_col is given, otherwise "union".
     ):
         self.zoom_level = zoom_level
         self.return_geometry = return_geometry
         self.add_xyz_cols = add_xyz_cols
+        self.quadkey_type = quadkey_type
+        self.boundary_correction = boundary_correction
 
         if self.zoom_level > self.MAX_ZOOM:
             raise NotImplementedError(
                 f"Maximum allowed zoom level is {self.MAX_ZOOM}. Input was {self.zoom_level}"
             )
+        if self.quadkey_type not in self.QUADKEY_TYPES:
+            raise ValueError(
+                f"{self.quadkey_type} quadkey_type is not supported. Please select from these options {self.QUADKEY_TYPES}"
+            )
+        if (
+            self.boundary_correction is not None
+            and self.boundary_correction not in self.BOUNDARY_CORRECTION_TYPES
+        ):
+            raise ValueError(
+                f"{self.boundary_correction} boundary_correction is not supported. Please select from these options {self.BOUNDARY_CORRECTION_TYPES}"
+            )
 
-# %% ../notebooks/00_grids.ipynb 30
+# %% ../notebooks/00_grids.ipynb 42
 @patch
 def generate_grid(
+    self: FastBingTileGridGenerator,
+    aoi_gdf: GeoDataFrame,  # polygons, lines or points. Lines are gridded by the tiles they pass through and points by the tile that contains them.
+    unique_id_col: Optional[
+        str
+    ] = None,  # the ids under this column will be preserved in the output tiles
+    output: str = "pandas",  # "pandas" returns a GeoDataFrame (or DataFrame if return_geometry is False) of tiles. "polars" and "arrow" return a polars DataFrame or pyarrow Table with the tiles as a GeoArrow WKB geometry column (if return_geometry is True), without creating shapely geometries. "spans" returns a polars DataFrame of horizontal runs of tiles with y, x_start and x_end columns (see `polygon_fill.merge_spans`)
+    n_workers: int = 1,  # number of processes used to fill the AOI polygons. If more than 1, the polygons are split into shards with similar vertex counts.
+    predicate: str = "intersects",  # "intersects" returns every tile that touches the AOI. "centroid" only returns the tiles whose centre is inside the AOI, which skips the boundary error correction.
+) -> Union[GeoDataFrame, pd.DataFrame, pl.DataFrame, pa.Table]:
+
+    if output not in self.OUTPUT_TYPES:
+        raise ValueError(
+            f"{output} output is not supported. Please select from these options {self.OUTPUT_TYPES}"
+        )
+    if predicate not in self.PREDICATES:
+        raise ValueError(
+            f"{predicate} predicate is not supported. Please select from these options {self.PREDICATES}"
+        )
+
+    return_spans = output == "spans"
+    tiles_in_geom = self._generate_tiles(
+        aoi_gdf, unique_id_col, return_spans, n_workers, predicate
+    )
+    if return_spans:
+        return tiles_in_geom
+
+    return self._tiles_to_output(tiles_in_geom, unique_id_col, output)
+
+# %% ../notebooks/00_grids.ipynb 43
+@patch
+def generate_grid_iter(
+    self: FastBingTileGridGenerator,
+    aoi_gdf: GeoDataFrame,  # polygons, lines or points. Lines are gridded by the tiles they pass through and points by the tile that contains them.
+    unique_id_col: Optional[
+        str
+    ] = None,  # the ids under this column will be preserved in the output tiles
+    chunk_size: int = 100_000,  # maximum number of tiles per chunk
+    n_workers: int = 1,  # number of processes used to fill the AOI polygons
+    predicate: str = "intersects",  # "intersects" returns every tile that touches the AOI. "centroid" only returns the tiles whose centre is inside the AOI, which skips the boundary error correction.
+    output: str = "pandas",  # "pandas" yields GeoDataFrames (or DataFrames if return_geometry is False). "polars" and "arrow" yield polars DataFrames or pyarrow Tables with a GeoArrow WKB geometry column.
+) -> Iterator[Union[GeoDataFrame, pd.DataFrame, pl.DataFrame, pa.Table]]:
+    """Generates the grid as dataframes of at most chunk_size tiles, ordered by id, y and x.
+    Only the spans of the grid are kept in memory, so the full grid is never materialized.
+    """
+    if output not in ITER_OUTPUT_TYPES:
+        raise ValueError(
+            f"{output} output is not supported. Please select from these options {ITER_OUTPUT_TYPES}"
+        )
+    if predicate not in self.PREDICATES:
+        raise ValueError(
+            f"{predicate} predicate is not supported. Please select from these options {self.PREDICATES}"
+        )
+    spans_in_geom = self._generate_tiles(
+        aoi_gdf, unique_id_col, True, n_workers, predicate
+    )
+    for tiles_in_geom in polygon_fill.iter_expand_spans(spans_in_geom, chunk_size):
+        yield self._tiles_to_output(tiles_in_geom, unique_id_col, output)
+
+# %% ../notebooks/00_grids.ipynb 44
+PARENT_QUADKEY_COL = "parent_quadkey"
+
+
+def _coarsen_spans(
+    spans_df: pl.DataFrame,  # dataframe with y, x_start and x_end columns. All other columns are treated as ids.
+    levels_up: int,  # number of zoom levels between the spans and the coarser spans
+) -> pl.DataFrame:
+    """Returns the spans of the parent tiles levels_up zoom levels above the tiles in the spans"""
+    tiles_per_parent = 1 << levels_up
+    coarse_spans_df = spans_df.with_columns(
+        pl.col(polygon_fill.SPAN_COLS) // tiles_per_parent
+    )
+    return polygon_fill.merge_spans(coarse_spans_df)
+
+
+@patch
+def _at_zoom_level(
+    self: FastBingTileGridGenerator,
+    zoom_level: int,
+) -> FastBingTileGridGenerator:
+    """Returns a generator with the same settings at another zoom level"""
+    return FastBingTileGridGenerator(
+        zoom_level,
+        return_geometry=self.return_geometry,
+        add_xyz_cols=self.add_xyz_cols,
+        quadkey_type=self.quadkey_type,
+        boundary_correction=self.boundary_correction,
+    )
+
+# %% ../notebooks/00_grids.ipynb 45
+@patch
+def generate_grid_pyramid(
     self: FastBingTileGridGenerator,
     aoi_gdf: GeoDataFrame,
+    zoom_levels: Iterable[
+        int
+    ],  # zoom levels of the pyramid. The zoom_level of the generator is not used.
     unique_id_col: Optional[
         str
     ] = None,  # the ids under this column will be preserved in the output tiles
-) -> Union[GeoDataFrame, pd.DataFrame]:
+    output: str = "pandas",  # same options as `generate_grid`. Except for "spans", the tiles of every level but the coarsest have a parent_quadkey column with the quadkey of their tile in the next coarser level.
+    n_workers: int = 1,  # number of processes used to fill the AOI polygons
+) -> Dict[int, Union[GeoDataFrame, pd.DataFrame, pl.DataFrame, pa.Table]]:
+    """Generates the grids of several zoom levels, ordered from the coarsest, with a single polygon fill at the finest zoom level.
+    A tile intersects the AOI only if one of its children does, so the coarser levels are derived by shifting the x and y of the finer tiles.
+    """
+    if output not in self.OUTPUT_TYPES:
+        raise ValueError(
+            f"{output} output is not supported. Please select from these options {self.OUTPUT_TYPES}"
+        )
+    zoom_levels = sorted(set(zoom_levels))
+    if len(zoom_levels) == 0:
+        raise ValueError("zoom_levels should not be empty")
+    if zoom_levels[0] < 0:
+        raise ValueError(
+            f"zoom levels should not be negative but found {zoom_levels[0]}"
+        )
+    if zoom_levels[-1] > self.MAX_ZOOM:
+        raise NotImplementedError(
+            f"Maximum allowed zoom level is {self.MAX_ZOOM}. Input was {zoom_levels[-1]}"
+        )
 
-    vertices = polygon_fill.polygons_to_vertices(aoi_gdf, unique_id_col)
-    vertices = self._latlng_to_xy(vertices, lat_col="y", lng_col="x")
+    level_spans = {
+        zoom_levels[-1]: self._at_zoom_level(zoom_levels[-1])._generate_tiles(
+            aoi_gdf, unique_id_col, True, n_workers
+        )
+    }
+    for zoom_level, child_zoom_level in zip(
+        reversed(zoom_levels[:-1]), reversed(zoom_levels[1:])
+    ):
+        level_spans[zoom_level] = _coarsen_spans(
+            level_spans[child_zoom_level], child_zoom_level - zoom_level
+        )
+    if output == "spans":
+        return {zoom_level: level_spans[zoom_level] for zoom_level in zoom_levels}
+
+    pyramid = {}
+    for parent_zoom_level, zoom_level in zip([None] + zoom_levels[:-1], zoom_levels):
+        tiles_in_geom = polygon_fill.expand_spans(level_spans[zoom_level])
+        pyramid[zoom_level] = self._at_zoom_level(zoom_level)._tiles_to_output(
+            tiles_in_geom, unique_id_col, output, parent_zoom_level=parent_zoom_level
+        )
+    return pyramid
 
-    polygon_fill_result = polygon_fill.fast_polygon_fill(vertices, unique_id_col)
-    tiles_in_geom = polygon_fill_result["tiles_in_geom"]
+# %% ../notebooks/00_grids.ipynb 46
+@patch
+def _generate_tiles(
+    self: FastBingTileGridGenerator,
+    aoi_gdf: GeoDataFrame,
+    unique_id_col: Optional[str],
+    return_spans: bool,
+    n_workers: int,
+    predicate: str = "intersects",
+) -> pl.DataFrame:
+    """Returns the tiles (or spans of tiles) in the AOI"""
+    polygons_gdf, lines_gdf, points_gdf = _split_geometry_types(aoi_gdf)
+    tiles = []
+    if not polygons_gdf.empty or (lines_gdf.empty and points_gdf.empty):
+        tiles.append(
+            self._generate_polygon_tiles(
+                polygons_gdf, unique_id_col, return_spans, n_workers, predicate
+            )
+        )
+    if not (lines_gdf.empty and points_gdf.empty):
+        tiles.append(
+            self._line_and_point_tiles(
+                lines_gdf, points_gdf, unique_id_col, return_spans
+            )
+        )
+    return _concat_tiles(tiles, return_spans)
 
-    # this is error correction on the polygon boundary (not the square boundary)
-    tiles_off_boundary = polygon_fill_result["tiles_off_boundary"]
-    if not tiles_off_boundary.is_empty():
-        off_boundary_bboxes = self._xy_to_bbox(tiles_off_boundary, "x", "y")
-        all_polygon_boundary = aoi_gdf.boundary.union_all(method="unary")
-        intersects_boundary_bool = off_boundary_bboxes.intersects(all_polygon_boundary)
-        addtl_tiles_in_geom = tiles_off_boundary.filter(
-            pl.Series(intersects_boundary_bool)
+
+@patch
+def _generate_polygon_tiles(
+    self: FastBingTileGridGenerator,
+    polygons_gdf: GeoDataFrame,
+    unique_id_col: Optional[str],
+    return_spans: bool,
+    n_workers: int,
+    predicate: str = "intersects",
+) -> pl.DataFrame:
+    vertices = polygon_fill.polygons_to_vertices(polygons_gdf, unique_id_col)
+    if predicate == "centroid":
+        # the tile centres are evaluated directly, so there are no boundary tiles to correct
+        vertices = self._latlng_to_xy(vertices, lat_col="y", lng_col="x", floor=False)
+        return polygon_fill.centroid_polygon_fill(
+            vertices, unique_id_col, return_spans=return_spans
         )
 
-        tiles_in_geom = pl.concat([tiles_in_geom, addtl_tiles_in_geom])
+    vertices = self._latlng_to_xy(vertices, lat_col="y", lng_col="x")
 
-    quadkey_expr = self._xyz_to_quadkey(
-        pl.col("x"),
-        pl.col("y"),
+    polygons = polygon_fill.explode_polygons(polygons_gdf, unique_id_col).geometry
+    boundary_correction = _resolve_boundary_correction(
+        self.boundary_correction, unique_id_col
     )
-    tiles_in_geom = tiles_in_geom.with_columns(quadkey=quadkey_expr)
+    if n_workers > 1:
+        tiles_in_geom = _parallel_fill_polygons(
+            vertices,
+            polygons,
+            self,
+            unique_id_col,
+            return_spans,
+            n_workers,
+            boundary_correction=boundary_correction,
+        )
+    else:
+        tiles_in_geom = _fill_polygons(
+            (vertices, polygons),
+            self,
+            unique_id_col,
+            return_spans,
+            boundary_correction=boundary_correction,
+        )
+    return tiles_in_geom
 
-    if self.return_geometry:
-        bboxes = self._xy_to_bbox(tiles_in_geom, "x", "y")
 
-        if not tiles_off_boundary.is_empty():
-            addtl_boundary_bboxes = off_boundary_bboxes[intersects_boundary_bool].copy()
-            bboxes = pd.concat([bboxes, addtl_boundary_bboxes], ignore_index=True)
+@patch
+def _line_and_point_tiles(
+    self: FastBingTileGridGenerator,
+    lines_gdf: GeoDataFrame,
+    points_gdf: GeoDataFrame,
+    unique_id_col: Optional[str],
+    return_spans: bool,
+) -> pl.DataFrame:
+    """Returns the tiles (or spans of tiles) that the lines pass through and that contain the points"""
+    line_vertices = polygon_fill.lines_to_vertices(lines_gdf, unique_id_col)
+    line_vertices = self._latlng_to_xy(
+        line_vertices, lat_col="y", lng_col="x", floor=False
+    )
+    point_vertices = polygon_fill.points_to_vertices(points_gdf, unique_id_col)
+    point_vertices = self._latlng_to_xy(
+        point_vertices, lat_col="y", lng_col="x", floor=False
+    )
+    return _line_and_point_pixels(
+        line_vertices, point_vertices, unique_id_col, return_spans
+    )
+
+
+@patch
+def _tiles_to_output(
+    self: FastBingTileGridGenerator,
+    tiles_in_geom: pl.DataFrame,
+    unique_id_col: Optional[str],
+    output: str = "pandas",
+    parent_zoom_level: Optional[
+        int
+    ] = None,  # if given, adds a parent_quadkey column with the quadkeys of the parent tiles at this zoom level
+) -> Union[GeoDataFrame, pd.DataFrame, pl.DataFrame, pa.Table]:
+    if self.quadkey_type == "int":
+        quadkey = xyz_to_quadkey_int(
+            tiles_in_geom["x"].to_numpy(),
+            tiles_in_geom["y"].to_numpy(),
+            self.zoom_level,
+        )
+        tiles_in_geom = tiles_in_geom.with_columns(
+            pl.Series("quadkey", quadkey, dtype=pl.UInt64)
+        )
+    else:
+        quadkey_expr = self._xyz_to_quadkey(
+            pl.col("x"),
+            pl.col("y"),
+        )
+        tiles_in_geom = tiles_in_geom.with_columns(quadkey=quadkey_expr)
+
+    if parent_zoom_level is not None:
+        if self.quadkey_type == "int":
+            parent_quadkey = quadkey_int_to_parent(
+                tiles_in_geom["quadkey"].to_numpy(), parent_zoom_level
+            )
+            tiles_in_geom = tiles_in_geom.with_columns(
+                pl.Series(PARENT_QUADKEY_COL, parent_quadkey, dtype=pl.UInt64)
+            )
+        else:
+            tiles_in_geom = tiles_in_geom.with_columns(
+                pl.col("quadkey")
+                .str.slice(0, parent_zoom_level)
+                .alias(PARENT_QUADKEY_COL)
+            )
+
+    corners = None
+    if self.return_geometry and output in TABLE_OUTPUT_TYPES:
+        corners = _bounds_to_corners(*self._xy_to_bounds(tiles_in_geom, "x", "y"))
+    elif self.return_geometry:
+        bboxes = self._xy_to_bbox(tiles_in_geom, "x", "y")
 
     if not self.add_xyz_cols:
         tiles_in_geom = tiles_in_geom.drop(["x", "y"])
     else:
         tiles_in_geom = tiles_in_geom.with_columns(z=pl.lit(self.zoom_level))
         column_order = ["quadkey", "x", "y", "z"]
+        if parent_zoom_level is not None:
+            column_order += [PARENT_QUADKEY_COL]
         if unique_id_col is not None:
             column_order += [unique_id_col]
         assert set(tiles_in_geom.columns) == set(column_order)
         tiles_in_geom = tiles_in_geom.select(column_order)
 
+    if output in TABLE_OUTPUT_TYPES:
+        return _tiles_to_table(tiles_in_geom, corners, "epsg:4326", output)
     if self.return_geometry:
         tiles_in_geom = GeoDataFrame(tiles_in_geom.to_pandas(), geometry=bboxes)
     else:
@@ -733,14 +2368,44 @@ def generate_grid(
 
     return tiles_in_geom
 
-# %% ../notebooks/00_grids.ipynb 31
+# %% ../notebooks/00_grids.ipynb 47
+@patch
+def _filter_off_boundary_tiles(
+    self: FastBingTileGridGenerator,
+    tiles_off_boundary: pl.DataFrame,
+    polygons: GeoSeries,  # exploded AOI polygons in EPSG:4326
+    unique_id_col: Optional[str] = None,
+    boundary_correction: str = "union",
+) -> pl.DataFrame:
+    """Returns the off boundary tiles that intersect the polygon boundary"""
+    if tiles_off_boundary.is_empty():
+        return tiles_off_boundary
+
+    off_boundary_bboxes = self._xy_to_bbox(tiles_off_boundary, "x", "y")
+    intersects_boundary_bool = _intersects_polygon_boundary(
+        off_boundary_bboxes,
+        tiles_off_boundary,
+        polygons,
+        unique_id_col,
+        boundary_correction,
+    )
+    addtl_tiles_in_geom = tiles_off_boundary.filter(pl.Series(intersects_boundary_bool))
+    return addtl_tiles_in_geom
+
+
 @patch
-def _lat_to_ytile(self: FastBingTileGridGenerator, lat: pl.Expr) -> pl.Expr:
+def _lat_to_ytile(
+    self: FastBingTileGridGenerator,
+    lat: pl.Expr,
+    floor: bool = True,  # if False, returns the continuous tile coordinate (e.g. 2.5 is the middle of tile 2) instead of the tile index
+) -> pl.Expr:
     logtan = pl.Expr.log(pl.Expr.tan((np.pi / 4) + (pl.Expr.radians(lat) / 2)))
 
     y = 0.5 - (logtan / (2 * np.pi))
 
     power_of_2 = int(np.power(2, self.zoom_level))
+    if not floor:
+        return y.clip(0, 1) * power_of_2
 
     # To address loss of precision in round-tripping between tile
     # and lng/lat, points within EPSILON of the right side of a tile
@@ -760,9 +2425,15 @@ def _lat_to_ytile(self: FastBingTileGridGenerator, lat: pl.Expr) -> pl.Expr:
 
 
 @patch
-def _lng_to_xtile(self: FastBingTileGridGenerator, lng: pl.Expr) -> pl.Expr:
+def _lng_to_xtile(
+    self: FastBingTileGridGenerator,
+    lng: pl.Expr,
+    floor: bool = True,  # if False, returns the continuous tile coordinate (e.g. 2.5 is the middle of tile 2) instead of the tile index
+) -> pl.Expr:
     x = 0.5 + (lng / 360.0)
     power_of_2 = int(np.power(2, self.zoom_level))
+    if not floor:
+        return x.clip(0, 1) * power_of_2
 
     x_pixel_coord = pl.Expr.floor((x + self.EPSILON) * power_of_2)
 
@@ -784,10 +2455,11 @@ def _latlng_to_xy(
     df: pl.DataFrame,
     lat_col: str,
     lng_col: str,
+    floor: bool = True,  # if False, returns the continuous tile coordinates (e.g. 2.5 is the middle of tile 2) instead of the tile indices
 ) -> pl.DataFrame:
     xy_df = df.with_columns(
-        x=self._lng_to_xtile(pl.col(lng_col)),
-        y=self._lat_to_ytile(pl.col(lat_col)),
+        x=self._lng_to_xtile(pl.col(lng_col), floor=floor),
+        y=self._lat_to_ytile(pl.col(lat_col), floor=floor),
     )
 
     return xy_df
@@ -811,33 +2483,64 @@ def _ytile_to_lat(self: FastBingTileGridGenerator, ytile: pl.Expr) -> pl.Expr:
     return lat_deg
 
 
+def _unique_tiles(
+    tiles: pl.Series,
+) -> Tuple[pl.Series, np.ndarray]:
+    """Returns the unique tiles and the index of each tile in them"""
+    tiles_np = tiles.to_numpy()
+    if len(tiles_np) == 0:
+        return tiles, np.array([], dtype=np.int64)
+    min_tile = int(tiles_np.min())
+    n_tiles = int(tiles_np.max()) - min_tile + 1
+    if n_tiles <= len(tiles_np):
+        # every tile in the range, so the index is just the offset from the first one
+        unique_tiles = pl.Series(
+            tiles.name, np.arange(min_tile, min_tile + n_tiles), dtype=tiles.dtype
+        )
+        return unique_tiles, tiles_np.astype(np.int64) - min_tile
+    unique_tiles, tile_idx = np.unique(tiles_np, return_inverse=True)
+    return pl.Series(tiles.name, unique_tiles, dtype=tiles.dtype), tile_idx.ravel()
+
+
 @patch
-def _xy_to_bbox(
+def _xy_to_bounds(
     self: FastBingTileGridGenerator,
     df: pl.DataFrame,
     xtile_col: str,
     ytile_col: str,
-) -> GeoSeries:
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
 
-    upper_left_lng = self._xtile_to_lng(pl.col(xtile_col))
-    upper_left_lat = self._ytile_to_lat(pl.col(ytile_col))
-    lower_right_lng = self._xtile_to_lng(pl.col(xtile_col) + 1)
-    lower_right_lat = self._ytile_to_lat(pl.col(ytile_col) + 1)
+    # tiles in the same column share longitudes and tiles in the same row share latitudes,
+    # so the edges are only computed once per column and row
+    xtiles, xtile_idx = _unique_tiles(df[xtile_col])
+    ytiles, ytile_idx = _unique_tiles(df[ytile_col])
 
-    bbox_df = df.select(
-        minx=upper_left_lng,
-        miny=lower_right_lat,
-        maxx=lower_right_lng,
-        maxy=upper_left_lat,
+    lng_df = xtiles.to_frame().select(
+        upper_left_lng=self._xtile_to_lng(pl.col(xtile_col)),
+        lower_right_lng=self._xtile_to_lng(pl.col(xtile_col) + 1),
+    )
+    lat_df = ytiles.to_frame().select(
+        upper_left_lat=self._ytile_to_lat(pl.col(ytile_col)),
+        lower_right_lat=self._ytile_to_lat(pl.col(ytile_col) + 1),
     )
 
-    # use vectorized version in shapely 2.0
-    bboxes = box(
-        bbox_df["minx"].to_list(),
-        bbox_df["miny"].to_list(),
-        bbox_df["maxx"].to_list(),
-        bbox_df["maxy"].to_list(),
+    return (
+        lng_df["upper_left_lng"].to_numpy()[xtile_idx],
+        lat_df["lower_right_lat"].to_numpy()[ytile_idx],
+        lng_df["lower_right_lng"].to_numpy()[xtile_idx],
+        lat_df["upper_left_lat"].to_numpy()[ytile_idx],
     )
+
+
+@patch
+def _xy_to_bbox(
+    self: FastBingTileGridGenerator,
+    df: pl.DataFrame,
+    xtile_col: str,
+    ytile_col: str,
+) -> GeoSeries:
+    # use vectorized version in shapely 2.0
+    bboxes = box(*self._xy_to_bounds(df, xtile_col, ytile_col))
     bboxes = GeoSeries(bboxes, crs="epsg:4326")
 
     return bboxes
@@ -855,3 +2558,300 @@ def _xyz_to_quadkey(self: FastBingTileGridGenerator, x: pl.Expr, y: pl.Expr) ->
     quadkey = pl.concat_str(quadkey_digit_exprs)
 
     return quadkey
+
+# %% ../notebooks/00_grids.ipynb 49
+QUADKEY_INT_DTYPE = np.uint64
+QUADKEY_INT_MAX_ZOOM = 31
+
+
+def _spread_bits(v: np.ndarray) -> np.ndarray:
+    """Moves the lower 32 bits of v to the even bits of a uint64"""
+    v = v.astype(QUADKEY_INT_DTYPE) & 0xFFFFFFFF
+    v = (v | (v << 16)) & 0x0000FFFF0000FFFF
+    v = (v | (v << 8)) & 0x00FF00FF00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F0F0F0F0F
+    v = (v | (v << 2)) & 0x3333333333333333
+    v = (v | (v << 1)) & 0x5555555555555555
+    return v
+
+
+def _compact_bits(v: np.ndarray) -> np.ndarray:
+    """Inverse of `_spread_bits`"""
+    v = v.astype(QUADKEY_INT_DTYPE) & 0x5555555555555555
+    v = (v | (v >> 1)) & 0x3333333333333333
+    v = (v | (v >> 2)) & 0x0F0F0F0F0F0F0F0F
+    v = (v | (v >> 4)) & 0x00FF00FF00FF00FF
+    v = (v | (v >> 8)) & 0x0000FFFF0000FFFF
+    v = (v | (v >> 16)) & 0xFFFFFFFF
+    return v
+
+# %% ../notebooks/00_grids.ipynb 50
+def xyz_to_quadkey_int(
+    x: np.ndarray,  # tile x
+    y: np.ndarray,  # tile y
+    zoom_level: int,
+) -> np.ndarray:
+    """Converts tile coordinates to integer quadkeys"""
+    if not 0 <= zoom_level <= QUADKEY_INT_MAX_ZOOM:
+        raise ValueError(
+            f"zoom_level should be between 0 and {QUADKEY_INT_MAX_ZOOM} but instead is {zoom_level}"
+        )
+    sentinel = QUADKEY_INT_DTYPE(1) << QUADKEY_INT_DTYPE(2 * zoom_level)
+    return sentinel | _spread_bits(np.asarray(x)) | (_spread_bits(np.asarray(y)) << 1)
+
+
+def quadkey_int_to_xyz(
+    quadkey_ints: np.ndarray,  # integer quadkeys
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Converts integer quadkeys to tile x, y and zoom level"""
+    quadkey_ints = np.asarray(quadkey_ints, dtype=QUADKEY_INT_DTYPE)
+    zoom_level = quadkey_int_zoom_level(quadkey_ints)
+    digits = quadkey_ints & ~(
+        QUADKEY_INT_DTYPE(1) << (2 * zoom_level).astype(QUADKEY_INT_DTYPE)
+    )
+    return (
+        _compact_bits(digits).astype(np.int64),
+        _compact_bits(digits >> 1).astype(np.int64),
+        zoom_level,
+    )
+
+
+def quadkey_int_zoom_level(
+    quadkey_ints: np.ndarray,  # integer quadkeys
+) -> np.ndarray:
+    """Returns the zoom level of each integer quadkey"""
+    quadkey_ints = np.asarray(quadkey_ints, dtype=QUADKEY_INT_DTYPE)
+    # quadkeys have at most 63 bits, so the float exponent is exactly the bit length
+    _, bit_length = np.frexp(quadkey_ints.astype(np.float64))
+    return ((bit_length - 1) // 2).astype(np.int64)
+
+
+def quadkey_int_to_parent(
+    quadkey_ints: np.ndarray,  # integer quadkeys
+    zoom_level: int,  # zoom level of the parents. It should not be more than the zoom level of the quadkeys.
+) -> np.ndarray:
+    """Returns the integer quadkeys of the parent tiles at zoom_level"""
+    quadkey_ints = np.asarray(quadkey_ints, dtype=QUADKEY_INT_DTYPE)
+    levels_up = quadkey_int_zoom_level(quadkey_ints) - zoom_level
+    if (levels_up < 0).any():
+        raise ValueError(
+            f"quadkey zoom levels cannot be less than the parent zoom level {zoom_level}"
+        )
+    return quadkey_ints >> (2 * levels_up).astype(QUADKEY_INT_DTYPE)
+
+# %% ../notebooks/00_grids.ipynb 51
+def quadkeys_to_ints(
+    quadkeys: Iterable[str],  # string quadkeys
+) -> np.ndarray:
+    """Converts string quadkeys to integer quadkeys"""
+    quadkeys = np.asarray(quadkeys, dtype="S")
+    if quadkeys.itemsize > QUADKEY_INT_MAX_ZOOM:
+        raise ValueError(
+            f"Maximum allowed quadkey zoom level is {QUADKEY_INT_MAX_ZOOM}"
+        )
+    zoom_level = np.char.str_len(quadkeys)
+    # the byte strings are padded with null bytes up to the longest quadkey
+    digits = quadkeys.view(np.uint8).reshape(len(quadkeys), quadkeys.itemsize)
+
+    quadkey_ints = np.ones(len(quadkeys), dtype=QUADKEY_INT_DTYPE)
+    for level in range(quadkeys.itemsize):
+        in_quadkey = level < zoom_level
+        digit = digits[:, level].astype(np.int64) - ord("0")
+        if ((digit < 0) | (digit > 3))[in_quadkey].any():
+            raise ValueError("quadkeys should only have the digits 0, 1, 2 and 3")
+        shifted = (quadkey_ints << 2) | digit.astype(QUADKEY_INT_DTYPE)
+        quadkey_ints = np.where(in_quadkey, shifted, quadkey_ints)
+    return quadkey_ints
+
+
+def ints_to_quadkeys(
+    quadkey_ints: np.ndarray,  # integer quadkeys
+) -> np.ndarray:
+    """Converts integer quadkeys to string quadkeys"""
+    quadkey_ints = np.asarray(quadkey_ints, dtype=QUADKEY_INT_DTYPE)
+    zoom_level = quadkey_int_zoom_level(quadkey_ints)
+    max_zoom_level = int(zoom_level.max()) if len(zoom_level) else 0
+    if max_zoom_level == 0:
+        return np.full(len(quadkey_ints), "", dtype=str)
+
+    # null bytes after the last digit are dropped when the bytes are read as strings
+    digits = np.zeros((len(quadkey_ints), max_zoom_level), dtype=np.uint8)
+    for level in range(max_zoom_level):
+        in_quadkey = level < zoom_level
+        shift = np.where(in_quadkey, 2 * (zoom_level - 1 - level), 0).astype(
+            QUADKEY_INT_DTYPE
+        )
+        digit = ((quadkey_ints >> shift) & 3).astype(np.uint8) + ord("0")
+        digits[:, level] = np.where(in_quadkey, digit, 0)
+    return digits.view(f"S{max_zoom_level}").ravel().astype(str)
+
+# %% ../notebooks/00_grids.ipynb 53
+class AdaptiveBingTileGridGenerator:
+    MAX_ZOOM = FastBingTileGridGenerator.MAX_ZOOM
+
+    def __init__(
+        self,
+        min_zoom_level: int,  # zoom level of the initial tiles
+        max_zoom_level: int,  # zoom level of the finest tiles
+        max_count: int,  # tiles with more data features than this are split, unless they are at max_zoom_level
+        return_geometry: bool = True,  # If geometry should be returned. Setting this to false will only return quadkeys
+        add_xyz_cols: bool = False,  # If xyz columns should be returned
+        quadkey_type: str = "str",  # "str" returns quadkeys as strings. "int" returns quadkeys as uint64 integers (see `xyz_to_quadkey_int`), which also encode the zoom level
+    ):
+        self.min_zoom_level = min_zoom_level
+        self.max_zoom_level = max_zoom_level
+        self.max_count = max_count
+        self.return_geometry = return_geometry
+        self.add_xyz_cols = add_xyz_cols
+        self.quadkey_type = quadkey_type
+
+        if self.max_zoom_level > self.MAX_ZOOM:
+            raise NotImplementedError(
+                f"Maximum allowed zoom level is {self.MAX_ZOOM}. Input was {self.max_zoom_level}"
+            )
+        if not 0 <= self.min_zoom_level <= self.max_zoom_level:
+            raise ValueError(
+                f"min_zoom_level should be between 0 and max_zoom_level {self.max_zoom_level} but instead is {self.min_zoom_level}"
+            )
+        if self.max_count < 0:
+            raise ValueError(
+                f"max_count should not be negative but instead is {self.max_count}"
+            )
+
+# %% ../notebooks/00_grids.ipynb 54
+@patch
+def generate_grid(
+    self: AdaptiveBingTileGridGenerator,
+    aoi_gdf: GeoDataFrame,
+    data_gdf: GeoDataFrame,  # features that are counted in each tile. Non-point features are counted at their representative point.
+    n_workers: int = 1,  # number of processes used to fill the AOI polygons at min_zoom_level
+) -> Union[GeoDataFrame, pd.DataFrame]:
+    """Generates the tiles of the AOI, splitting the tiles with more than max_count data features.
+    The counts include the features in the tile that are outside the AOI."""
+    data_quadkeys = np.sort(self._get_data_quadkey_ints(data_gdf))
+    aoi_tree = STRtree(
+        polygon_fill.explode_polygons(aoi_gdf.to_crs("epsg:4326")).geometry.values
+    )
+
+    tiles_in_geom = FastBingTileGridGenerator(self.min_zoom_level)._generate_tiles(
+        aoi_gdf, None, False, n_workers
+    )
+    x = tiles_in_geom["x"].to_numpy().astype(np.int64)
+    y = tiles_in_geom["y"].to_numpy().astype(np.int64)
+
+    level_tiles = []
+    for zoom_level in range(self.min_zoom_level, self.max_zoom_level + 1):
+        if zoom_level < self.max_zoom_level:
+            is_split = (
+                _count_quadkey_descendants(
+                    xyz_to_quadkey_int(x, y, zoom_level),
+                    data_quadkeys,
+                    self.max_zoom_level - zoom_level,
+                )
+                > self.max_count
+            )
+        else:
+            is_split = np.zeros(len(x), dtype=bool)
+
+        level_tiles.append((zoom_level, x[~is_split], y[~is_split]))
+        if not is_split.any():
+            break
+
+        # only keep the children that still intersect the AOI
+        x = (2 * x[is_split])[:, None] + np.array([0, 1, 0, 1])
+        y = (2 * y[is_split])[:, None] + np.array([0, 0, 1, 1])
+        x, y = x.ravel(), y.ravel()
+        children_df = pl.DataFrame({"x": x, "y": y})
+        children = (
+            FastBingTileGridGenerator(zoom_level + 1)
+            ._xy_to_bbox(children_df, "x", "y")
+            .values
+        )
+        is_child_in_geom = np.zeros(len(children), dtype=bool)
+        is_child_in_geom[aoi_tree.query(children, predicate="intersects")[0]] = True
+        x, y = x[is_child_in_geom], y[is_child_in_geom]
+
+    tiles = []
+    for zoom_level, level_x, level_y in level_tiles:
+        generator = FastBingTileGridGenerator(
+            zoom_level,
+            return_geometry=self.return_geometry,
+            add_xyz_cols=self.add_xyz_cols,
+            quadkey_type=self.quadkey_type,
+        )
+        level_df = pl.DataFrame(
+            [
+                pl.Series("x", level_x, dtype=generator.PIXEL_DTYPE),
+                pl.Series("y", level_y, dtype=generator.PIXEL_DTYPE),
+            ]
+        )
+        tiles.append(generator._tiles_to_output(level_df, None))
+
+    return pd.concat(tiles, ignore_index=True)
+
+# %% ../notebooks/00_grids.ipynb 55
+def _count_quadkey_descendants(
+    quadkey_ints: np.ndarray,  # integer quadkeys of the tiles
+    sorted_quadkey_ints: np.ndarray,  # sorted integer quadkeys levels_down zoom levels below the tiles
+    levels_down: int,
+) -> np.ndarray:
+    """Counts the quadkeys in sorted_quadkey_ints that are descendants of each tile.
+    The descendants of a tile are the integer quadkeys from the tile's quadkey shifted by 2 bits per level,
+    up to the next tile's quadkey shifted the same way."""
+    shift = QUADKEY_INT_DTYPE(2 * levels_down)
+    first_descendant = quadkey_ints << shift
+    next_tile_descendant = (quadkey_ints + QUADKEY_INT_DTYPE(1)) << shift
+    return np.searchsorted(sorted_quadkey_ints, next_tile_descendant) - np.searchsorted(
+        sorted_quadkey_ints, first_descendant
+    )
+
+
+@patch
+def _get_data_quadkey_ints(
+    self: AdaptiveBingTileGridGenerator,
+    data_gdf: GeoDataFrame,
+) -> np.ndarray:
+    """Returns the integer quadkeys of the data features at max_zoom_level"""
+    data_gdf = data_gdf.to_crs("epsg:4326")
+    geometry = data_gdf.geometry.values
+    is_point = data_gdf.geom_type == "Point"
+    if not is_point.all():
+        geometry = np.where(
+            is_point, geometry, data_gdf.geometry.representative_point().values
+        )
+    coords = get_coordinates(geometry)
+
+    coords_df = pl.DataFrame({"lng": coords[:, 0], "lat": coords[:, 1]})
+    tiles_df = FastBingTileGridGenerator(self.max_zoom_level)._latlng_to_xy(
+        coords_df, lat_col="lat", lng_col="lng"
+    )
+    return xyz_to_quadkey_int(
+        tiles_df["x"].to_numpy(), tiles_df["y"].to_numpy(), self.max_zoom_level
+    )
+
+# %% ../notebooks/00_grids.ipynb 57
+def write_grid_parquet(
+    grid_chunks: Iterable[
+        Union[GeoDataFrame, DataFrame, pl.DataFrame, pa.Table]
+    ],  # chunks of a grid, e.g. from `generate_grid_iter`
+    path: str,  # directory of the output dataset. It should not exist or be empty.
+    **kwargs,  # passed to the parquet writer of each chunk: `to_parquet` for pandas, `write_parquet` for polars and `pyarrow.parquet.write_table` for arrow
+) -> List[str]:
+    """Writes each chunk of the grid as a part of a parquet dataset and returns the paths of the parts"""
+    if os.path.isdir(path) and os.listdir(path):
+        raise FileExistsError(
+            f"{path} is not empty. Please select a new or empty directory"
+        )
+    os.makedirs(path, exist_ok=True)
+
+    part_paths = []
+    for part_idx, chunk in enumerate(grid_chunks):
+        part_path = os.path.join(path, f"part-{part_idx:05d}.parquet")
+        if isinstance(chunk, pl.DataFrame):
+            chunk.write_parquet(part_path, **kwargs)
+        elif isinstance(chunk, pa.Table):
+            pq.write_table(chunk, part_path, **kwargs)
+        else:
+            chunk.to_parquet(part_path, index=False, **kwargs)
+        part_paths.append(part_path)
+    return part_paths
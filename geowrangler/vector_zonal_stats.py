@@ -1,19 +1,27 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../notebooks/02_vector_zonal_stats.ipynb.
 
 # %% auto 0
-__all__ = ['create_zonal_stats', 'compute_quadkey', 'create_bingtile_zonal_stats']
+__all__ = ['create_zonal_stats', 'ZonalJoinPlan', 'load_zonal_join_plan', 'compute_quadkey', 'create_bingtile_zonal_stats']
 
 # %% ../notebooks/02_vector_zonal_stats.ipynb 6
 GEO_INDEX_NAME = "__GeoWrangleer_aoi_index"
 
 # %% ../notebooks/02_vector_zonal_stats.ipynb 7
+import hashlib
 from functools import partial
-from typing import Any, Dict, List
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import geopandas as gpd
 import morecantile
 import numpy as np
 import pandas as pd
+import polars as pl
+import pyogrio
+from fastcore.all import parallel
+from fastcore.basics import patch
+from shapely.geometry import box
 
 # %% ../notebooks/02_vector_zonal_stats.ipynb 11
 def _fix_agg(
@@ -197,6 +205,15 @@ def _aggregate_stats(
     """
     agg_dicts = _build_agg_args(expanded_aggs)
     aggregates = groups.agg(**agg_dicts)
+    return _merge_aggregates(aoi, aggregates, expanded_aggs)
+
+
+def _merge_aggregates(
+    aoi: pd.DataFrame,  # Area of interest
+    aggregates: pd.DataFrame,  # Aggregates indexed by GEO_INDEX_NAME
+    expanded_aggs: List[Dict[str, Any]],  # A list of expanded aggs
+) -> pd.DataFrame:
+    """Merge the aggregates back to aoi dataframe, filling in the NAs of the aggs with fillna set"""
     results = aoi.merge(
         aggregates, how="left", on=GEO_INDEX_NAME, suffixes=(None, "_y")
     )
@@ -205,42 +222,468 @@ def _aggregate_stats(
     return results
 
 # %% ../notebooks/02_vector_zonal_stats.ipynb 44
+GROUPBY_ENGINES = ["pandas", "polars"]
+ZONAL_STATS_ENGINES = ["pandas", "numpy", "polars"]
+NUMPY_AGG_FUNCS = ["count", "sum", "mean", "min", "max", "std"]
+POLARS_AGG_FUNCS = {
+    "count": lambda column: pl.col(column).count().cast(pl.Int64),
+    "nunique": lambda column: pl.col(column).drop_nulls().n_unique().cast(pl.Int64),
+    "sum": lambda column: pl.col(column).sum(),
+    "mean": lambda column: pl.col(column).mean(),
+    "median": lambda column: pl.col(column).median(),
+    "min": lambda column: pl.col(column).min(),
+    "max": lambda column: pl.col(column).max(),
+    "std": lambda column: pl.col(column).std(),
+    "var": lambda column: pl.col(column).var(),
+    "first": lambda column: pl.col(column).drop_nulls().first(),
+    "last": lambda column: pl.col(column).drop_nulls().last(),
+}
+ENGINE_AGG_FUNCS = {"numpy": NUMPY_AGG_FUNCS, "polars": list(POLARS_AGG_FUNCS)}
+
+
+def _validate_engine(
+    engine: str,  # The zonal stats engine
+    fixed_aggs: List[Dict[str, Any]],  # A list of fixed agg specs
+    engines: List[str] = ZONAL_STATS_ENGINES,  # The engines supported by the caller
+) -> None:
+    if engine not in engines:
+        raise ValueError(
+            f"{engine} engine is not supported. Please select from these options {engines}"
+        )
+    if engine in ENGINE_AGG_FUNCS:
+        for i, agg in enumerate(fixed_aggs):
+            for func in agg["func"]:
+                if func not in ENGINE_AGG_FUNCS[engine]:
+                    raise ValueError(
+                        f"{func} func in agg[{i}] {agg} is not supported by the {engine} engine. Please select from these options {ENGINE_AGG_FUNCS[engine]}"
+                    )
+
+
+def _groupby_agg(
+    features: pd.DataFrame,  # Features with a GEO_INDEX_NAME column
+    agg_dicts: Dict,  # Named aggregations with output as key and a tuple of column and func as value
+    engine: str = "pandas",  # One of GROUPBY_ENGINES
+) -> pd.DataFrame:
+    """Groups the features by GEO_INDEX_NAME and computes the named aggregations, returning them indexed by GEO_INDEX_NAME"""
+    if engine == "polars":
+        return _polars_groupby_agg(features, agg_dicts)
+    return features.groupby(GEO_INDEX_NAME).agg(**agg_dicts)
+
+
+def _polars_groupby_agg(
+    features: pd.DataFrame,  # Features with a GEO_INDEX_NAME column
+    agg_dicts: Dict,  # Named aggregations with output as key and a tuple of column and func as value
+) -> pd.DataFrame:
+    """Computes the named aggregations with a multi-threaded polars group by over only the aggregated columns"""
+    columns = list(
+        dict.fromkeys([GEO_INDEX_NAME, *(column for column, _ in agg_dicts.values())])
+    )
+    aggregates = (
+        pl.from_pandas(pd.DataFrame(features[columns]))
+        .group_by(GEO_INDEX_NAME)
+        .agg(
+            [
+                POLARS_AGG_FUNCS[func](column).alias(output)
+                for output, (column, func) in agg_dicts.items()
+            ]
+        )
+    )
+    return aggregates.to_pandas().set_index(GEO_INDEX_NAME)
+
+
+def _segment_moments(
+    values: np.ndarray,  # Values of the pairs, sorted by aoi
+    starts: np.ndarray,  # Start of each aoi's segment of values
+    funcs: List[str],  # The NUMPY_AGG_FUNCS to compute the moments for
+) -> Dict[str, np.ndarray]:
+    """Computes the count, sum, min, max and sum of squared deviations from the mean (m2) of each segment of values that funcs need, skipping NaNs like pandas"""
+    is_valid = ~pd.isna(values)
+    moments = {"count": np.add.reduceat(is_valid.astype(np.int64), starts)}
+    if "min" in funcs:
+        moments["min"] = np.fmin.reduceat(values, starts)
+    if "max" in funcs:
+        moments["max"] = np.fmax.reduceat(values, starts)
+    if any(func in funcs for func in ["sum", "mean", "std"]):
+        sum_dtype = np.float64 if np.issubdtype(values.dtype, np.floating) else np.int64
+        moments["sum"] = np.add.reduceat(
+            np.where(is_valid, values, 0), starts, dtype=sum_dtype
+        )
+    if "std" in funcs:
+        # deviations from the mean, which is more stable than the sum of squares
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = moments["sum"] / moments["count"]
+        deviations = np.where(
+            is_valid, values - np.repeat(means, np.diff(starts, append=len(values))), 0
+        )
+        moments["m2"] = np.add.reduceat(deviations**2, starts)
+    return moments
+
+
+def _moments_to_agg(
+    moments: Dict[str, np.ndarray],  # Moments from `_segment_moments`
+    func: str,  # One of NUMPY_AGG_FUNCS
+) -> np.ndarray:
+    counts = moments["count"]
+    if func == "count":
+        return counts
+    if func == "sum":
+        return moments["sum"]
+    if func in ["min", "max"]:
+        return (
+            moments[func]
+            if counts.all()
+            else np.where(counts > 0, moments[func], np.nan)
+        )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if func == "mean":
+            return moments["sum"] / counts
+        # std with ddof=1 like pandas
+        return np.where(counts > 1, np.sqrt(moments["m2"] / (counts - 1)), np.nan)
+
+
+def _column_funcs(
+    expanded_aggs: List[Dict[str, Any]],  # A list of expanded aggs
+) -> Dict[str, List[str]]:
+    """Returns the funcs of each aggregated column"""
+    column_funcs = {}
+    for agg in expanded_aggs:
+        column_funcs.setdefault(agg["column"], []).append(agg["func"])
+    return column_funcs
+
+
+def _group_pairs(
+    aoi_idx: np.ndarray,  # aoi positions of the pairs
+    data_idx: np.ndarray,  # data positions of the pairs
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Sorts the pairs by aoi, returning them with the aoi position and start of each aoi's segment of pairs"""
+    order = np.argsort(aoi_idx, kind="stable")
+    aoi_idx, data_idx = aoi_idx[order], data_idx[order]
+    group_aoi_idx, starts = np.unique(aoi_idx, return_index=True)
+    return aoi_idx, data_idx, group_aoi_idx, starts
+
+
+def _pair_values(
+    aoi: pd.DataFrame,  # Area of interest, prepped with a GEO_INDEX_NAME column
+    data: gpd.GeoDataFrame,  # Source gdf containing data to compute zonal stats from
+    column: str,  # An aggregated column of data, or GEO_INDEX_NAME
+    aoi_idx: np.ndarray,  # aoi positions of the pairs
+    data_idx: np.ndarray,  # data positions of the pairs
+) -> np.ndarray:
+    if column == GEO_INDEX_NAME:
+        return aoi[GEO_INDEX_NAME].values[aoi_idx]
+    return data[column].to_numpy()[data_idx]
+
+
+def _empty_aggregates(
+    expanded_aggs: List[Dict[str, Any]],  # A list of expanded aggs
+) -> pd.DataFrame:
+    return pd.DataFrame(
+        index=pd.Index([], dtype=np.int64, name=GEO_INDEX_NAME),
+        columns=[agg["output"] for agg in expanded_aggs],
+        dtype=np.float64,
+    )
+
+
+def _index_pair_aggregates(
+    aoi: pd.DataFrame,  # Area of interest, prepped with a GEO_INDEX_NAME column
+    data: gpd.GeoDataFrame,  # Source gdf containing data to compute zonal stats from
+    expanded_aggs: List[Dict[str, Any]],  # A list of expanded aggs
+    overlap_method: str,  # spatial predicate of the aoi and data
+) -> pd.DataFrame:
+    """Computes the aggregates over the (aoi, data) index pairs of the spatial join, so only the pairs and one aggregated column are in memory at a time"""
+    aoi_idx, data_idx = data.sindex.query(aoi.geometry, predicate=overlap_method)
+    aggregates = _pair_aggregates(aoi, data, expanded_aggs, aoi_idx, data_idx)
+    aggregates.index = pd.Index(
+        aoi[GEO_INDEX_NAME].values[aggregates.index], name=GEO_INDEX_NAME
+    )
+    return aggregates
+
+
+def _pair_aggregates(
+    aoi: pd.DataFrame,  # Area of interest, prepped with a GEO_INDEX_NAME column
+    data: gpd.GeoDataFrame,  # Source gdf containing data to compute zonal stats from
+    expanded_aggs: List[Dict[str, Any]],  # A list of expanded aggs
+    aoi_idx: np.ndarray,  # aoi positions of the pairs
+    data_idx: np.ndarray,  # data positions of the pairs
+) -> pd.DataFrame:
+    """Computes the aggregates over the (aoi, data) index pairs, indexed by the aoi positions with pairs"""
+    if len(aoi_idx) == 0:
+        return _empty_aggregates(expanded_aggs)
+    aoi_idx, data_idx, group_aoi_idx, starts = _group_pairs(aoi_idx, data_idx)
+
+    aggregates = {}
+    for column, funcs in _column_funcs(expanded_aggs).items():
+        values = _pair_values(aoi, data, column, aoi_idx, data_idx)
+        moments = _segment_moments(values, starts, funcs)
+        for agg in expanded_aggs:
+            if agg["column"] == column:
+                aggregates[agg["output"]] = _moments_to_agg(moments, agg["func"])
+    return pd.DataFrame(
+        {agg["output"]: aggregates[agg["output"]] for agg in expanded_aggs},
+        index=group_aoi_idx,
+    )
+
+# %% ../notebooks/02_vector_zonal_stats.ipynb 45
+# predicates of data against aoi equivalent to the overlap_method of aoi against data
+INVERSE_PREDICATES = {
+    "intersects": "intersects",
+    "contains": "within",
+    "within": "contains",
+    "covers": "covered_by",
+    "covered_by": "covers",
+    "touches": "touches",
+    "crosses": "crosses",
+    "overlaps": "overlaps",
+}
+
+
+def _iter_data_batches(
+    data: Union[
+        str, Path, Iterable
+    ],  # A file path, or an iterable of GeoDataFrames or geoarrow tables/record batches
+    batch_size: int,  # number of rows to read at a time from a file
+) -> Iterator[gpd.GeoDataFrame]:
+    """Yields the data one GeoDataFrame batch at a time"""
+    if isinstance(data, (str, Path)):
+        with pyogrio.open_arrow(data, batch_size=batch_size, use_pyarrow=True) as (
+            _,
+            reader,
+        ):
+            for batch in reader:
+                yield gpd.GeoDataFrame.from_arrow(batch)
+        return
+    for batch in data:
+        yield (
+            batch
+            if isinstance(batch, gpd.GeoDataFrame)
+            else gpd.GeoDataFrame.from_arrow(batch)
+        )
+
+
+def _validate_batched_data(
+    overlap_method: str,  # spatial predicate of the aoi and data
+    fixed_aggs: List[Dict[str, Any]],  # A list of fixed agg specs
+) -> None:
+    if overlap_method not in INVERSE_PREDICATES:
+        raise ValueError(
+            f"{overlap_method} overlap_method is not supported for batched data. Please select from these options {list(INVERSE_PREDICATES)}"
+        )
+    # batches are aggregated over their index pairs like the numpy engine
+    _validate_engine("numpy", fixed_aggs)
+
+
+def _merge_moments(
+    total: Dict[str, np.ndarray],  # Moments of all aois so far, updated in place
+    group_aoi_idx: np.ndarray,  # aoi positions of the batch's moments
+    moments: Dict[str, np.ndarray],  # Moments of a batch from `_segment_moments`
+) -> None:
+    """Merges the moments of a batch into the moments so far, with the pairwise update of Chan et al. for m2"""
+    for key, values in moments.items():
+        if key not in total:
+            total[key] = np.zeros(len(total["count"]), dtype=values.dtype)
+        elif np.result_type(total[key], values) != total[key].dtype:
+            total[key] = total[key].astype(np.result_type(total[key], values))
+
+    counts = total["count"][group_aoi_idx]
+    batch_counts = moments["count"]
+    has_counts = counts > 0
+    if "m2" in moments:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta = moments["sum"] / batch_counts - total["sum"][group_aoi_idx] / counts
+            correction = delta**2 * counts * batch_counts / (counts + batch_counts)
+        total["m2"][group_aoi_idx] += moments["m2"] + np.where(
+            has_counts & (batch_counts > 0), correction, 0
+        )
+    if "sum" in moments:
+        total["sum"][group_aoi_idx] += moments["sum"]
+    for key, func in [("min", np.fmin), ("max", np.fmax)]:
+        if key in moments:
+            total[key][group_aoi_idx] = np.where(
+                has_counts, func(total[key][group_aoi_idx], moments[key]), moments[key]
+            )
+    total["count"][group_aoi_idx] += batch_counts
+
+
+def _batched_index_pair_aggregates(
+    aoi: pd.DataFrame,  # Area of interest, prepped with a GEO_INDEX_NAME column
+    batches: Iterable[gpd.GeoDataFrame],  # Source data, one batch at a time
+    expanded_aggs: List[Dict[str, Any]],  # A list of expanded aggs
+    overlap_method: str,  # spatial predicate of the aoi and data
+) -> pd.DataFrame:
+    """Computes the aggregates one data batch at a time against the aoi spatial index, merging the moments of each batch, so memory is bounded by the batch size"""
+    predicate = INVERSE_PREDICATES[overlap_method]
+    column_funcs = _column_funcs(expanded_aggs)
+    n_pairs = np.zeros(len(aoi), dtype=np.int64)
+    totals = {
+        column: {"count": np.zeros(len(aoi), dtype=np.int64)} for column in column_funcs
+    }
+    for batch in batches:
+        if batch.crs is not None and not batch.crs.equals(aoi.crs):
+            batch = batch.to_crs(aoi.crs)
+        data_idx, aoi_idx = aoi.sindex.query(batch.geometry, predicate=predicate)
+        if len(aoi_idx) == 0:
+            continue
+        aoi_idx, data_idx, group_aoi_idx, starts = _group_pairs(aoi_idx, data_idx)
+        n_pairs[group_aoi_idx] += np.diff(starts, append=len(aoi_idx))
+        for column, funcs in column_funcs.items():
+            values = _pair_values(aoi, batch, column, aoi_idx, data_idx)
+            _merge_moments(
+                totals[column], group_aoi_idx, _segment_moments(values, starts, funcs)
+            )
+
+    has_pairs = n_pairs > 0
+    if not has_pairs.any():
+        return _empty_aggregates(expanded_aggs)
+    aggregates = {}
+    for agg in expanded_aggs:
+        moments = {
+            key: values[has_pairs] for key, values in totals[agg["column"]].items()
+        }
+        aggregates[agg["output"]] = _moments_to_agg(moments, agg["func"])
+    index = pd.Index(aoi[GEO_INDEX_NAME].values[has_pairs], name=GEO_INDEX_NAME)
+    return pd.DataFrame(aggregates, index=index)
+
+# %% ../notebooks/02_vector_zonal_stats.ipynb 46
+BLOCKS_PER_WORKER = 4
+
+
+def _spatial_blocks(
+    aoi: gpd.GeoDataFrame,  # Area of interest
+    n_blocks: int,  # number of blocks to split the aoi into
+) -> List[np.ndarray]:
+    """Splits the aoi positions into spatially compact blocks of similar sizes along the Hilbert curve"""
+    geometry = aoi.geometry
+    is_missing = (geometry.isna() | geometry.is_empty).values
+    # missing geometries don't match any data, so they can go in any block
+    distances = np.zeros(len(aoi), dtype=np.int64)
+    if not is_missing.all():
+        distances[~is_missing] = geometry[~is_missing].hilbert_distance()
+    order = np.argsort(distances, kind="stable")
+    return [block for block in np.array_split(order, n_blocks) if len(block) > 0]
+
+
+def _block_zonal_stats(
+    item: Tuple[
+        gpd.GeoDataFrame, gpd.GeoDataFrame
+    ],  # A block of the aoi and the data within its bounds
+    aggregations: List[Dict[str, Any]],  # List of agg specs
+    overlap_method: str,  # spatial predicate of the aoi and data
+    engine: str,  # the zonal stats engine
+) -> gpd.GeoDataFrame:
+    block_aoi, block_data = item
+    return create_zonal_stats(
+        block_aoi,
+        block_data,
+        aggregations,
+        overlap_method=overlap_method,
+        engine=engine,
+    )
+
+
+def _parallel_zonal_stats(
+    aoi: gpd.GeoDataFrame,  # Area of interest
+    data: gpd.GeoDataFrame,  # Source gdf in the same crs as the aoi
+    fixed_aggs: List[Dict[str, Any]],  # A list of fixed agg specs
+    overlap_method: str,  # spatial predicate of the aoi and data
+    engine: str,  # the zonal stats engine
+    n_workers: int,  # number of processes
+) -> gpd.GeoDataFrame:
+    """Computes the zonal stats of spatial blocks of the aoi in a process pool. Each aoi is in exactly one block, so the block results are just concatenated."""
+    blocks = _spatial_blocks(aoi, n_workers * BLOCKS_PER_WORKER)
+    items = []
+    for block in blocks:
+        block_aoi = aoi.iloc[block]
+        # data that can match the block's aoi intersects the block's bounds
+        data_idx = data.sindex.query(box(*block_aoi.total_bounds))
+        items.append((block_aoi, data.iloc[np.sort(data_idx)]))
+    results = parallel(
+        _block_zonal_stats,
+        items,
+        aggregations=fixed_aggs,
+        overlap_method=overlap_method,
+        engine=engine,
+        n_workers=n_workers,
+        method="spawn",
+        progress=False,
+    )
+    results = pd.concat(list(results))
+    return results.iloc[np.argsort(np.concatenate(blocks), kind="stable")]
+
+# %% ../notebooks/02_vector_zonal_stats.ipynb 47
 def create_zonal_stats(
     aoi: gpd.GeoDataFrame,  # Area of interest for which zonal stats are to be computed for
-    data: gpd.GeoDataFrame,  # Source gdf containing data to compute zonal stats from
+    data: Union[  # Source gdf containing data to compute zonal stats from, or a file path or an iterable of GeoDataFrames or geoarrow tables/record batches to compute them one batch at a time
+        gpd.GeoDataFrame, str, Path, Iterable
+    ],
     aggregations: List[  # List of agg specs, with each agg spec applied to a data column
         Dict[str, Any]
     ],
     overlap_method: str = "intersects",  # spatial predicate to used in spatial join of aoi and data [geopandas.sjoin](https://geopandas.org/en/stable/docs/user_guide/mergingdata.html#binary-predicate-joins) for more details
+    engine: str = "pandas",  # "pandas" aggregates the spatially joined features with a groupby, "polars" with a multi-threaded polars group by, "numpy" aggregates only the aggregated columns over the aoi and data index pairs of the spatial join (supports only the count, sum, mean, min, max and std funcs). Batched data is always aggregated like the numpy engine
+    batch_size: int = 65536,  # number of rows to read at a time when data is a file path
+    n_workers: int = 1,  # number of processes. If more than 1, the aoi is split into spatial blocks, each joined with the data within its bounds in a process pool
     # categorical_column_options: str = None,
 ) -> gpd.GeoDataFrame:
     """
     Create zonal stats for area of interest from data using aggregration operations on data columns.
     Returns the same aoi with additional columns containing the computed zonal features.
+    If data is a file path or an iterable of batches, only one batch of data is in memory at a time.
     """
     _validate_aoi(aoi)
     fixed_aggs = [_fix_agg(agg) for agg in aggregations]
 
-    _validate_aggs(fixed_aggs, data)
+    is_batched = not isinstance(data, gpd.GeoDataFrame)
+    if is_batched:
+        batches = _iter_data_batches(data, batch_size)
+        first_batch = next(batches, None)
+        if first_batch is None:
+            raise ValueError("data does not contain any batches")
+        data = chain([first_batch], batches)
+        _validate_aggs(fixed_aggs, first_batch)
+        _validate_batched_data(overlap_method, fixed_aggs)
+    else:
+        _validate_aggs(fixed_aggs, data)
+    _validate_engine(engine, fixed_aggs)
+
+    if n_workers > 1 and is_batched:
+        raise ValueError("n_workers > 1 is not supported for batched data")
+    if n_workers > 1 and len(aoi) > 1:
+        if not data.crs.equals(aoi.crs):
+            data = data.to_crs(aoi.crs)
+        return _parallel_zonal_stats(
+            aoi, data, fixed_aggs, overlap_method, engine, n_workers
+        )
 
     # prep for spatial join
     aoi_index_name = aoi.index.name
     aoi = _prep_aoi(aoi)
 
-    if not data.crs.equals(aoi.crs):
+    if not is_batched and not data.crs.equals(aoi.crs):
         data = data.to_crs(aoi.crs)
 
-    # spatial join - broadcast aoi_index to data => features
-    features = gpd.sjoin(
-        aoi[[GEO_INDEX_NAME, "geometry"]], data, how="inner", predicate=overlap_method
-    )
-
-    # group
-    groups = features.groupby(GEO_INDEX_NAME)
-
-    # apply all aggregations all at once
     expanded_aggs = _expand_aggs(fixed_aggs)
-    results = _aggregate_stats(aoi, groups, expanded_aggs)
+    if is_batched:
+        # merge the aggregates of each batch joined against the aoi spatial index
+        aggregates = _batched_index_pair_aggregates(
+            aoi, data, expanded_aggs, overlap_method
+        )
+        results = _merge_aggregates(aoi, aggregates, expanded_aggs)
+    elif engine == "numpy":
+        # aggregate over the spatial join index pairs without building the features
+        aggregates = _index_pair_aggregates(aoi, data, expanded_aggs, overlap_method)
+        results = _merge_aggregates(aoi, aggregates, expanded_aggs)
+    else:
+        # spatial join - broadcast aoi_index to data => features
+        features = gpd.sjoin(
+            aoi[[GEO_INDEX_NAME, "geometry"]],
+            data,
+            how="inner",
+            predicate=overlap_method,
+        )
+
+        # group and apply all aggregations all at once
+        aggregates = _groupby_agg(features, _build_agg_args(expanded_aggs), engine)
+        results = _merge_aggregates(aoi, aggregates, expanded_aggs)
 
     # cleanup results
     results = results.set_index(GEO_INDEX_NAME)
@@ -248,14 +691,145 @@ def create_zonal_stats(
 
     return results
 
-# %% ../notebooks/02_vector_zonal_stats.ipynb 60
+# %% ../notebooks/02_vector_zonal_stats.ipynb 70
+class ZonalJoinPlan:
+    """Caches the (aoi, data) index pairs of the spatial join of an aoi and data, so zonal stats can be computed repeatedly without redoing the join"""
+
+    def __init__(
+        self,
+        aoi: gpd.GeoDataFrame,  # Area of interest for which zonal stats are to be computed for
+        data: gpd.GeoDataFrame,  # Source gdf containing data to compute zonal stats from
+        overlap_method: str = "intersects",  # spatial predicate to used in spatial join of aoi and data
+        index_pairs: Optional[
+            Tuple[np.ndarray, np.ndarray]
+        ] = None,  # precomputed (aoi, data) positional index pairs of the spatial join, e.g. from a saved plan. If None, the spatial join is computed
+    ):
+        _validate_aoi(aoi)
+        self.aoi_index_name = aoi.index.name
+        self.aoi = _prep_aoi(aoi)
+        self.data = data
+        self.overlap_method = overlap_method
+
+        if index_pairs is None:
+            if not data.crs.equals(aoi.crs):
+                data = data.to_crs(aoi.crs)
+            index_pairs = data.sindex.query(self.aoi.geometry, predicate=overlap_method)
+        aoi_idx, data_idx = (np.asarray(idx, dtype=np.int64) for idx in index_pairs)
+        if len(aoi_idx) > 0 and (
+            aoi_idx.max() >= len(aoi) or data_idx.max() >= len(data)
+        ):
+            raise ValueError("index_pairs are out of bounds of the aoi and data")
+        # sorted by aoi so the pairs of a subset of the data are still grouped by aoi
+        self.aoi_idx, self.data_idx, _, _ = _group_pairs(aoi_idx, data_idx)
+
+# %% ../notebooks/02_vector_zonal_stats.ipynb 71
+@patch
+def aggregate(
+    self: ZonalJoinPlan,
+    aggregations: List[  # List of agg specs, with each agg spec applied to a data column
+        Dict[str, Any]
+    ],
+    mask: Optional[
+        Iterable[bool]
+    ] = None,  # boolean mask of the data rows to aggregate, e.g. `data.population > 0`. Defaults to all rows
+) -> gpd.GeoDataFrame:
+    """
+    Create zonal stats for the plan's aoi from the plan's data, like `create_zonal_stats` with the numpy engine.
+    Returns the same aoi with additional columns containing the computed zonal features.
+    """
+    fixed_aggs = [_fix_agg(agg) for agg in aggregations]
+    _validate_aggs(fixed_aggs, self.data)
+    _validate_engine("numpy", fixed_aggs)
+
+    aoi_idx, data_idx = self.aoi_idx, self.data_idx
+    if mask is not None:
+        mask = np.asarray(mask, dtype=bool)
+        if len(mask) != len(self.data):
+            raise ValueError(
+                f"mask has {len(mask)} rows but data has {len(self.data)} rows"
+            )
+        is_kept = mask[data_idx]
+        aoi_idx, data_idx = aoi_idx[is_kept], data_idx[is_kept]
+
+    expanded_aggs = _expand_aggs(fixed_aggs)
+    aggregates = _pair_aggregates(self.aoi, self.data, expanded_aggs, aoi_idx, data_idx)
+    # aoi without pairs are NA, like a left merge
+    aggregates = aggregates.reindex(np.arange(len(self.aoi)))
+
+    results = self.aoi.copy()
+    for agg in expanded_aggs:
+        colname = agg["output"]
+        if colname in list(self.aoi.columns.values):
+            colname = colname + "_y"  # same suffix as the merge in create_zonal_stats
+        results[colname] = aggregates[agg["output"]].values
+    results = _fillnas(expanded_aggs, results, self.aoi)
+
+    results = results.set_index(GEO_INDEX_NAME)
+    results.index.name = self.aoi_index_name
+    return results
+
+# %% ../notebooks/02_vector_zonal_stats.ipynb 72
+def _plan_fingerprint(
+    gdf: gpd.GeoDataFrame,  # aoi or data of a plan
+) -> str:
+    """Returns a hash of the index, crs and total bounds of the gdf, to check that a saved plan is loaded for the same gdf"""
+    fingerprint = hashlib.sha256(
+        pd.util.hash_pandas_object(gdf.index, index=False).values.tobytes()
+    )
+    fingerprint.update(str(gdf.crs).encode())
+    fingerprint.update(np.asarray(gdf.total_bounds, dtype=np.float64).tobytes())
+    return fingerprint.hexdigest()
+
+
+@patch
+def save(
+    self: ZonalJoinPlan,
+    path: Union[str, Path],  # path of the .npz file
+) -> None:
+    """Saves the index pairs of the plan, which can be loaded with `load_zonal_join_plan` for the same aoi and data"""
+    np.savez(
+        path,
+        aoi_idx=self.aoi_idx,
+        data_idx=self.data_idx,
+        n_aoi=len(self.aoi),
+        n_data=len(self.data),
+        aoi_fingerprint=_plan_fingerprint(self.aoi),
+        data_fingerprint=_plan_fingerprint(self.data),
+        overlap_method=self.overlap_method,
+    )
+
+
+def load_zonal_join_plan(
+    path: Union[str, Path],  # path of a .npz file saved with `ZonalJoinPlan.save`
+    aoi: gpd.GeoDataFrame,  # The aoi of the saved plan
+    data: gpd.GeoDataFrame,  # The data of the saved plan
+) -> ZonalJoinPlan:
+    """Loads a saved `ZonalJoinPlan`, without redoing the spatial join"""
+    with np.load(path) as plan:
+        if plan["n_aoi"] != len(aoi) or plan["n_data"] != len(data):
+            raise ValueError(
+                f"The saved plan is for {plan['n_aoi']} aoi and {plan['n_data']} data rows but got {len(aoi)} aoi and {len(data)} data rows"
+            )
+        for name, gdf in [("aoi", aoi), ("data", data)]:
+            if plan[f"{name}_fingerprint"] != _plan_fingerprint(gdf):
+                raise ValueError(
+                    f"The saved plan is for a different {name}, with a different index, crs or total bounds"
+                )
+        return ZonalJoinPlan(
+            aoi,
+            data,
+            overlap_method=str(plan["overlap_method"]),
+            index_pairs=(plan["aoi_idx"], plan["data_idx"]),
+        )
+
+# %% ../notebooks/02_vector_zonal_stats.ipynb 77
 tms = morecantile.tms.get("WebMercatorQuad")  # Tile Matrix for Bing Maps
 
-# %% ../notebooks/02_vector_zonal_stats.ipynb 61
+# %% ../notebooks/02_vector_zonal_stats.ipynb 78
 def get_quadkey(geometry, zoom_level):
     return tms.quadkey(tms.tile(geometry.x, geometry.y, zoom_level))
 
-# %% ../notebooks/02_vector_zonal_stats.ipynb 62
+# %% ../notebooks/02_vector_zonal_stats.ipynb 79
 def compute_quadkey(
     data: gpd.GeoDataFrame,  # The geodataframe
     zoom_level: int,  # The quadkey zoom level (1-23)
@@ -282,8 +856,8 @@ def compute_quadkey(
 
     return data
 
-# %% ../notebooks/02_vector_zonal_stats.ipynb 69
-def validate_aoi_quadkey(aoi, aoi_quadkey_column) -> None:
+# %% ../notebooks/02_vector_zonal_stats.ipynb 86
+def validate_aoi_quadkey(aoi, aoi_quadkey_column, variable_zoom=False) -> None:
 
     if aoi_quadkey_column not in list(aoi.columns.values):
         raise ValueError(
@@ -292,11 +866,30 @@ def validate_aoi_quadkey(aoi, aoi_quadkey_column) -> None:
     if len(aoi) == 0:
         raise ValueError("aoi dataframe is empty")
 
+    if variable_zoom:
+        validate_nested_aoi_quadkey(aoi, aoi_quadkey_column)
+        return
+
     aoi_zoom_level = len(aoi[aoi_quadkey_column].iloc[0])
     if not (aoi[aoi_quadkey_column].apply(len) == aoi_zoom_level).all(axis=None):
         raise ValueError("aoi quadkey levels are not all at the same level")
 
 
+def validate_nested_aoi_quadkey(aoi, aoi_quadkey_column) -> None:
+    """Checks that no aoi tile contains another aoi tile, so each data quadkey falls in at most one aoi tile"""
+    quadkeys = aoi[aoi_quadkey_column].drop_duplicates()
+    zoom_levels = quadkeys.str.len()
+    coarser_quadkeys = set()
+    for zoom_level in sorted(zoom_levels.unique()):
+        level_quadkeys = quadkeys[zoom_levels == zoom_level]
+        for coarser_zoom_level in sorted(
+            {len(quadkey) for quadkey in coarser_quadkeys}
+        ):
+            if level_quadkeys.str[:coarser_zoom_level].isin(coarser_quadkeys).any():
+                raise ValueError("aoi quadkeys should not contain other aoi quadkeys")
+        coarser_quadkeys.update(level_quadkeys)
+
+
 def validate_data_quadkey(data, data_quadkey_column, min_zoom_level):
     if data_quadkey_column not in list(data.columns.values):
         raise ValueError(
@@ -310,7 +903,7 @@ def validate_data_quadkey(data, data_quadkey_column, min_zoom_level):
             f"data quadkey levels cannot be less than aoi quadkey level {min_zoom_level}"
         )
 
-# %% ../notebooks/02_vector_zonal_stats.ipynb 70
+# %% ../notebooks/02_vector_zonal_stats.ipynb 87
 def create_bingtile_zonal_stats(
     aoi: pd.DataFrame,  # An aoi with quadkey column
     data: pd.DataFrame,  # Data with  quadkey column
@@ -319,6 +912,7 @@ def create_bingtile_zonal_stats(
     ],
     aoi_quadkey_column: str = "quadkey",  # Column name of aoi quadkey
     data_quadkey_column: str = "quadkey",  # Column name of data quadkey
+    variable_zoom: bool = False,  # If True, the aoi quadkeys can be at different zoom levels (e.g. from `AdaptiveBingTileGridGenerator`) as long as no aoi tile contains another
 ) -> pd.DataFrame:
 
     data = data.copy()
@@ -327,29 +921,34 @@ def create_bingtile_zonal_stats(
     aoi[aoi_quadkey_column] = aoi[aoi_quadkey_column].apply(str)
     data[data_quadkey_column] = data[data_quadkey_column].apply(str)
 
-    # validate aoi zoom level is same for all rows
-    validate_aoi_quadkey(aoi, aoi_quadkey_column)
-    # get aoi zoom level
-    aoi_zoom_level = len(aoi[aoi_quadkey_column].iloc[0])
+    # validate aoi zoom level is same for all rows, or that the aoi tiles don't overlap for variable zoom levels
+    validate_aoi_quadkey(aoi, aoi_quadkey_column, variable_zoom)
+    # get aoi zoom levels
+    aoi_zoom_levels = sorted(aoi[aoi_quadkey_column].str.len().unique())
 
-    validate_data_quadkey(data, data_quadkey_column, aoi_zoom_level)
+    validate_data_quadkey(data, data_quadkey_column, aoi_zoom_levels[-1])
 
     fixed_aggs = [_fix_agg(agg) for agg in aggregations]
 
     _validate_aggs(fixed_aggs, data)
 
-    # create aoi level quad_key for data (apply quadkey_to_tile)
-    def quadkey4zoom_level(x):
-        return x[:aoi_zoom_level]
-
-    data[GEO_INDEX_NAME] = data[data_quadkey_column].apply(quadkey4zoom_level)
-
-    # filter data to include only those whose quadkeys are in aoi quadkeys
-    features = data.join(
-        aoi[[aoi_quadkey_column]].set_index(aoi_quadkey_column),
-        how="inner",
-        on=GEO_INDEX_NAME,
-    )
+    level_features = []
+    for aoi_zoom_level in aoi_zoom_levels:
+        # create aoi level quad_key for data (apply quadkey_to_tile)
+        data[GEO_INDEX_NAME] = data[data_quadkey_column].str[:aoi_zoom_level]
+
+        # filter data to include only those whose quadkeys are in aoi quadkeys
+        level_aoi = aoi.loc[
+            aoi[aoi_quadkey_column].str.len() == aoi_zoom_level, [aoi_quadkey_column]
+        ]
+        level_features.append(
+            data.join(
+                level_aoi.set_index(aoi_quadkey_column),
+                how="inner",
+                on=GEO_INDEX_NAME,
+            )
+        )
+    features = pd.concat(level_features)
 
     # groupby data on aoi level quad key
     groups = features.groupby(GEO_INDEX_NAME)
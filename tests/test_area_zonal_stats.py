@@ -580,3 +580,18 @@ def test_create_area_zonal_stats_drop_intersect(simple_aoi, simple_data):
     assert "intersect_area_sum" not in results_columns
     assert "internet_speed_min" in results_columns
     assert results["internet_speed_min"].equals(pd.Series([20.0, 10.0, 5.0]))
+
+
+def test_create_area_zonal_stats_polars_engine(simple_aoi, simple_data):
+    def aggregations():
+        return [
+            dict(func=["sum", "raw_median"], column="population"),
+            dict(func=["min", "max", "mean", "imputed_mean"], column="internet_speed"),
+            dict(func="count", fillna=True),
+        ]
+
+    expected = create_area_zonal_stats(simple_aoi, simple_data, aggregations())
+    results = create_area_zonal_stats(
+        simple_aoi, simple_data, aggregations(), engine="polars"
+    )
+    pd.testing.assert_frame_equal(results, expected)
@@ -142,3 +142,23 @@ def test_create_distance_zonal_stats_areas(simple_aoi, simple_data):
     assert results["population_sum"].equals(pd.Series([100, 300, 500]))
     assert results["internet_speed_mean"].equals(pd.Series([20.0, 15.0, 7.5]))
     assert results["nearest"].equals(pd.Series([0.0, 0.0, 0.0]))
+
+
+@pytest.mark.parametrize("max_distance", [1, 7])
+def test_create_distance_zonal_stats_polars_engine(
+    simple_aoi, simple_point_data, max_distance
+):
+    def aggregations():
+        return [
+            dict(func="count", fillna=True),
+            dict(func=["sum", "max"], column="population"),
+            dict(func=["mean", "std"], column="internet_speed"),
+        ]
+
+    expected = create_distance_zonal_stats(
+        simple_aoi, simple_point_data, max_distance, aggregations()
+    )
+    results = create_distance_zonal_stats(
+        simple_aoi, simple_point_data, max_distance, aggregations(), engine="polars"
+    )
+    pd.testing.assert_frame_equal(results, expected)
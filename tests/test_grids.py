@@ -1,10 +1,17 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
 import pytest
-from shapely.geometry import Polygon
+import shapely
+from shapely.geometry import LineString, MultiPoint, Point, Polygon, box
 
 from geowrangler import grids
+from geowrangler.gridding_utils import polygon_fill
 
 
 @pytest.fixture
@@ -76,6 +83,29 @@ def test_boundary_smaller_then_a_cell():
     assert len(xrange) == 2
     assert len(yrange) == 2
 
+def test_get_range_subset_matches_arange():
+    boundary = grids.SquareGridBoundary(-1234.5, 10.1, 98765.4, 54321.0)
+    cell_size = 333.3
+    xrange = np.arange(boundary.x_min, boundary.x_max, cell_size)
+    x_idx_offset, x_subset, _, _ = boundary.get_range_subset(5000, 20000, 7000, 30000, cell_size)
+    assert x_idx_offset == np.flatnonzero(xrange >= 5000 - cell_size)[0]
+    assert np.array_equal(x_subset, xrange[(xrange >= 5000 - cell_size) & (xrange <= 7000 + cell_size)])
+
+def test_create_grid_for_polygon(sample_gdf):
+    grid_generator = grids.SquareGridGenerator(15000)
+    reprojected_gdf = sample_gdf.to_crs(grid_generator.grid_projection)
+    boundary = grids.setup_boundary(None, sample_gdf, reprojected_gdf)
+    polygon = reprojected_gdf.geometry.iloc[0]
+    cells = grid_generator.create_grid_for_polygon(boundary, polygon)
+    assert len(cells) == 240
+    assert all(cell["geometry"].intersects(polygon) for cell in cells.values())
+    (x, y), cell = next(iter(cells.items()))
+    assert (cell["x"], cell["y"]) == (x, y)
+    x_idx_offset, xrange, y_idx_offset, yrange = boundary.get_range_subset(*polygon.bounds, cell_size=15000)
+    assert cell["geometry"].equals_exact(
+        grid_generator.create_cell(xrange[x - x_idx_offset], yrange[y - y_idx_offset]), 0
+    )
+
 def test_generate_grids_aoi_outside_boundary(sample_gdf):
     grid_generator = grids.SquareGridGenerator(15000, boundary=(10, 10, 20, 20))
     with pytest.warns(UserWarning):
@@ -119,6 +149,30 @@ def test_generate_fast_grids_w_custom_boundary_2(sample_gdf):
     # Check if area of each grid is what we expect
     assert grids_gdf.to_crs("EPSG:3857").area.apply(np.isclose, b=15000**2).all()
 
+@pytest.mark.parametrize("generator_class", [grids.SquareGridGenerator, grids.FastSquareGridGenerator])
+def test_generate_grids_global_boundary(generator_class):
+    left_gdf = gpd.GeoDataFrame(geometry=[box(120, 14, 120.5, 14.5)], crs="EPSG:4326")
+    right_gdf = gpd.GeoDataFrame(geometry=[box(120.3, 14.2, 121, 15)], crs="EPSG:4326")
+    union_gdf = gpd.GeoDataFrame(geometry=[left_gdf.geometry[0].union(right_gdf.geometry[0])], crs="EPSG:4326")
+    grid_generator = generator_class(1000, boundary="global")
+
+    # the grids of the two AOIs merged by x and y are the same as the grid of their union
+    merged_gdf = pd.concat([grid_generator.generate_grid(left_gdf), grid_generator.generate_grid(right_gdf)])
+    merged_gdf = merged_gdf.drop_duplicates(["x", "y"]).set_index(["x", "y"]).sort_index()
+    union_grids_gdf = grid_generator.generate_grid(union_gdf).set_index(["x", "y"]).sort_index()
+    assert merged_gdf.index.equals(union_grids_gdf.index)
+    assert merged_gdf.geometry.geom_equals_exact(union_grids_gdf.geometry, 1e-9).all()
+
+    # the cell edges are multiples of cell_size in the grid projection
+    bounds = union_grids_gdf.to_crs("EPSG:3857").geometry.bounds.values
+    assert np.allclose(bounds / 1000, np.round(bounds / 1000))
+
+    with pytest.raises(ValueError):
+        generator_class(1000, boundary="local").generate_grid(left_gdf)
+    with pytest.raises(ValueError):
+        generator_class(0.001, boundary="global").generate_grid(left_gdf)
+
+
 def test_generate_fast_grids_aoi_outside_boundary(sample_gdf):
     grid_generator = grids.FastSquareGridGenerator(15000, boundary=(10, 10, 20, 20))
     with pytest.warns(UserWarning):
@@ -134,6 +188,240 @@ def test_generate_fast_grids_aoi_partially_inside_boundary(sample_gdf):
     assert len(grids_gdf) == 108
     assert grids_gdf.to_crs("EPSG:3857").area.apply(np.isclose, b=15000**2).all()
 
+def test_generate_fast_grids_spans(sample_gdf):
+    grid_generator = grids.FastSquareGridGenerator(15000)
+    grids_gdf = grid_generator.generate_grid(sample_gdf)
+    spans_df = grid_generator.generate_grid(sample_gdf, output="spans")
+    assert list(spans_df.columns) == ["y", "x_start", "x_end"]
+    assert len(spans_df) < len(grids_gdf)
+
+    tiles_df = polygon_fill.expand_spans(spans_df).to_pandas()
+    assert len(tiles_df) == 240
+    assert set(zip(tiles_df.x, tiles_df.y)) == set(zip(grids_gdf.x, grids_gdf.y))
+
+def test_generate_fast_grids_n_workers(sample_gdf):
+    gdf2 = gpd.GeoDataFrame(
+        geometry=[Polygon([(3, 3), (3, 4), (4, 3)])],
+        crs="EPSG:4326",
+    )
+    aoi_gdf = pd.concat([gdf2, sample_gdf], ignore_index=True)
+    grid_generator = grids.FastSquareGridGenerator(15000)
+    grids_gdf = grid_generator.generate_grid(aoi_gdf)
+    parallel_grids_gdf = grid_generator.generate_grid(aoi_gdf, n_workers=2)
+    assert len(parallel_grids_gdf) == len(grids_gdf)
+    assert set(zip(parallel_grids_gdf.x, parallel_grids_gdf.y)) == set(zip(grids_gdf.x, grids_gdf.y))
+
+@pytest.mark.parametrize(
+    "generator",
+    [
+        grids.FastSquareGridGenerator(15000, reproject_output=False),
+        grids.FastBingTileGridGenerator(8, add_xyz_cols=True),
+    ],
+)
+def test_generate_fast_grids_boundary_correction(sample_gdf, generator):
+    gdf2 = gpd.GeoDataFrame(
+        geometry=[Polygon([(1, 0), (1.5, 0.5), (1.1, 2), (2, 3), (3, 0)])],
+        crs="EPSG:4326",
+    )
+    aoi_gdf = pd.concat([sample_gdf, gdf2], ignore_index=True)
+    aoi_gdf["name"] = ["a", "b"]
+
+    generator.boundary_correction = "union"
+    union_gdf = generator.generate_grid(aoi_gdf, unique_id_col="name")
+    no_id_union_gdf = generator.generate_grid(aoi_gdf)
+    generator.boundary_correction = "strtree"
+    strtree_gdf = generator.generate_grid(aoi_gdf, unique_id_col="name")
+    no_id_strtree_gdf = generator.generate_grid(aoi_gdf)
+    generator.boundary_correction = None
+    default_gdf = generator.generate_grid(aoi_gdf, unique_id_col="name")
+
+    assert set(zip(no_id_union_gdf.x, no_id_union_gdf.y)) == set(zip(no_id_strtree_gdf.x, no_id_strtree_gdf.y))
+    assert set(zip(default_gdf.x, default_gdf.y, default_gdf.name)) == set(
+        zip(strtree_gdf.x, strtree_gdf.y, strtree_gdf.name)
+    )
+    # with strtree, off boundary cells are only kept for the polygons whose boundary they intersect
+    strtree_cells = set(zip(strtree_gdf.x, strtree_gdf.y, strtree_gdf.name))
+    assert strtree_cells <= set(zip(union_gdf.x, union_gdf.y, union_gdf.name))
+    polygons = aoi_gdf.set_index("name").geometry.to_crs(union_gdf.crs)
+    removed_gdf = union_gdf[
+        [cell not in strtree_cells for cell in zip(union_gdf.x, union_gdf.y, union_gdf.name)]
+    ]
+    assert not any(
+        polygons[name].boundary.intersects(geometry)
+        for name, geometry in zip(removed_gdf.name, removed_gdf.geometry)
+    )
+
+
+def test_generate_fast_grids_invalid_boundary_correction():
+    with pytest.raises(ValueError):
+        grids.FastSquareGridGenerator(15000, boundary_correction="exact")
+    with pytest.raises(ValueError):
+        grids.FastBingTileGridGenerator(8, boundary_correction="exact")
+
+@pytest.mark.parametrize(
+    "generator",
+    [
+        grids.FastSquareGridGenerator(15000, reproject_output=False),
+        grids.FastBingTileGridGenerator(8, add_xyz_cols=True),
+    ],
+)
+def test_generate_fast_grids_centroid_predicate(sample_gdf, generator):
+    grids_gdf = generator.generate_grid(sample_gdf)
+    centroid_grids_gdf = generator.generate_grid(sample_gdf, predicate="centroid")
+    assert 0 < len(centroid_grids_gdf) < len(grids_gdf)
+    assert set(zip(centroid_grids_gdf.x, centroid_grids_gdf.y)) <= set(zip(grids_gdf.x, grids_gdf.y))
+
+    # the edges of the L shape are still straight in EPSG:3857
+    polygon = sample_gdf.to_crs("EPSG:3857").geometry[0]
+    assert polygon.contains(centroid_grids_gdf.to_crs("EPSG:3857").geometry.centroid).all()
+
+    centroid_chunks = list(generator.generate_grid_iter(sample_gdf, predicate="centroid", chunk_size=50))
+    assert sum(len(chunk) for chunk in centroid_chunks) == len(centroid_grids_gdf)
+    with pytest.raises(ValueError):
+        generator.generate_grid(sample_gdf, predicate="within")
+
+
+@pytest.mark.parametrize("unique_id_col", [None, "name"])
+def test_generate_fast_grids_coverage_fraction(sample_gdf, unique_id_col):
+    sample_gdf = sample_gdf.assign(name="L")
+    grid_generator = grids.FastSquareGridGenerator(15000, reproject_output=False)
+    grids_gdf = grid_generator.generate_grid(sample_gdf, unique_id_col=unique_id_col, coverage_fraction=True)
+    assert ((grids_gdf.coverage_fraction >= 0) & (grids_gdf.coverage_fraction <= 1)).all()
+    assert (grids_gdf.coverage_fraction == 1).any()
+
+    # same as clipping every cell with the AOI
+    polygon = sample_gdf.to_crs(grid_generator.grid_projection).geometry[0]
+    expected = grids_gdf.intersection(polygon).area / grids_gdf.area
+    assert np.allclose(grids_gdf.coverage_fraction, expected)
+
+    chunks = list(
+        grid_generator.generate_grid_iter(sample_gdf, unique_id_col=unique_id_col, chunk_size=100, coverage_fraction=True)
+    )
+    grids_iter_gdf = pd.concat(chunks).sort_values(["x", "y"])
+    grids_gdf = grids_gdf.sort_values(["x", "y"])
+    assert np.allclose(grids_iter_gdf.coverage_fraction, grids_gdf.coverage_fraction)
+    with pytest.raises(ValueError):
+        grid_generator.generate_grid(sample_gdf, output="spans", coverage_fraction=True)
+
+
+def test_generate_fast_grids_coverage_fraction_holes():
+    polygon = Polygon(
+        [(0, 0), (100, 0), (100, 100), (0, 100)],
+        holes=[
+            [(10, 10), (30, 10), (30, 30), (10, 30)],
+            [(50.5, 20.5), (70.2, 22.1), (68.3, 40.4)],
+            [(20.3, 60.7), (45.6, 60.1), (44.8, 85.2), (21.1, 84.9)],
+        ],
+    )
+    aoi_gdf = gpd.GeoDataFrame(geometry=[polygon], crs="EPSG:3857")
+    grid_generator = grids.FastSquareGridGenerator(1, boundary=(0, 0, 100, 100))
+    grids_gdf = grid_generator.generate_grid(aoi_gdf, coverage_fraction=True)
+
+    expected = grids_gdf.intersection(polygon).area / grids_gdf.area
+    assert np.allclose(grids_gdf.coverage_fraction, expected)
+
+
+@pytest.mark.parametrize(
+    "generator",
+    [
+        grids.FastSquareGridGenerator(15000),
+        grids.FastSquareGridGenerator(15000, reproject_output=False),
+        grids.FastBingTileGridGenerator(10, add_xyz_cols=True),
+    ],
+)
+def test_generate_fast_grids_table_output(sample_gdf, generator):
+    grids_gdf = generator.generate_grid(sample_gdf)
+    grids_table = generator.generate_grid(sample_gdf, output="arrow")
+    assert isinstance(grids_table, pa.Table)
+    # the WKB geometry column is read back as the same cells
+    table_gdf = gpd.GeoDataFrame.from_arrow(grids_table)
+    assert list(table_gdf.columns) == list(grids_gdf.columns)
+    assert table_gdf.crs == grids_gdf.crs
+    assert table_gdf.geometry.geom_equals_exact(grids_gdf.geometry, 0).all()
+
+    grids_df = generator.generate_grid(sample_gdf, output="polars")
+    assert isinstance(grids_df, pl.DataFrame)
+    assert grids_df.drop("geometry").equals(pl.from_arrow(grids_table).drop("geometry"))
+
+    chunks = list(generator.generate_grid_iter(sample_gdf, chunk_size=100, output="polars"))
+    assert sum(len(chunk) for chunk in chunks) == len(grids_gdf)
+    with pytest.raises(ValueError):
+        list(generator.generate_grid_iter(sample_gdf, output="spans"))
+
+
+def test_fast_bing_tile_grid_generator_table_output_return_geometry_false(sample_gdf):
+    grids_table = grids.FastBingTileGridGenerator(10, return_geometry=False).generate_grid(sample_gdf, output="arrow")
+    assert grids_table.column_names == ["quadkey"]
+
+
+def test_generate_fast_grids_invalid_output(sample_gdf):
+    grid_generator = grids.FastSquareGridGenerator(15000)
+    with pytest.raises(ValueError):
+        grid_generator.generate_grid(sample_gdf, output="parquet")
+
+def test_generate_grids_iter(sample_gdf):
+    grid_generator = grids.SquareGridGenerator(15000)
+    grids_gdf = grid_generator.generate_grid(sample_gdf)
+    chunks = list(grid_generator.generate_grid_iter(sample_gdf, chunk_size=100))
+    assert [len(chunk) for chunk in chunks] == [100, 100, 40]
+    grids_iter_gdf = pd.concat(chunks)
+    assert set(zip(grids_iter_gdf.x, grids_iter_gdf.y)) == set(zip(grids_gdf.x, grids_gdf.y))
+
+def test_generate_grids_iter_shared_cells():
+    # the first two polygons share the cells along x = 10, the third is far from both
+    aoi_gdf = gpd.GeoDataFrame(
+        geometry=[box(0, 0, 15, 15), box(16, 0, 30, 15), box(100, 100, 115, 115)],
+        crs="EPSG:3857",
+    )
+    grid_generator = grids.SquareGridGenerator(10, grid_projection="EPSG:3857")
+    grids_gdf = grid_generator.generate_grid(aoi_gdf)
+    grids_iter_gdf = pd.concat(list(grid_generator.generate_grid_iter(aoi_gdf, chunk_size=3)))
+    assert not grids_iter_gdf.duplicated(["x", "y"]).any()
+    assert list(zip(grids_iter_gdf.x, grids_iter_gdf.y)) == list(zip(grids_gdf.x, grids_gdf.y))
+
+def test_generate_fast_grids_reproject_output(sample_gdf):
+    grids_gdf = grids.FastSquareGridGenerator(15000).generate_grid(sample_gdf)
+    unprojected_grids_gdf = grids.FastSquareGridGenerator(15000, reproject_output=False).generate_grid(sample_gdf)
+    assert unprojected_grids_gdf.crs == "EPSG:3857"
+    assert grids_gdf.crs == sample_gdf.crs
+    assert (grids_gdf.x == unprojected_grids_gdf.x).all()
+    assert (grids_gdf.y == unprojected_grids_gdf.y).all()
+    # reprojecting each lattice node once gives the same cells as reprojecting every cell
+    reprojected_grids_gdf = unprojected_grids_gdf.to_crs(sample_gdf.crs)
+    assert grids_gdf.geometry.geom_equals_exact(reprojected_grids_gdf.geometry, 0).all()
+
+def test_generate_fast_grids_iter(sample_gdf):
+    grid_generator = grids.FastSquareGridGenerator(15000)
+    grids_gdf = grid_generator.generate_grid(sample_gdf)
+    chunks = list(grid_generator.generate_grid_iter(sample_gdf, chunk_size=100))
+    assert [len(chunk) for chunk in chunks] == [100, 100, 40]
+    grids_iter_gdf = pd.concat(chunks)
+    assert grids_iter_gdf.crs == sample_gdf.crs
+    assert set(zip(grids_iter_gdf.x, grids_iter_gdf.y)) == set(zip(grids_gdf.x, grids_gdf.y))
+
+@pytest.mark.parametrize("output", ["pandas", "polars", "arrow"])
+def test_write_grid_parquet(sample_gdf, tmp_path, output):
+    grid_generator = grids.FastSquareGridGenerator(15000)
+    path = tmp_path / "grid"
+    part_paths = grids.write_grid_parquet(grid_generator.generate_grid_iter(sample_gdf, chunk_size=100, output=output), path)
+    assert len(part_paths) == 3
+    if output == "pandas":
+        grids_gdf = gpd.read_parquet(path)
+        assert grids_gdf.crs == sample_gdf.crs
+    else:
+        grids_gdf = pl.read_parquet(path)
+        assert grids_gdf.columns == ["x", "y", "geometry"]
+    assert len(grids_gdf) == 240
+
+    tiles_path = tmp_path / f"tiles_{output}"
+    tile_generator = grids.FastBingTileGridGenerator(7)
+    tiles_gdf = tile_generator.generate_grid(sample_gdf)
+    grids.write_grid_parquet(tile_generator.generate_grid_iter(sample_gdf, chunk_size=10, output=output), tiles_path)
+    assert len(pl.read_parquet(tiles_path)) == len(tiles_gdf)
+
+    with pytest.raises(FileExistsError):
+        grids.write_grid_parquet(grid_generator.generate_grid_iter(sample_gdf), path)
+
 def test_h3_grid_generator(sample_gdf):
     grid_generator = grids.H3GridGenerator(5)
     grids_gdf = grid_generator.generate_grid(sample_gdf)
@@ -162,6 +450,29 @@ def test_h3_grid_generator_mutliple_polygons(sample_gdf):
     assert len(grids_gdf) == 292
 
 
+def test_h3_grid_generator_geometry(sample_gdf):
+    grids_gdf = grids.H3GridGenerator(5).generate_grid(sample_gdf)
+    # hexes are in lng, lat order, so the hex centers are in the AOI
+    assert grids_gdf.geometry.representative_point().within(sample_gdf.geometry.iloc[0].buffer(0.1)).all()
+
+
+@pytest.mark.parametrize("fill_mode,n_workers", [("polygons", 1), ("polygons", 2), ("union", 2)])
+def test_h3_grid_generator_fill_mode(sample_gdf, fill_mode, n_workers):
+    gdf2 = gpd.GeoDataFrame(
+        geometry=[Polygon([(1, 1), (4, 1), (4, 4)]), Polygon([(3, 3), (3, 4), (4, 3)])],
+        crs="EPSG:4326",
+    )
+    aoi_gdf = pd.concat([gdf2, sample_gdf], ignore_index=True)
+    grid_generator = grids.H3GridGenerator(5)
+    grids_gdf = grid_generator.generate_grid(aoi_gdf)
+    fill_grids_gdf = grid_generator.generate_grid(aoi_gdf, fill_mode=fill_mode, n_workers=n_workers)
+    assert list(fill_grids_gdf.hex_id) == list(grids_gdf.hex_id)
+    assert fill_grids_gdf.geometry.geom_equals_exact(grids_gdf.geometry, 0).all()
+
+    with pytest.raises(ValueError):
+        grid_generator.generate_grid(aoi_gdf, fill_mode="bbox")
+
+
 def test_h3_grid_generator_return_geometry_false(
     sample_gdf,
 ):
@@ -172,6 +483,25 @@ def test_h3_grid_generator_return_geometry_false(
     assert len(grids_gdf) == 262
 
 
+def test_h3_grid_generator_int_hex_ids(sample_gdf):
+    grids_gdf = grids.H3GridGenerator(5).generate_grid(sample_gdf)
+    int_grids_gdf = grids.H3GridGenerator(5, hex_id_type="int").generate_grid(sample_gdf)
+    assert int_grids_gdf.hex_id.dtype == np.int64
+    assert (grids.h3_ints_to_strs(int_grids_gdf.hex_id) == grids_gdf.hex_id).all()
+    assert (grids.h3_strs_to_ints(grids_gdf.hex_id) == int_grids_gdf.hex_id).all()
+    assert int_grids_gdf.geometry.geom_equals_exact(grids_gdf.geometry, 0).all()
+
+    with pytest.raises(ValueError):
+        grids.H3GridGenerator(5, hex_id_type="bytes")
+
+
+def test_h3_strs_to_ints():
+    assert list(grids.h3_strs_to_ints(["8928308280fffff", "8928308280FFFFF"])) == [617700169958293503] * 2
+    assert list(grids.h3_ints_to_strs([617700169958293503])) == ["8928308280fffff"]
+    with pytest.raises(ValueError):
+        grids.h3_strs_to_ints(["8928308280gffff"])
+
+
 def test_h3_grid_generator_get_hexes_for_polygon():
     grid_generator = grids.H3GridGenerator(
         5,
@@ -270,6 +600,71 @@ def test_bing_tile_grid_generator_join_return_geometry_false(
     assert isinstance(grids_gdf, pd.DataFrame)
     assert len(grids_gdf) == BING_TILE_N_TILES
 
+
+@pytest.mark.parametrize("method", ["generate_grid", "generate_grid_join"])
+def test_bing_tile_grid_generator_engines(sample_gdf, method):
+    gdf2 = gpd.GeoDataFrame(geometry=[Polygon([(3, 3), (3, 4), (4, 3)])], crs="EPSG:4326")
+    aoi_gdf = pd.concat([gdf2, sample_gdf])
+    grid_generator = grids.BingTileGridGenerator(10, add_xyz_cols=True)
+    numpy_gdf = getattr(grid_generator, method)(aoi_gdf, engine="numpy")
+    python_gdf = getattr(grid_generator, method)(aoi_gdf, engine="python")
+    pd.testing.assert_frame_equal(
+        numpy_gdf.drop(columns="geometry"), python_gdf.drop(columns="geometry")
+    )
+    assert numpy_gdf.geometry.geom_equals_exact(python_gdf.geometry, 0).all()
+    with pytest.raises(ValueError):
+        getattr(grid_generator, method)(aoi_gdf, engine="invalid")
+
+
+@pytest.mark.parametrize("n_workers,chunk_size", [(1, 100_000), (2, 100), (2, 10)])
+def test_get_parallel_intersects_process_backend(sample_gdf, n_workers, chunk_size):
+    grid_generator = grids.BingTileGridGenerator(10)
+    tiles_gdf = grid_generator.generate_grid_join(sample_gdf, filter=False).to_crs(
+        "epsg:4326"
+    )
+    aoi_gdf = sample_gdf.to_crs("epsg:4326")
+    thread_gdf = grids.get_parallel_intersects(tiles_gdf, aoi_gdf, progress=False)
+    process_gdf = grids.get_parallel_intersects(
+        tiles_gdf,
+        aoi_gdf,
+        n_workers=n_workers,
+        progress=False,
+        backend="process",
+        chunk_size=chunk_size,
+    )
+    pd.testing.assert_frame_equal(thread_gdf, process_gdf)
+    assert len(process_gdf) == BING_TILE_N_TILES
+
+
+def test_map_bounded():
+    n_submitted, n_finished, max_in_flight = [0], [0], [0]
+
+    def items():
+        for item in range(50):
+            max_in_flight[0] = max(max_in_flight[0], n_submitted[0] - n_finished[0])
+            n_submitted[0] += 1
+            yield item
+
+    def square(item):
+        time.sleep(0.001 * (item % 3))
+        n_finished[0] += 1
+        return item**2
+
+    with ThreadPoolExecutor(8) as ex:
+        results = grids._map_bounded(ex, square, items(), max_in_flight=3)
+    # the items are taken lazily, but the results are still in the order of the items
+    assert max_in_flight[0] <= 3
+    assert results == [item**2 for item in range(50)]
+
+
+def test_bing_tile_grid_generator_join_process_backend(sample_gdf):
+    grid_generator = grids.BingTileGridGenerator(10)
+    grids_gdf = grid_generator.generate_grid_join(
+        sample_gdf, n_workers=1, progress=False, backend="process"
+    )
+    assert isinstance(grids_gdf, gpd.GeoDataFrame)
+    assert len(grids_gdf) == BING_TILE_N_TILES
+
 # FastBingTileGridGenerator returns 6 more tiles than BingTileGridGenerator because it considered tiles exactly on the border
 FAST_BING_TILE_N_TILES = BING_TILE_N_TILES + 6
 FAST_BING_TILE_MULTIPOLY_N_TILES = BING_TILE_MULTIPOLY_N_TILES + 6
@@ -321,4 +716,177 @@ def test_fast_bing_tile_grid_generator_add_xyz_true(
     assert "y" in grids_gdf
     assert "z" in grids_gdf
     assert isinstance(grids_gdf, pd.DataFrame)
-    assert len(grids_gdf) == FAST_BING_TILE_N_TILES
\ No newline at end of file
+    assert len(grids_gdf) == FAST_BING_TILE_N_TILES
+
+
+def test_fast_bing_tile_grid_generator_spans(sample_gdf):
+    sample_gdf = sample_gdf.assign(name="L")
+    grid_generator = grids.FastBingTileGridGenerator(10, add_xyz_cols=True)
+    grids_gdf = grid_generator.generate_grid(sample_gdf, unique_id_col="name")
+    spans_df = grid_generator.generate_grid(sample_gdf, unique_id_col="name", output="spans")
+    assert list(spans_df.columns) == ["y", "x_start", "x_end", "name"]
+
+    tiles_df = polygon_fill.expand_spans(spans_df).to_pandas()
+    assert len(tiles_df) == FAST_BING_TILE_N_TILES
+    assert set(zip(tiles_df.x, tiles_df.y, tiles_df.name)) == set(zip(grids_gdf.x, grids_gdf.y, grids_gdf.name))
+
+def test_fast_bing_tile_grid_generator_iter(sample_gdf):
+    grid_generator = grids.FastBingTileGridGenerator(10)
+    grids_gdf = grid_generator.generate_grid(sample_gdf)
+    chunks = list(grid_generator.generate_grid_iter(sample_gdf, chunk_size=5))
+    assert all(len(chunk) <= 5 for chunk in chunks)
+    assert sorted(pd.concat(chunks).quadkey) == sorted(grids_gdf.quadkey)
+
+def test_h3_grid_generator_iter(sample_gdf):
+    grid_generator = grids.H3GridGenerator(resolution=6)
+    grids_gdf = grid_generator.generate_grid(sample_gdf)
+    chunks = list(grid_generator.generate_grid_iter(sample_gdf, chunk_size=100))
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert sorted(pd.concat(chunks).hex_id) == sorted(grids_gdf.hex_id)
+
+@pytest.mark.parametrize("quadkey_type", ["str", "int"])
+def test_fast_bing_tile_grid_generator_pyramid(sample_gdf, quadkey_type):
+    grid_generator = grids.FastBingTileGridGenerator(1, add_xyz_cols=True, quadkey_type=quadkey_type)
+    pyramid = grid_generator.generate_grid_pyramid(sample_gdf, [12, 8, 10])
+    assert list(pyramid) == [8, 10, 12]
+    assert "parent_quadkey" not in pyramid[8].columns
+
+    # the finest level is filled directly and the coarser levels are the parents of its tiles
+    finest_gdf = grids.FastBingTileGridGenerator(12, add_xyz_cols=True, quadkey_type=quadkey_type).generate_grid(sample_gdf)
+    assert set(pyramid[12].quadkey) == set(finest_gdf.quadkey)
+    for zoom_level in [8, 10]:
+        levels_up = 12 - zoom_level
+        assert set(zip(pyramid[zoom_level].x, pyramid[zoom_level].y)) == set(
+            zip(finest_gdf.x // 2**levels_up, finest_gdf.y // 2**levels_up)
+        )
+        assert (pyramid[zoom_level].z == zoom_level).all()
+    for zoom_level, parent_zoom_level in [(10, 8), (12, 10)]:
+        tiles_df = pyramid[zoom_level]
+        assert set(tiles_df.parent_quadkey) == set(pyramid[parent_zoom_level].quadkey)
+        if quadkey_type == "str":
+            assert (tiles_df.parent_quadkey == tiles_df.quadkey.str[:parent_zoom_level]).all()
+
+    spans_pyramid = grid_generator.generate_grid_pyramid(sample_gdf, [8, 12], output="spans")
+    assert len(polygon_fill.expand_spans(spans_pyramid[8])) == len(pyramid[8])
+    with pytest.raises(ValueError):
+        grid_generator.generate_grid_pyramid(sample_gdf, [])
+    with pytest.raises(NotImplementedError):
+        grid_generator.generate_grid_pyramid(sample_gdf, [12, 31])
+
+
+@pytest.mark.parametrize("xtiles,ytiles", [([3, 4, 4, 5], [7, 7, 8, 8]), ([0, 1023, 5], [1023, 0, 512])])
+def test_fast_bing_tile_xy_to_bbox(xtiles, ytiles):
+    grid_generator = grids.FastBingTileGridGenerator(10)
+    tiles_df = pl.DataFrame(
+        {"x": xtiles, "y": ytiles}, schema={"x": grid_generator.PIXEL_DTYPE, "y": grid_generator.PIXEL_DTYPE}
+    )
+    bboxes = grid_generator._xy_to_bbox(tiles_df, "x", "y")
+    # each tile computed on its own
+    for bbox, tile_df in zip(bboxes, tiles_df.iter_slices(1)):
+        assert bbox.equals_exact(grid_generator._xy_to_bbox(tile_df, "x", "y").iloc[0], 0)
+    tile_bboxes = grids.BingTileGridGenerator(10).tile_to_polygon
+    for bbox, x, y in zip(bboxes, xtiles, ytiles):
+        assert np.allclose(bbox.bounds, tile_bboxes(grids.morecantile.Tile(x, y, 10)).bounds)
+
+def test_fast_bing_tile_grid_generator_int_quadkeys(sample_gdf):
+    grids_gdf = grids.FastBingTileGridGenerator(10, add_xyz_cols=True).generate_grid(sample_gdf)
+    int_grids_gdf = grids.FastBingTileGridGenerator(10, add_xyz_cols=True, quadkey_type="int").generate_grid(
+        sample_gdf
+    )
+    assert int_grids_gdf.quadkey.dtype == np.uint64
+    assert (grids.ints_to_quadkeys(int_grids_gdf.quadkey) == grids_gdf.quadkey).all()
+    assert (grids.quadkeys_to_ints(grids_gdf.quadkey) == int_grids_gdf.quadkey).all()
+
+    x, y, z = grids.quadkey_int_to_xyz(int_grids_gdf.quadkey)
+    assert (x == grids_gdf.x).all()
+    assert (y == grids_gdf.y).all()
+    assert (z == 10).all()
+
+    parents = grids.quadkey_int_to_parent(int_grids_gdf.quadkey, 5)
+    assert (grids.ints_to_quadkeys(parents) == grids_gdf.quadkey.str[:5]).all()
+
+    with pytest.raises(ValueError):
+        grids.FastBingTileGridGenerator(10, quadkey_type="bytes")
+
+def test_adaptive_bing_tile_grid_generator():
+    aoi_gdf = gpd.GeoDataFrame(geometry=[box(120, 14, 121, 15)], crs="EPSG:4326")
+    rng = np.random.default_rng(0)
+    coords = np.concatenate([rng.normal([120.5, 14.5], 0.02, (2000, 2)), rng.uniform([120, 14], [121, 15], (200, 2))])
+    data_gdf = gpd.GeoDataFrame(geometry=gpd.points_from_xy(coords[:, 0], coords[:, 1]), crs="EPSG:4326")
+    grid_generator = grids.AdaptiveBingTileGridGenerator(8, 14, max_count=100, add_xyz_cols=True)
+    grids_gdf = grid_generator.generate_grid(aoi_gdf, data_gdf)
+    assert grids_gdf.z.between(8, 14).all()
+    assert grids_gdf.z.nunique() > 1
+    assert (grids_gdf.quadkey.str.len() == grids_gdf.z).all()
+
+    # the tiles cover the AOI without overlapping
+    assert np.isclose(shapely.area(shapely.intersection(grids_gdf.geometry.values, aoi_gdf.geometry[0])).sum(), 1)
+    assert not grids_gdf.sjoin(grids_gdf, predicate="overlaps").shape[0]
+
+    # only tiles at the maximum zoom level can have more than max_count points
+    counts = data_gdf.sjoin(grids_gdf, predicate="within").groupby("quadkey").size()
+    counts_z = grids_gdf.set_index("quadkey").z.loc[counts.index]
+    assert (counts[counts_z < 14] <= 100).all()
+    assert (counts[counts_z == 14] > 100).any()
+
+    int_grids_gdf = grids.AdaptiveBingTileGridGenerator(8, 14, max_count=100, quadkey_type="int").generate_grid(
+        aoi_gdf, data_gdf
+    )
+    assert sorted(grids.ints_to_quadkeys(int_grids_gdf.quadkey)) == sorted(grids_gdf.quadkey)
+    with pytest.raises(ValueError):
+        grids.AdaptiveBingTileGridGenerator(10, 8, max_count=100)
+
+
+def test_quadkey_ints():
+    quadkeys = ["", "0", "3", "1203", "0123012301230123012301"]
+    quadkey_ints = grids.quadkeys_to_ints(quadkeys)
+    assert list(quadkey_ints) == [int("1" + quadkey, 4) for quadkey in quadkeys]
+    assert list(grids.quadkey_int_zoom_level(quadkey_ints)) == [len(quadkey) for quadkey in quadkeys]
+    assert list(grids.ints_to_quadkeys(quadkey_ints)) == quadkeys
+
+    with pytest.raises(ValueError):
+        grids.quadkeys_to_ints(["0124"])
+    with pytest.raises(ValueError):
+        grids.quadkey_int_to_parent(quadkey_ints, 2)
+
+def test_fast_square_grid_generator_lines_and_points():
+    aoi_gdf = gpd.GeoDataFrame(
+        {"name": ["line", "points", "triangle"]},
+        geometry=[
+            LineString([(0.01, 0.02), (0.37, 0.21), (0.12, 0.48)]),
+            MultiPoint([(0.33, 0.44), (0.73, 0.05)]),
+            Polygon([(0.6, 0.6), (0.9, 0.6), (0.6, 0.8)]),
+        ],
+        crs="EPSG:3857",
+    )
+    grid_generator = grids.FastSquareGridGenerator(0.05, grid_projection="EPSG:3857")
+    grids_gdf = grid_generator.generate_grid(aoi_gdf, unique_id_col="name")
+
+    # every cell of a geometry intersects it, and no cell is repeated
+    tiles = set(zip(grids_gdf.x, grids_gdf.y, grids_gdf.name))
+    assert len(tiles) == len(grids_gdf)
+    geometries = aoi_gdf.set_index("name").geometry
+    assert shapely.intersects(grids_gdf.geometry.values, geometries.loc[grids_gdf.name].values).all()
+    assert len(grids_gdf[grids_gdf.name == "points"]) == 2
+
+    # the cells of the line and points match those of the slower generator
+    expected_gdf = grids.SquareGridGenerator(0.05, grid_projection="EPSG:3857", boundary=aoi_gdf.total_bounds).generate_grid(
+        aoi_gdf[aoi_gdf.name != "triangle"]
+    )
+    lines_and_points_gdf = grids_gdf[grids_gdf.name != "triangle"]
+    assert set(zip(lines_and_points_gdf.x, lines_and_points_gdf.y)) == set(zip(expected_gdf.x, expected_gdf.y))
+
+    spans_df = grid_generator.generate_grid(aoi_gdf, unique_id_col="name", output="spans")
+    tiles_df = polygon_fill.expand_spans(spans_df).to_pandas()
+    assert set(zip(tiles_df.x, tiles_df.y, tiles_df.name)) == tiles
+
+def test_fast_bing_tile_grid_generator_lines_and_points():
+    aoi_gdf = gpd.GeoDataFrame(
+        {"name": ["line", "point"]},
+        geometry=[LineString([(120, 14), (121.3, 14.6)]), Point(121, 14.2)],
+        crs="EPSG:4326",
+    )
+    grids_gdf = grids.FastBingTileGridGenerator(10).generate_grid(aoi_gdf, unique_id_col="name")
+    expected_gdf = grids.BingTileGridGenerator(10).generate_grid(aoi_gdf)
+    assert set(grids_gdf.quadkey) == set(expected_gdf.quadkey)
+    assert len(grids_gdf[grids_gdf.name == "point"]) == 1
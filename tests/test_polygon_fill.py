@@ -1,7 +1,8 @@
 import pandas as pd
+import polars as pl
 import geopandas as gpd
 import pytest
-from shapely.geometry import Polygon, MultiPolygon
+from shapely.geometry import LineString, MultiPoint, Point, Polygon, MultiPolygon
 from geowrangler.gridding_utils import polygon_fill
 
 @pytest.fixture
@@ -164,3 +165,196 @@ def test_fill_gdf(sample_gdf):
 
 
 
+def test_voxel_traversal_vectorized(sample_polygons):
+    for polygon_name, polygon_data in sample_polygons.items():
+        vertices = polygon_data["vertices"]
+        offset_vertices = vertices[1:] + vertices[:1]
+        x1, y1 = zip(*vertices)
+        x2, y2 = zip(*offset_vertices)
+
+        results = polygon_fill.voxel_traversal_2d_vectorized(x1, y1, x2, y2)
+        for i, (start_vertex, end_vertex) in enumerate(zip(vertices, offset_vertices)):
+            expected = polygon_fill.voxel_traversal_2d(start_vertex, end_vertex)
+            for key in ["line_pixels", "off_diagonal_pixels"]:
+                edge, x, y = results[key]
+                computed = set(zip(x[edge == i].tolist(), y[edge == i].tolist()))
+                assert computed == set(expected[key]), f"{polygon_name} edge {i} has different {key}"
+
+@pytest.mark.parametrize("unique_id_col", ["geom_name", None])
+def test_fill_gdf_engines_match(sample_gdf, unique_id_col):
+    vertices_df = polygon_fill.polygons_to_vertices(sample_gdf, unique_id_col)
+    vertices_df = vertices_df.cast({"x":polygon_fill.PIXEL_DTYPE, "y":polygon_fill.PIXEL_DTYPE})
+    numpy_results = polygon_fill.fast_polygon_fill(vertices_df, unique_id_col, engine="numpy")
+    python_results = polygon_fill.fast_polygon_fill(vertices_df, unique_id_col, engine="python")
+
+    for key in ["tiles_in_geom", "tiles_off_boundary"]:
+        numpy_tiles = numpy_results[key]
+        python_tiles = python_results[key]
+        assert numpy_tiles.schema == python_tiles.schema
+        assert numpy_tiles.sort(numpy_tiles.columns).equals(python_tiles.sort(python_tiles.columns))
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_fill_multiple_holes(engine):
+    polygon = Polygon(
+        [(0, 0), (40, 0), (40, 40), (0, 40)],
+        holes=[
+            [(4, 4), (12, 4), (12, 12), (4, 12)],
+            [(20, 8), (31, 9), (30, 17), (21, 16)],
+            [(8, 24), (18, 25), (13, 34)],
+        ],
+    )
+    gdf = gpd.GeoDataFrame({"geom_name": ["square with holes"]}, geometry=[polygon])
+    vertices_df = polygon_fill.polygons_to_vertices(gdf, "geom_name")
+    vertices_df = vertices_df.cast({"x":polygon_fill.PIXEL_DTYPE, "y":polygon_fill.PIXEL_DTYPE})
+    tiles_in_geom = polygon_fill.fast_polygon_fill(vertices_df, "geom_name", engine=engine)["tiles_in_geom"]
+    tiles_in_geom = set(tiles_in_geom.select(["x", "y"]).rows())
+
+    # every pixel with its centre in the polygon is filled, and nothing is filled inside the holes
+    pixels_in_polygon = {
+        (x, y) for x in range(40) for y in range(40) if polygon.contains(Point(x + 0.5, y + 0.5))
+    }
+    assert pixels_in_polygon <= tiles_in_geom
+    assert all(polygon.distance(Point(x + 0.5, y + 0.5)) <= 1 for x, y in tiles_in_geom)
+
+def test_fill_invalid_engine(sample_gdf):
+    vertices_df = polygon_fill.polygons_to_vertices(sample_gdf, "geom_name")
+    with pytest.raises(ValueError):
+        polygon_fill.fast_polygon_fill(vertices_df, "geom_name", engine="cython")
+
+def test_fill_gdf_spans(sample_gdf):
+    vertices_df = polygon_fill.polygons_to_vertices(sample_gdf, "geom_name")
+    vertices_df = vertices_df.cast({"x":polygon_fill.PIXEL_DTYPE, "y":polygon_fill.PIXEL_DTYPE})
+    tiles_in_geom = polygon_fill.fast_polygon_fill(vertices_df, "geom_name")["tiles_in_geom"]
+    spans_in_geom = polygon_fill.fast_polygon_fill(vertices_df, "geom_name", return_spans=True)["spans_in_geom"]
+    assert len(spans_in_geom) < len(tiles_in_geom)
+
+    expanded_tiles = polygon_fill.expand_spans(spans_in_geom)
+    assert expanded_tiles.sort(expanded_tiles.columns).equals(tiles_in_geom.sort(tiles_in_geom.columns))
+
+    chunks = list(polygon_fill.iter_expand_spans(spans_in_geom, chunk_size=50))
+    assert all(len(chunk) <= 50 for chunk in chunks)
+    assert pl.concat(chunks).equals(expanded_tiles)
+
+    # joining pixels against spans gives the same result as joining against the expanded tiles
+    points = pl.DataFrame({"x": [0, 5, 20, 20, 30], "y": [0, 5, 5, 20, 30]}, schema={"x": pl.Int32, "y": pl.Int32})
+    joined = polygon_fill.join_spans(points, spans_in_geom)
+    expected = points.join(tiles_in_geom, on=["x", "y"], how="inner")
+    assert joined.sort(joined.columns).equals(expected.sort(joined.columns).select(joined.columns))
+
+def test_spans_negative_coordinates():
+    spans_df = pl.DataFrame(
+        {"y": [0, 0, -1], "x_start": [-5, 3, -2], "x_end": [-1, 8, 2]},
+        schema={"y": pl.Int32, "x_start": pl.Int32, "x_end": pl.Int32},
+    )
+    points = pl.DataFrame(
+        {"x": [-6, -5, -1, 0, 3, 8, 9, -3, -2, 0, 2, 3], "y": [0, 0, 0, 0, 0, 0, 0, -1, -1, -1, -1, -1]},
+        schema={"x": pl.Int32, "y": pl.Int32},
+    )
+    joined = polygon_fill.join_spans(points, spans_df)
+    expected = points.join(polygon_fill.expand_spans(spans_df), on=["x", "y"], how="inner")
+    assert joined.sort(joined.columns).equals(expected.sort(joined.columns).select(joined.columns))
+
+    # spans crossing x = 0 are also used to remove the off boundary tiles in the interior
+    gdf = gpd.GeoDataFrame({"geom_name": ["quadrilateral"]}, geometry=[Polygon([(-10, -3), (6, -8), (9, 7), (-4, 9)])])
+    vertices_df = polygon_fill.polygons_to_vertices(gdf, "geom_name")
+    vertices_df = vertices_df.cast({"x":polygon_fill.PIXEL_DTYPE, "y":polygon_fill.PIXEL_DTYPE})
+    tile_results = polygon_fill.fast_polygon_fill(vertices_df, "geom_name")
+    span_results = polygon_fill.fast_polygon_fill(vertices_df, "geom_name", return_spans=True)
+
+    tiles_in_geom = tile_results["tiles_in_geom"]
+    expanded_tiles = polygon_fill.expand_spans(span_results["spans_in_geom"])
+    assert expanded_tiles.sort(expanded_tiles.columns).equals(tiles_in_geom.sort(expanded_tiles.columns).select(expanded_tiles.columns))
+    tiles_off_boundary = tile_results["tiles_off_boundary"]
+    assert span_results["tiles_off_boundary"].sort(tiles_off_boundary.columns).equals(tiles_off_boundary.sort(tiles_off_boundary.columns))
+
+def test_centroid_fill():
+    gdf = gpd.GeoDataFrame(
+        {"geom_name": ["rectangle", "square with hole"]},
+        geometry=[
+            Polygon([(0.2, 0.2), (3.7, 0.2), (3.7, 2.4), (0.2, 2.4)]),
+            Polygon([(10, 10), (15, 10), (15, 15), (10, 15)], holes=[[(12, 12), (13, 12), (13, 13), (12, 13)]]),
+        ],
+    )
+    vertices_df = polygon_fill.polygons_to_vertices(gdf, "geom_name")
+    pixels = polygon_fill.centroid_polygon_fill(vertices_df, "geom_name")
+    n_pixels = dict(pixels.group_by("geom_name").len().rows())
+    # centres at 0.5 to 3.5 along x and 0.5 to 1.5 along y
+    assert n_pixels == {"rectangle": 8, "square with hole": 24}
+    assert (12, 12, "square with hole") not in set(pixels.rows())
+
+    spans = polygon_fill.centroid_polygon_fill(vertices_df, "geom_name", return_spans=True)
+    expanded_pixels = polygon_fill.expand_spans(spans)
+    assert expanded_pixels.sort(expanded_pixels.columns).equals(pixels.sort(pixels.columns))
+
+def test_centroid_fill_multiple_holes():
+    polygon = Polygon(
+        [(0, 0), (40, 0), (40, 40), (0, 40)],
+        holes=[
+            [(4, 4), (12, 4), (12, 12), (4, 12)],
+            [(20.3, 8.2), (30.6, 8.2), (30.6, 16.7), (20.3, 16.7)],
+            [(8.6, 24.2), (18.2, 25.1), (13.4, 33.8)],
+        ],
+    )
+    gdf = gpd.GeoDataFrame({"geom_name": ["square with holes"]}, geometry=[polygon])
+    vertices_df = polygon_fill.polygons_to_vertices(gdf)
+    pixels = polygon_fill.centroid_polygon_fill(vertices_df)
+    pixels = set(pixels.select(["x", "y"]).rows())
+
+    expected = {
+        (x, y) for x in range(40) for y in range(40) if polygon.contains(Point(x + 0.5, y + 0.5))
+    }
+    assert pixels == expected
+
+def test_boundary_pixels():
+    gdf = gpd.GeoDataFrame(
+        {"geom_name": ["triangle", "square"]},
+        geometry=[
+            Polygon([(0.5, 0.5), (4.5, 0.5), (0.5, 2.5)]),
+            Polygon([(10, 10), (12, 10), (12, 12), (10, 12)]),
+        ],
+    )
+    vertices_df = polygon_fill.polygons_to_vertices(gdf, "geom_name")
+    pixels = polygon_fill.boundary_pixels(vertices_df, "geom_name")
+    pixels = set(pixels.select(["x", "y", "geom_name"]).rows())
+
+    # every pixel that is only partly covered by a polygon is a boundary pixel
+    for polygon, geom_name in zip(gdf.geometry, gdf.geom_name):
+        minx, miny, maxx, maxy = (int(bound) for bound in polygon.bounds)
+        for x in range(minx - 1, maxx + 2):
+            for y in range(miny - 1, maxy + 2):
+                covered_area = Polygon([(x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1)]).intersection(polygon).area
+                if 0 < covered_area < 1:
+                    assert (x, y, geom_name) in pixels
+    # the edges of the triangle cross its interior pixels, while the square is only bounded by its edges
+    assert (1, 1, "triangle") in pixels
+    assert (10, 10, "square") in pixels
+
+def test_line_pixels():
+    gdf = gpd.GeoDataFrame(
+        {"geom_name": ["diagonal", "bend"]},
+        geometry=[
+            LineString([(0.5, 0.5), (3.5, 2.5)]),
+            LineString([(10.5, 10.5), (12.5, 10.5), (12.5, 12.5)]),
+        ],
+    )
+    vertices_df = polygon_fill.lines_to_vertices(gdf, "geom_name")
+    pixels = set(polygon_fill.line_pixels(vertices_df, "geom_name").select(["x", "y", "geom_name"]).rows())
+
+    # every pixel crossed by a line is returned, and the open line does not join its ends
+    for line, geom_name in zip(gdf.geometry, gdf.geom_name):
+        minx, miny, maxx, maxy = (int(bound) for bound in line.bounds)
+        for x in range(minx - 1, maxx + 2):
+            for y in range(miny - 1, maxy + 2):
+                pixel = Polygon([(x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1)])
+                if pixel.intersection(line).length > 0:
+                    assert (x, y, geom_name) in pixels
+    assert (11, 11, "bend") not in pixels
+
+def test_point_pixels():
+    gdf = gpd.GeoDataFrame(
+        {"geom_name": ["points"]},
+        geometry=[MultiPoint([(0.5, 0.5), (3.2, 2.7), (3.9, 2.1)])],
+    )
+    vertices_df = polygon_fill.points_to_vertices(gdf, "geom_name")
+    pixels = polygon_fill.point_pixels(vertices_df, "geom_name")
+    assert sorted(pixels.select(["x", "y"]).rows()) == [(0, 0), (3, 2)]
@@ -7,17 +7,20 @@ from shapely.geometry import Point, Polygon
 import geowrangler.grids as gr
 from geowrangler.vector_zonal_stats import (
     GEO_INDEX_NAME,
+    ZonalJoinPlan,
     _aggregate_stats,
     _build_agg_args,
     _check_agg,
     _expand_aggs,
     _fix_agg,
     _prep_aoi,
+    _spatial_blocks,
     _validate_aggs,
     _validate_aoi,
     compute_quadkey,
     create_bingtile_zonal_stats,
     create_zonal_stats,
+    load_zonal_join_plan,
     validate_aoi_quadkey,
     validate_data_quadkey,
 )
@@ -602,6 +605,192 @@ def test_create_zonal_stats_with_aoi_index_columns(simple_aoi, simple_data):
     assert results["index"].equals(simple_aoi.col1)
 
 
+@pytest.mark.parametrize("engine", ["numpy", "polars"])
+@pytest.mark.parametrize("overlap_method", ["intersects", "contains"])
+def test_create_zonal_stats_engines(simple_aoi, simple_data, overlap_method, engine):
+    simple_data["col2"] = simple_data.col1 / 4
+    simple_data.loc[[0, 3], "col2"] = np.nan
+    simple_aoi.index = [5, 6, 7]
+
+    def aggregations():
+        return [
+            {"func": "count"},
+            {"column": "col1", "func": ["sum", "mean", "min", "max", "std"]},
+            {
+                "column": "col2",
+                "func": ["count", "sum", "mean", "min", "max", "std"],
+                "fillna": [True, True, False, False, False, False],
+            },
+        ]
+
+    expected = create_zonal_stats(
+        simple_aoi, simple_data, aggregations(), overlap_method=overlap_method
+    )
+    results = create_zonal_stats(
+        simple_aoi,
+        simple_data,
+        aggregations(),
+        overlap_method=overlap_method,
+        engine=engine,
+    )
+    pd.testing.assert_frame_equal(results, expected)
+
+    # aois without any data
+    expected = create_zonal_stats(
+        simple_aoi.iloc[2:], simple_data.iloc[:1], aggregations()
+    )
+    results = create_zonal_stats(
+        simple_aoi.iloc[2:], simple_data.iloc[:1], aggregations(), engine=engine
+    )
+    pd.testing.assert_frame_equal(results, expected)
+
+
+def test_create_zonal_stats_engine_unsupported_func(simple_aoi, simple_data):
+    with pytest.raises(ValueError, match="not supported by the numpy engine"):
+        create_zonal_stats(
+            simple_aoi,
+            simple_data,
+            [{"column": "col1", "func": "median"}],
+            engine="numpy",
+        )
+    with pytest.raises(ValueError, match="not supported by the polars engine"):
+        create_zonal_stats(
+            simple_aoi,
+            simple_data,
+            [{"column": "col1", "func": "prod"}],
+            engine="polars",
+        )
+    with pytest.raises(ValueError, match="engine is not supported"):
+        create_zonal_stats(simple_aoi, simple_data, [{"func": "count"}], engine="spark")
+
+
+@pytest.mark.parametrize("overlap_method", ["intersects", "contains"])
+def test_create_zonal_stats_batched_data(
+    simple_aoi, simple_data, overlap_method, tmp_path
+):
+    simple_data["col2"] = simple_data.col1 / 4
+    simple_data.loc[[0, 3], "col2"] = np.nan
+
+    def aggregations():
+        return [
+            {"func": "count"},
+            {"column": "col1", "func": ["sum", "mean", "min", "max", "std"]},
+            {
+                "column": "col2",
+                "func": ["count", "mean", "std"],
+                "fillna": [True, False, False],
+            },
+        ]
+
+    expected = create_zonal_stats(
+        simple_aoi, simple_data, aggregations(), overlap_method=overlap_method
+    )
+
+    # batches split the data of each aoi, and may be in a different crs
+    batches = [
+        simple_data.iloc[:5],
+        simple_data.iloc[5:9].to_crs("EPSG:3857"),
+        simple_data.iloc[9:].to_arrow(),
+    ]
+    results = create_zonal_stats(
+        simple_aoi, iter(batches), aggregations(), overlap_method=overlap_method
+    )
+    pd.testing.assert_frame_equal(results, expected)
+
+    data_file = tmp_path / "data.gpkg"
+    simple_data.to_file(data_file)
+    results = create_zonal_stats(
+        simple_aoi,
+        data_file,
+        aggregations(),
+        overlap_method=overlap_method,
+        batch_size=5,
+    )
+    pd.testing.assert_frame_equal(results, expected, check_dtype=False)
+
+
+def test_create_zonal_stats_batched_data_exceptions(simple_aoi, simple_data):
+    with pytest.raises(ValueError, match="does not contain any batches"):
+        create_zonal_stats(simple_aoi, iter([]), [{"func": "count"}])
+    with pytest.raises(ValueError, match="not supported for batched data"):
+        create_zonal_stats(
+            simple_aoi, [simple_data], [{"func": "count"}], overlap_method="dwithin"
+        )
+    with pytest.raises(ValueError, match="not supported by the numpy engine"):
+        create_zonal_stats(
+            simple_aoi, [simple_data], [{"column": "col1", "func": "median"}]
+        )
+
+
+@pytest.mark.parametrize("engine", ["pandas", "numpy"])
+def test_create_zonal_stats_n_workers(simple_aoi, simple_data, engine):
+    simple_aoi.index = [7, 5, 6]
+    aggregations = [
+        {"func": "count", "fillna": True},
+        {"column": "col1", "func": ["sum", "mean", "max"]},
+    ]
+    expected = create_zonal_stats(simple_aoi, simple_data, aggregations, engine=engine)
+    results = create_zonal_stats(
+        simple_aoi, simple_data, aggregations, engine=engine, n_workers=2
+    )
+    pd.testing.assert_frame_equal(results, expected)
+
+    with pytest.raises(ValueError, match="not supported for batched data"):
+        create_zonal_stats(simple_aoi, [simple_data], aggregations, n_workers=2)
+
+
+def test_spatial_blocks(simple_aoi):
+    simple_aoi.loc[1, "geometry"] = None
+    blocks = _spatial_blocks(simple_aoi, 2)
+    assert len(blocks) == 2
+    assert sorted(np.concatenate(blocks)) == [0, 1, 2]
+
+
+def test_zonal_join_plan(simple_aoi, simple_data, tmp_path):
+    simple_data = simple_data.to_crs("EPSG:3857")
+
+    def aggregations():
+        return [
+            {"func": "count", "fillna": True},
+            {"column": "col1", "func": ["sum", "mean", "min", "std"]},
+        ]
+
+    plan = ZonalJoinPlan(simple_aoi, simple_data)
+    for mask in [None, simple_data.col1 > 6, np.zeros(len(simple_data), dtype=bool)]:
+        expected = create_zonal_stats(
+            simple_aoi,
+            simple_data if mask is None else simple_data[mask],
+            aggregations(),
+        )
+        results = plan.aggregate(aggregations(), mask=mask)
+        pd.testing.assert_frame_equal(results, expected)
+
+    plan_file = tmp_path / "plan.npz"
+    plan.save(plan_file)
+    loaded_plan = load_zonal_join_plan(plan_file, simple_aoi, simple_data)
+    np.testing.assert_array_equal(loaded_plan.aoi_idx, plan.aoi_idx)
+    np.testing.assert_array_equal(loaded_plan.data_idx, plan.data_idx)
+    pd.testing.assert_frame_equal(
+        loaded_plan.aggregate(aggregations()), plan.aggregate(aggregations())
+    )
+
+    with pytest.raises(ValueError, match="saved plan is for"):
+        load_zonal_join_plan(plan_file, simple_aoi, simple_data.iloc[:5])
+    # same number of rows but a different index, crs or bounds
+    with pytest.raises(ValueError, match="different aoi"):
+        load_zonal_join_plan(
+            plan_file, simple_aoi.set_index(simple_aoi.index + 1), simple_data
+        )
+    with pytest.raises(ValueError, match="different data"):
+        load_zonal_join_plan(plan_file, simple_aoi, simple_data.to_crs("EPSG:4326"))
+    with pytest.raises(ValueError, match="different data"):
+        load_zonal_join_plan(
+            plan_file, simple_aoi, simple_data.translate(1, 0).to_frame("geometry")
+        )
+    with pytest.raises(ValueError, match="mask has"):
+        plan.aggregate(aggregations(), mask=[True])
+
+
 def test_validate_aoi_quadkey(simple_aoi_bingtiles):
     """valid aoi with quadkey does not throw exception"""
     validate_aoi_quadkey(simple_aoi_bingtiles, "quadkey")
@@ -761,6 +950,53 @@ def test_create_bingtile_zonal_stats(simple_aoi_bingtiles, simple_data):
     ]
 
 
+def test_create_bingtile_zonal_stats_variable_zoom(simple_aoi, simple_data):
+    adaptive_generator = gr.AdaptiveBingTileGridGenerator(
+        AOI_ZOOM_LEVEL, AOI_ZOOM_LEVEL + 3, max_count=2
+    )
+    adaptive_aoi_bingtiles = adaptive_generator.generate_grid(simple_aoi, simple_data)
+    simple_data_quadkey = compute_quadkey(simple_data, DATA_ZOOM_LEVEL)
+    bingtile_results = create_bingtile_zonal_stats(
+        adaptive_aoi_bingtiles,
+        simple_data_quadkey,
+        aggregations=[dict(func="count", fillna=True)],
+        variable_zoom=True,
+    )
+    assert len(bingtile_results) == len(adaptive_aoi_bingtiles)
+    assert adaptive_aoi_bingtiles.quadkey.str.len().nunique() > 1
+    # the tiles don't overlap, so the counts are the same as a spatial join
+    expected_counts = (
+        gpd.sjoin(simple_data, adaptive_aoi_bingtiles, predicate="within")
+        .groupby("quadkey")
+        .size()
+    )
+    counts = bingtile_results.set_index("quadkey").index_count
+    assert (counts.loc[expected_counts.index] == expected_counts).all()
+    assert counts.sum() == expected_counts.sum()
+
+    with pytest.raises(ValueError):
+        create_bingtile_zonal_stats(
+            adaptive_aoi_bingtiles,
+            simple_data_quadkey,
+            aggregations=[dict(func="count", fillna=True)],
+        )
+
+
+def test_validate_aoi_quadkey_variable_zoom():
+    validate_aoi_quadkey(
+        pd.DataFrame({"quadkey": ["120", "121", "1220", "1223"]}),
+        "quadkey",
+        variable_zoom=True,
+    )
+    with pytest.raises(ValueError) as exc_info:
+        validate_aoi_quadkey(
+            pd.DataFrame({"quadkey": ["120", "1201"]}), "quadkey", variable_zoom=True
+        )
+    assert (
+        exc_info.value.args[0] == "aoi quadkeys should not contain other aoi quadkeys"
+    )
+
+
 def test_create_bingtile_zonal_stats2(simple_aoi, simple_data):
     """zonal stats at higher zoom level misses areas not in same zoom level"""
     bgtile_generator = gr.BingTileGridGenerator(AOI_ZOOM_LEVEL + 1)